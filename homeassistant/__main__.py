@@ -101,6 +101,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Record how long importing each module and integration takes",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -206,6 +211,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        profile_imports=args.profile_imports,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
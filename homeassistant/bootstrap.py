@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from datetime import datetime, timedelta
+from graphlib import CycleError, TopologicalSorter
 import logging
 import logging.handlers
 import os
@@ -39,10 +40,11 @@ from .setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
-from .util import dt as dt_util
+from .util import dt as dt_util, import_profiler
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
 
@@ -52,6 +54,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+IMPORT_PROFILE_FILENAME = "import_profile.txt"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -108,6 +111,9 @@ async def async_setup_hass(
     runtime_config: RuntimeConfig,
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
+    if runtime_config.profile_imports:
+        import_profiler.start_import_profiler()
+
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
 
@@ -132,6 +138,9 @@ async def async_setup_hass(
 
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
+    # Resolve integrations from the index of the previous run
+    await loader.async_load_integration_index(hass)
+
     config_dict = None
     basic_setup_success = False
 
@@ -198,9 +207,23 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    if runtime_config.profile_imports and (
+        profiler := import_profiler.get_import_profiler()
+    ):
+        await hass.async_add_executor_job(
+            _write_import_profile, profiler, hass.config.path(IMPORT_PROFILE_FILENAME)
+        )
+
     return hass
 
 
+def _write_import_profile(profiler: import_profiler.ImportProfiler, path: str) -> None:
+    """Write the import times recorded during startup to a file."""
+    with open(path, "w", encoding="utf8") as report:
+        report.write(profiler.report())
+    _LOGGER.info("Import times recorded during startup written to %s", path)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # pylint: disable=import-outside-toplevel
@@ -247,6 +270,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_bytecode_cache(hass),
     )
 
 
@@ -504,28 +528,124 @@ async def _async_watch_pending_setups(hass: core.HomeAssistant) -> None:
         _LOGGER.debug("Running timeout Zones: %s", hass.timeout.zones)
 
 
-async def async_setup_multi_components(
-    hass: core.HomeAssistant,
-    domains: set[str],
-    config: dict[str, Any],
-) -> None:
-    """Set up multiple domains. Log on failure."""
-    futures = {
-        domain: hass.async_create_task(
-            async_setup_component(hass, domain, config), f"setup component {domain}"
+class _SetupPlan:
+    """Plan to import and set up integrations as soon as possible.
+
+    The packages of integrations that need no requirements are imported in
+    the executor while the earlier stages are set up, and every integration
+    is set up as soon as its dependencies are set up.
+    """
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        domains: set[str],
+        integrations: dict[str, loader.Integration],
+    ) -> None:
+        """Initialize the plan."""
+        self.hass = hass
+        self.integrations = integrations
+        # The planned domains each domain has to wait for
+        self.dependencies: dict[str, set[str]] = {
+            domain: set(itg.dependencies) & domains
+            if (itg := integrations.get(domain))
+            else set()
+            for domain in domains
+        }
+        self.timeline: dict[str, dict[str, datetime]] = hass.data.setdefault(
+            DATA_SETUP_TIMELINE, {}
         )
-        for domain in domains
-    }
-    results = await asyncio.gather(*futures.values(), return_exceptions=True)
-    for idx, domain in enumerate(futures):
-        result = results[idx]
-        if isinstance(result, BaseException):
-            _LOGGER.error(
-                "Error setting up integration %s - received exception",
-                domain,
-                exc_info=(type(result), result, result.__traceback__),
+        self._imports: dict[str, asyncio.Task[None]] = {}
+        self._setups: dict[str, asyncio.Task[bool]] = {}
+
+    @core.callback
+    def _async_record(self, domain: str, phase: str) -> None:
+        """Record when a phase of setting up a domain happened."""
+        self.timeline.setdefault(domain, {})[phase] = dt_util.utcnow()
+
+    def _ordered(self, domains: set[str]) -> list[str]:
+        """Return domains ordered so dependencies come first."""
+        try:
+            order = TopologicalSorter(self.dependencies).static_order()
+            return [domain for domain in order if domain in domains]
+        except CycleError:
+            return list(domains)
+
+    def _can_import(self, domain: str) -> bool:
+        """Return if an integration can be imported before it is set up.
+
+        Importing integrations that need requirements before they are
+        installed could fail or load old versions of the requirements.
+        """
+        if (itg := self.integrations.get(domain)) is None or not itg.is_built_in:
+            return False
+        return not any(
+            (dep_itg := self.integrations.get(dep)) is None or dep_itg.requirements
+            for dep in (domain, *itg.all_dependencies)
+        )
+
+    @core.callback
+    def async_start_imports(self) -> None:
+        """Start importing the integrations in the executor."""
+        semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+        for domain in self._ordered(set(self.dependencies)):
+            if domain in self.hass.config.components or not self._can_import(domain):
+                continue
+            self._imports[domain] = self.hass.async_create_task(
+                self._async_import(self.integrations[domain], semaphore),
+                f"import component {domain}",
             )
 
+    async def _async_import(
+        self, integration: loader.Integration, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Import an integration in the executor."""
+        async with semaphore:
+            self._async_record(integration.domain, "import_started")
+            # Import errors are reported when setting up the integration
+            with contextlib.suppress(ImportError):
+                await self.hass.async_add_executor_job(integration.get_component)
+            self._async_record(integration.domain, "import_done")
+
+    async def async_setup(self, domains: set[str], config: dict[str, Any]) -> None:
+        """Set up domains as soon as their dependencies are set up."""
+        futures: dict[str, asyncio.Task[bool]] = {}
+        for domain in self._ordered(domains):
+            # A domain that is already planned is only waited for
+            if (future := self._setups.get(domain)) is None:
+                future = self._setups[domain] = self.hass.async_create_task(
+                    self._async_setup(domain, config), f"setup component {domain}"
+                )
+            futures[domain] = future
+        results = await asyncio.gather(*futures.values(), return_exceptions=True)
+        for idx, domain in enumerate(futures):
+            result = results[idx]
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Error setting up integration %s - received exception",
+                    domain,
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+
+    async def _async_setup(self, domain: str, config: dict[str, Any]) -> bool:
+        """Set up a domain once its dependencies and import are done."""
+        self._async_record(domain, "queued")
+        if waits := [
+            self._setups[dep]
+            for dep in self.dependencies[domain]
+            if dep in self._setups
+        ]:
+            # Failed dependencies are reported when setting up the domain
+            async with self.hass.timeout.async_freeze(domain):
+                await asyncio.wait(waits)
+        if (import_task := self._imports.get(domain)) is not None:
+            await import_task
+        self._async_record(domain, "setup_started")
+        try:
+            return await async_setup_component(self.hass, domain, config)
+        finally:
+            self._async_record(domain, "setup_done")
+
 
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
@@ -574,6 +694,9 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    plan = _SetupPlan(hass, domains_to_setup, integration_cache)
+    plan.async_start_imports()
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -581,22 +704,22 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        await plan.async_setup(logging_domains, config)
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        await plan.async_setup(frontend_domains, config)
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        await plan.async_setup(recorder_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        await plan.async_setup(debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -639,7 +762,7 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await plan.async_setup(stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -652,7 +775,7 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await plan.async_setup(stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
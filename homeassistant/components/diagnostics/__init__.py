@@ -1,7 +1,7 @@
 """The Diagnostics integration."""
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine, Mapping
+from collections.abc import Callable, Coroutine, Iterable, Mapping
 from dataclasses import dataclass, field
 from http import HTTPStatus
 import json
@@ -13,7 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import http, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import integration_platform
 from homeassistant.helpers.device_registry import DeviceEntry, async_get
 from homeassistant.helpers.json import (
@@ -33,17 +33,82 @@ __all__ = ["REDACTED", "async_redact_data"]
 _LOGGER = logging.getLogger(__name__)
 
 
+_HandlerType = Callable[..., Coroutine[Any, Any, Mapping[str, Any]]]
+
+
 @dataclass
 class DiagnosticsPlatformData:
-    """Diagnostic platform data."""
+    """Diagnostic platform data.
+
+    The platform is imported when the handlers are first looked up. Use
+    _async_load_platforms to import them in the executor first.
+    """
 
-    config_entry_diagnostics: Callable[
-        [HomeAssistant, ConfigEntry], Coroutine[Any, Any, Mapping[str, Any]]
-    ] | None
-    device_diagnostics: Callable[
-        [HomeAssistant, ConfigEntry, DeviceEntry],
-        Coroutine[Any, Any, Mapping[str, Any]],
-    ] | None
+    platform: DiagnosticsProtocol
+    _handlers: dict[str, _HandlerType | None] | None = field(default=None, repr=False)
+
+    @property
+    def loaded(self) -> bool:
+        """Return if the handlers of the platform were looked up."""
+        return self._handlers is not None
+
+    def load(self) -> None:
+        """Import the platform and look up its handlers."""
+        try:
+            self._handlers = {
+                name: getattr(self.platform, name, None)
+                for name in (
+                    "async_get_config_entry_diagnostics",
+                    "async_get_device_diagnostics",
+                )
+            }
+        except ImportError:
+            _LOGGER.exception("Error importing diagnostics platform %s", self.platform)
+            self._handlers = {}
+
+    @property
+    def config_entry_diagnostics(
+        self,
+    ) -> (
+        Callable[[HomeAssistant, ConfigEntry], Coroutine[Any, Any, Mapping[str, Any]]]
+        | None
+    ):
+        """Return the config entry diagnostics handler."""
+        return self._get_handler("async_get_config_entry_diagnostics")
+
+    @property
+    def device_diagnostics(
+        self,
+    ) -> (
+        Callable[
+            [HomeAssistant, ConfigEntry, DeviceEntry],
+            Coroutine[Any, Any, Mapping[str, Any]],
+        ]
+        | None
+    ):
+        """Return the device diagnostics handler."""
+        return self._get_handler("async_get_device_diagnostics")
+
+    def _get_handler(self, name: str) -> _HandlerType | None:
+        """Return a handler of the platform or None if it is not available."""
+        if self._handlers is None:
+            self.load()
+            assert self._handlers is not None
+        return self._handlers.get(name)
+
+
+def _load_platforms(platforms: list[DiagnosticsPlatformData]) -> None:
+    """Import diagnostics platforms and look up their handlers."""
+    for info in platforms:
+        info.load()
+
+
+async def _async_load_platforms(
+    hass: HomeAssistant, platforms: Iterable[DiagnosticsPlatformData]
+) -> None:
+    """Import the diagnostics platforms that are not loaded in the executor."""
+    if to_load := [info for info in platforms if not info.loaded]:
+        await hass.async_add_executor_job(_load_platforms, to_load)
 
 
 @dataclass
@@ -58,7 +123,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = DiagnosticsData()
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
+        hass, DOMAIN, _register_diagnostics_platform, lazy=True
     )
 
     websocket_api.async_register_command(hass, handle_info)
@@ -87,20 +152,18 @@ async def _register_diagnostics_platform(
 ) -> None:
     """Register a diagnostics platform."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-    diagnostics_data.platforms[integration_domain] = DiagnosticsPlatformData(
-        getattr(platform, "async_get_config_entry_diagnostics", None),
-        getattr(platform, "async_get_device_diagnostics", None),
-    )
+    diagnostics_data.platforms[integration_domain] = DiagnosticsPlatformData(platform)
 
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    await _async_load_platforms(hass, diagnostics_data.platforms.values())
     result = [
         {
             "domain": domain,
@@ -121,8 +184,8 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
@@ -135,6 +198,8 @@ def handle_get(
         )
         return
 
+    await _async_load_platforms(hass, (info,))
+
     connection.send_result(
         msg["id"],
         {
@@ -237,6 +302,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        await _async_load_platforms(hass, (info,))
         filename = f"{config_entry.domain}-{config_entry.entry_id}"
 
         if not device_diagnostics:
@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Keys of the attribute deltas in the columnar history format
+COLUMNAR_ATTRIBUTE_ADDITIONS = "+"
+COLUMNAR_ATTRIBUTE_REMOVALS = "-"
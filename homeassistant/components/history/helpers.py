@@ -1,11 +1,20 @@
 """Helpers for the history integration."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, MutableMapping
 from datetime import datetime as dt
+from typing import Any
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant
 
+from .const import COLUMNAR_ATTRIBUTE_ADDITIONS, COLUMNAR_ATTRIBUTE_REMOVALS
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -21,3 +30,61 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def _attributes_delta(
+    old: Mapping[str, Any] | None, new: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Return the attribute changes from old to new."""
+    if old is None:
+        return {COLUMNAR_ATTRIBUTE_ADDITIONS: new}
+    delta: dict[str, Any] = {}
+    if additions := {
+        key: value for key, value in new.items() if key not in old or old[key] != value
+    }:
+        delta[COLUMNAR_ATTRIBUTE_ADDITIONS] = additions
+    if removals := [key for key in old if key not in new]:
+        delta[COLUMNAR_ATTRIBUTE_REMOVALS] = removals
+    return delta
+
+
+def compressed_states_to_columns(
+    states: MutableMapping[str, list[dict[str, Any]]]
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert compressed history rows to parallel arrays per entity.
+
+    Every entity gets a list of states and a list of last_updated
+    timestamps of the same length. last_changed is only sent as
+    [index, timestamp] pairs for rows where it differs from last_updated
+    and attributes are sent as [index, delta] pairs for the rows where
+    they changed, the first delta containing all attributes.
+    """
+    columns: dict[str, dict[str, list[Any]]] = {}
+    for entity_id, rows in states.items():
+        state_column: list[Any] = []
+        last_updated_column: list[float] = []
+        last_changed_column: list[list[Any]] = []
+        attributes_column: list[list[Any]] = []
+        prev_attributes: Mapping[str, Any] | None = None
+        for idx, row in enumerate(rows):
+            state_column.append(row[COMPRESSED_STATE_STATE])
+            last_updated_column.append(row[COMPRESSED_STATE_LAST_UPDATED])
+            if (last_changed := row.get(COMPRESSED_STATE_LAST_CHANGED)) is not None:
+                last_changed_column.append([idx, last_changed])
+            if (
+                attributes := row.get(COMPRESSED_STATE_ATTRIBUTES)
+            ) is None or attributes is prev_attributes:
+                continue
+            if delta := _attributes_delta(prev_attributes, attributes):
+                attributes_column.append([idx, delta])
+            prev_attributes = attributes
+        entity_columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: state_column,
+            COMPRESSED_STATE_LAST_UPDATED: last_updated_column,
+        }
+        if last_changed_column:
+            entity_columns[COMPRESSED_STATE_LAST_CHANGED] = last_changed_column
+        if attributes_column:
+            entity_columns[COMPRESSED_STATE_ATTRIBUTES] = attributes_column
+        columns[entity_id] = entity_columns
+    return columns
@@ -37,7 +37,7 @@ from homeassistant.helpers.json import JSON_DUMP
 import homeassistant.util.dt as dt_util
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after
+from .helpers import compressed_states_to_columns, entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,25 +70,31 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if columnar:
+        return JSON_DUMP(
+            messages.result_message(
+                msg_id,
+                compressed_states_to_columns(
+                    cast(MutableMapping[str, list[dict[str, Any]]], states)
+                ),
+            )
+        )
+    return JSON_DUMP(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -101,6 +107,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -164,12 +171,13 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar"],
         )
     )
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: MutableMapping[str, Any],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -197,7 +205,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: MutableMapping[str, Any],
 ) -> str:
     """Generate a websocket response."""
     return JSON_DUMP(
@@ -218,6 +226,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    columnar: bool,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
     states = cast(
@@ -254,10 +263,13 @@ def _generate_historical_response(
     else:
         last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
 
+    payload: MutableMapping[str, Any] = states
+    if columnar:
+        payload = compressed_states_to_columns(states)
     return (
         last_time_ts,
         last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(msg_id, start_time, last_time_dt, payload),
     )
 
 
@@ -273,6 +285,7 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    columnar: bool = False,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
@@ -288,6 +301,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        columnar,
     )
     if payload:
         connection.send_message(payload)
@@ -329,6 +343,7 @@ async def _async_events_consumer(
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     no_attributes: bool,
+    columnar: bool = False,
 ) -> None:
     """Stream events from the queue."""
     while True:
@@ -350,7 +365,11 @@ async def _async_events_consumer(
                 JSON_DUMP(
                     messages.event_message(
                         msg_id,
-                        {"states": history_states},
+                        {
+                            "states": compressed_states_to_columns(history_states)
+                            if columnar
+                            else history_states
+                        },
                     )
                 )
             )
@@ -404,6 +423,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -443,6 +463,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    columnar = msg["columnar"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +490,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            columnar,
         )
         return
 
@@ -533,6 +555,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        columnar,
     )
 
     if msg_id not in connection.subscriptions:
@@ -546,6 +569,7 @@ async def ws_stream(
             msg_id,
             stream_queue,
             no_attributes,
+            columnar,
         )
     )
 
@@ -574,4 +598,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        columnar=columnar,
     )
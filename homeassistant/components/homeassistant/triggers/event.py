@@ -5,7 +5,12 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
@@ -50,6 +55,7 @@ async def async_attach_trigger(
     removes = []
 
     event_data_schema = None
+    indexed_entity_ids: list[str] | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         template.attach(hass, config[CONF_EVENT_DATA])
@@ -62,6 +68,9 @@ async def async_attach_trigger(
             {vol.Required(key): value for key, value in event_data.items()},
             extra=vol.ALLOW_EXTRA,
         )
+        # Let the event bus only dispatch events for the configured entity
+        if isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str):
+            indexed_entity_ids = [entity_id]
 
     event_context_schema = None
     if CONF_EVENT_CONTEXT in config:
@@ -114,7 +123,12 @@ async def async_attach_trigger(
         )
 
     removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=filter_event)
+        hass.bus.async_listen(
+            event_type,
+            handle_event,
+            event_filter=filter_event,
+            entity_ids=indexed_entity_ids if event_type != MATCH_ALL else None,
+        )
         for event_type in event_types
     ]
 
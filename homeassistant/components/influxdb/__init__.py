@@ -4,6 +4,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
 import queue
@@ -38,7 +40,9 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_VERSION_2,
@@ -58,6 +62,7 @@ from .const import (
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_LINE_PROTOCOL,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -87,20 +92,29 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    RATE_INTERVAL,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_POINTS,
+    SPOOLED_RESUMED_MESSAGE,
+    TARGET_WRITE_LATENCY,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
+    WROTE_SPOOLED_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -165,6 +179,7 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_LINE_PROTOCOL, default=False): cv.boolean,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -201,10 +216,12 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+def _generate_state_to_point(
+    conf: dict,
+) -> Callable[[State], tuple[Any, dict[str, Any], list[tuple[str, Any]]] | None]:
+    """Build converter of states to the measurement, tags and fields of a point."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
+    tags: dict[str, str] = conf[CONF_TAGS]
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr: str = conf[CONF_MEASUREMENT_ATTR]
@@ -216,14 +233,16 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
-        state: State | None = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE, None)
-            or not entity_filter(state.entity_id)
-        ):
+    def state_to_point(
+        state: State,
+    ) -> tuple[Any, dict[str, Any], list[tuple[str, Any]]] | None:
+        """Convert state into the measurement, tags and fields of a point."""
+        if state.state in (
+            STATE_UNKNOWN,
+            "",
+            STATE_UNAVAILABLE,
+            None,
+        ) or not entity_filter(state.entity_id):
             return None
 
         try:
@@ -266,61 +285,131 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields: list[tuple[str, Any]] = []
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields.append((INFLUX_CONF_STATE, state.state))
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields.append((INFLUX_CONF_VALUE, _state_as_value))
+        field_keys = {key for key, _ in fields}
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                point_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in field_keys:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    number = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields.append((new_key, new_value))
+                    field_keys.add(new_key)
 
-                    if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                    if not RE_DIGIT_TAIL.match(new_value):
+                        continue
+                    number = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
-                with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                if math.isfinite(number):
+                    fields.append((key, number))
+                    field_keys.add(key)
+
+        point_tags.update(tags)
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        return measurement, point_tags, fields
+
+    return state_to_point
+
+
+def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
+    """Build event to json converter and add to config."""
+    state_to_point = _generate_state_to_point(conf)
+
+    def event_to_json(event: Event) -> dict[str, Any] | None:
+        """Convert event into json in format Influx expects."""
+        state: State | None = event.data.get(EVENT_NEW_STATE)
+        if state is None or (point := state_to_point(state)) is None:
+            return None
+        measurement, tags, fields = point
 
-        return json
+        return {
+            INFLUX_CONF_MEASUREMENT: measurement,
+            INFLUX_CONF_TAGS: tags,
+            INFLUX_CONF_TIME: event.time_fired,
+            INFLUX_CONF_FIELDS: dict(fields),
+        }
 
     return event_to_json
 
 
+_ESCAPE_MEASUREMENT = str.maketrans({",": r"\,", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_KEY = str.maketrans({",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_STRING = str.maketrans({'"': r"\"", "\\": r"\\", "\n": r"\n"})
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_MICROSECOND = timedelta(microseconds=1)
+# Number of microseconds in a unit of the precision of the timestamps
+_PRECISION_MICROSECONDS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
+    state_to_point = _generate_state_to_point(conf)
+    precision: str | None = conf.get(CONF_PRECISION)
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a point in line protocol.
+
+        The point is encoded directly instead of building the json format
+        first and converting that in the client.
+        """
+        state: State | None = event.data.get(EVENT_NEW_STATE)
+        if state is None or (point := state_to_point(state)) is None:
+            return None
+        measurement, tags, fields = point
+        if not fields:
+            return None
+
+        line = [str(measurement).translate(_ESCAPE_MEASUREMENT)]
+        for key, value in sorted(tags.items()):
+            if (tag_value := str(value)) != "":
+                line.append(
+                    f",{key.translate(_ESCAPE_KEY)}={tag_value.translate(_ESCAPE_KEY)}"
+                )
+        separator = " "
+        for key, value in fields:
+            if isinstance(value, str):
+                encoded = f'"{value.translate(_ESCAPE_STRING)}"'
+            else:
+                encoded = repr(value)
+            line.append(f"{separator}{key.translate(_ESCAPE_KEY)}={encoded}")
+            separator = ","
+
+        micros = (event.time_fired - _EPOCH) // _MICROSECOND
+        if precision is None or precision == "ns":
+            line.append(f" {micros * 1000}")
+        else:
+            line.append(f" {micros // _PRECISION_MICROSECONDS[precision]}")
+        return "".join(line)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -329,6 +418,7 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
+    write_lines: Callable[[list[str]], None]
 
 
 def get_influx_connection(  # noqa: C901
@@ -400,7 +490,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, query_v2, close_v2, write_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -431,10 +521,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -472,7 +562,9 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(
+        databases, write_v1, query_v1, close_v1, partial(write_v1, protocol="line")
+    )
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -493,7 +585,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    event_to_line = spool = None
+    if conf[CONF_LINE_PROTOCOL]:
+        event_to_line = _generate_event_to_line(conf)
+        spool = InfluxSpool(
+            hass.config.path(STORAGE_DIR, SPOOL_DIRECTORY), SPOOL_MAX_POINTS
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, event_to_line, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,15 +610,31 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
-        """Initialize the listener."""
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, event_to_line=None, spool=None
+    ):
+        """Initialize the listener.
+
+        With event_to_line, events are written in line protocol in batches
+        sized to the write latency and spooled while InfluxDB is down.
+        """
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
+        self.spool = spool
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.batch_size = BATCH_BUFFER_SIZE
+        self.points_written = 0
+        self.points_per_second = 0.0
+        self.dropped_points = 0
+        self._rate_start = time.monotonic()
+        self._rate_points = 0
+        # Points are spooled without trying to write them until then
+        self._retry_at = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -588,12 +704,147 @@ class InfluxThread(threading.Thread):
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def get_events_lines(self):
+        """Return a batch of events in line protocol.
+
+        Events which waited longer than the backlog allows are returned
+        separately, to be spooled instead of dropped.
+        """
+        count = 0
+        lines = []
+        old_lines = []
+
+        with suppress(queue.Empty):
+            while len(lines) + len(old_lines) < self.batch_size and not self.shutdown:
+                if count:
+                    timeout = self.batch_timeout()
+                else:
+                    # Wake up to write the spooled points when there are no events
+                    timeout = RETRY_DELAY if len(self.spool) else None
+                item = self.queue.get(timeout=timeout)
+                count += 1
+
+                if item is None:
+                    self.shutdown = True
+                    continue
+
+                timestamp, event = item
+                if (line := self.event_to_line(event)) is None:
+                    continue
+                if time.monotonic() - timestamp < QUEUE_BACKLOG_SECONDS:
+                    lines.append(line)
+                else:
+                    old_lines.append(line)
+
+        return count, lines, old_lines
+
+    def spool_lines(self, lines):
+        """Spool points to write them later."""
+        try:
+            dropped = self.spool.append(lines, self.batch_size)
+        except OSError as err:
+            _LOGGER.error("Cannot spool %d events: %s", len(lines), err)
+            dropped = len(lines)
+        if dropped:
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+            self.dropped_points += dropped
+
+    def write_lines_to_influxdb(self, lines):
+        """Write points in line protocol, spool them if InfluxDB is down."""
+        if time.monotonic() < self._retry_at:
+            self.write_errors += len(lines)
+            self.spool_lines(lines)
+            return
+
+        start = time.monotonic()
+        try:
+            self.influx.write_lines(lines)
+        except ValueError as err:
+            _LOGGER.error(err)
+            return
+        except ConnectionError as err:
+            if not self.write_errors:
+                _LOGGER.error(err)
+            self.write_errors += len(lines)
+            self._retry_at = time.monotonic() + RETRY_DELAY
+            self.spool_lines(lines)
+            return
+
+        self._wrote(len(lines), time.monotonic() - start)
+        _LOGGER.debug(WROTE_MESSAGE, len(lines))
+
+    def write_spooled(self):
+        """Write the spooled batches while InfluxDB can be written to.
+
+        Stops when a full batch of new events is waiting, so they are
+        written before they are too old and have to be spooled as well.
+        """
+        while (
+            not self.shutdown
+            and time.monotonic() >= self._retry_at
+            and self.queue.qsize() < self.batch_size
+            and (lines := self.spool.peek()) is not None
+        ):
+            start = time.monotonic()
+            try:
+                self.influx.write_lines(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                self._retry_at = time.monotonic() + RETRY_DELAY
+                return
+            else:
+                self._wrote(len(lines), time.monotonic() - start)
+            self.spool.pop()
+            _LOGGER.debug(WROTE_SPOOLED_MESSAGE, len(lines), len(self.spool))
+
+    def _wrote(self, points, latency):
+        """Update the batch size and metrics after writing points."""
+        if self.write_errors:
+            _LOGGER.error(SPOOLED_RESUMED_MESSAGE, self.write_errors)
+            self.write_errors = 0
+
+        # Grow full batches while writes are fast and shrink them when slow
+        if latency > TARGET_WRITE_LATENCY:
+            self.batch_size = max(self.batch_size // 2, BATCH_BUFFER_SIZE)
+        elif points >= self.batch_size and latency < TARGET_WRITE_LATENCY / 2:
+            self.batch_size = min(self.batch_size * 2, MAX_BATCH_SIZE)
+
+        self.points_written += points
+        self._rate_points += points
+        now = time.monotonic()
+        if (elapsed := now - self._rate_start) >= RATE_INTERVAL:
+            self.points_per_second = self._rate_points / elapsed
+            self._rate_start = now
+            self._rate_points = 0
+            _LOGGER.debug("Writer metrics: %s", self.metrics())
+
+    def metrics(self):
+        """Return the metrics of the writer."""
+        return {
+            "points_written": self.points_written,
+            "points_per_second": self.points_per_second,
+            "batch_size": self.batch_size,
+            "backlog": self.queue.qsize(),
+            "spooled_batches": len(self.spool) if self.spool else 0,
+            "spooled_points": self.spool.points if self.spool else 0,
+            "dropped_points": self.dropped_points,
+        }
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            if self.event_to_line is not None:
+                count, lines, old_lines = self.get_events_lines()
+                if old_lines:
+                    self.spool_lines(old_lines)
+                if lines:
+                    self.write_lines_to_influxdb(lines)
+                self.write_spooled()
+            else:
+                count, json = self.get_events_json()
+                if json:
+                    self.write_to_influxdb(json)
             for _ in range(count):
                 self.queue.task_done()
 
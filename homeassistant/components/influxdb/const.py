@@ -30,6 +30,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
+CONF_LINE_PROTOCOL = "line_protocol"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
 
@@ -78,6 +79,11 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MAX_BATCH_SIZE = 5000
+TARGET_WRITE_LATENCY = 1  # seconds
+RATE_INTERVAL = 10  # seconds
+SPOOL_DIRECTORY = "influxdb_spool"
+SPOOL_MAX_POINTS = 500000
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +126,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLED_RESUMED_MESSAGE = "Resumed, spooled %d events to write later."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d old events."
+WROTE_SPOOLED_MESSAGE = "Wrote %d spooled events, %d batches left."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
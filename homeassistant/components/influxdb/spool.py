@@ -0,0 +1,88 @@
+"""Keep batches of points on disk while InfluxDB can't be written to."""
+from __future__ import annotations
+
+from collections import deque
+import os
+
+from homeassistant.util.file import write_utf8_file
+
+SPOOL_SUFFIX = ".lp"
+
+
+class InfluxSpool:
+    """Ring buffer of batches of points in line protocol on disk.
+
+    Every batch is stored in its own file, named after its sequence number so
+    the batches are written in order, also after a restart. Points are added
+    to the newest batch until it reaches the batch size. When the spool holds
+    more than max_points the oldest batches are dropped to make room.
+    """
+
+    def __init__(self, path: str, max_points: int) -> None:
+        """Initialize the spool and load the batches left by a previous run."""
+        self.path = path
+        self.max_points = max_points
+        # Sequence number and number of points of the spooled batches
+        self._batches: deque[tuple[int, int]] = deque()
+        self.points = 0
+        os.makedirs(path, exist_ok=True)
+        for name in sorted(os.listdir(path)):
+            stem, suffix = os.path.splitext(name)
+            if suffix != SPOOL_SUFFIX or not stem.isdigit():
+                continue
+            points = len(self._read(int(stem)))
+            self._batches.append((int(stem), points))
+            self.points += points
+
+    def __len__(self) -> int:
+        """Return the number of spooled batches."""
+        return len(self._batches)
+
+    def _filename(self, sequence: int) -> str:
+        """Return the file name of a batch."""
+        return os.path.join(self.path, f"{sequence:012d}{SPOOL_SUFFIX}")
+
+    def _read(self, sequence: int) -> list[str]:
+        """Read the points of a batch."""
+        with open(self._filename(sequence), encoding="utf-8") as batch_file:
+            return batch_file.read().splitlines()
+
+    def append(self, lines: list[str], batch_size: int) -> int:
+        """Spool points and return the number of points dropped to make room.
+
+        The points are added to the newest batch if it stays within
+        batch_size, otherwise they start a new batch.
+        """
+        if self._batches and self._batches[-1][1] + len(lines) <= batch_size:
+            sequence, points = self._batches[-1]
+            write_utf8_file(
+                self._filename(sequence), "\n".join(self._read(sequence) + lines)
+            )
+            self._batches[-1] = (sequence, points + len(lines))
+        else:
+            sequence = self._batches[-1][0] + 1 if self._batches else 0
+            write_utf8_file(self._filename(sequence), "\n".join(lines))
+            self._batches.append((sequence, len(lines)))
+        self.points += len(lines)
+
+        dropped = 0
+        while self.points > self.max_points and len(self._batches) > 1:
+            dropped += self._remove_oldest()
+        return dropped
+
+    def peek(self) -> list[str] | None:
+        """Return the points of the oldest batch."""
+        if not self._batches:
+            return None
+        return self._read(self._batches[0][0])
+
+    def pop(self) -> None:
+        """Remove the oldest batch after it was written."""
+        self._remove_oldest()
+
+    def _remove_oldest(self) -> int:
+        """Remove the oldest batch and return its number of points."""
+        sequence, points = self._batches.popleft()
+        os.remove(self._filename(sequence))
+        self.points -= points
+        return points
@@ -39,7 +39,10 @@ from homeassistant.helpers.typing import ConfigType
 # Loading the config flow file will register the flow
 from . import debug_info, discovery
 from .client import (  # noqa: F401
+    DEFAULT_PUBLISH_WINDOW,
     MQTT,
+    PublishQueue,
+    async_create_publish_queue,
     async_publish,
     async_subscribe,
     publish,
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
-from itertools import chain, groupby
+from dataclasses import dataclass
+from itertools import chain, count, groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 import uuid
@@ -15,6 +17,7 @@ import uuid
 import async_timeout
 import attr
 import certifi
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -78,6 +81,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie, topic_matches
 from .util import get_file_path, get_mqtt_data, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -92,6 +96,15 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 
+# Maximum number of topics to cache the matching subscriptions for
+MATCH_CACHE_SIZE = 8192
+
+# Maximum number of received messages handled in one event loop iteration
+INBOUND_BATCH_SIZE = 512
+
+# Default number of messages a publish queue waits to be acknowledged at once
+DEFAULT_PUBLISH_WINDOW = 10
+
 SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
 
@@ -154,6 +167,19 @@ async def async_publish(
     )
 
 
+@callback
+def async_create_publish_queue(
+    hass: HomeAssistant, name: str, window: int = DEFAULT_PUBLISH_WINDOW
+) -> PublishQueue:
+    """Create a queue to publish messages through.
+
+    The statistics of the queue are included in the MQTT diagnostics.
+    """
+    queue = PublishQueue(hass, window)
+    get_mqtt_data(hass).publish_queues[name] = queue
+    return queue
+
+
 @bind_hass
 async def async_subscribe(
     hass: HomeAssistant,
@@ -211,12 +237,133 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+@dataclass(slots=True)
+class _InboundStats:
+    """Statistics of the messages handed over from the paho thread."""
+
+    messages: int = 0
+    batches: int = 0
+    max_depth: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+
+@dataclass(slots=True)
+class _QueuedMessage:
+    """A message waiting in a publish queue."""
+
+    topic: str
+    payload: PublishPayloadType
+    qos: int
+    retain: bool
+    queued: float
+
+
+@dataclass(slots=True)
+class _PublishStats:
+    """Statistics of a publish queue."""
+
+    published: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    max_depth: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+
+class PublishQueue:
+    """Publish messages in order with a limited number waiting for the broker.
+
+    A retained message replaces the message queued for the same topic which
+    was not published yet, since only the last value of a retained topic
+    matters. The latency of a message is the time from queueing it until the
+    broker acknowledged it.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: int) -> None:
+        """Initialize the publish queue."""
+        self.hass = hass
+        self.window = window
+        # Retained messages are keyed by topic, others by sequence number
+        self._queue: dict[str | int, _QueuedMessage] = {}
+        self._sequence = count()
+        self._in_flight = 0
+        self._stats = _PublishStats()
+
+    @callback
+    def async_publish(
+        self,
+        topic: str,
+        payload: PublishPayloadType,
+        qos: int = 0,
+        retain: bool = False,
+    ) -> None:
+        """Queue a message to publish."""
+        key: str | int = topic if retain else next(self._sequence)
+        if (queued := self._queue.get(key)) is not None:
+            queued.payload = payload
+            queued.qos = qos
+            self._stats.coalesced += 1
+            return
+        self._queue[key] = _QueuedMessage(topic, payload, qos, retain, time.monotonic())
+        self._stats.max_depth = max(self._stats.max_depth, len(self._queue))
+        self._async_publish_next()
+
+    @callback
+    def _async_publish_next(self) -> None:
+        """Publish queued messages until the window is full."""
+        queue = self._queue
+        while queue and self._in_flight < self.window:
+            message = queue.pop(next(iter(queue)))
+            self._in_flight += 1
+            self.hass.async_create_task(
+                self._async_publish_message(message),
+                f"mqtt publish queue {message.topic}",
+            )
+
+    async def _async_publish_message(self, message: _QueuedMessage) -> None:
+        """Publish a message and wait for the broker to acknowledge it."""
+        stats = self._stats
+        try:
+            await async_publish(
+                self.hass, message.topic, message.payload, message.qos, message.retain
+            )
+        except HomeAssistantError as err:
+            stats.errors += 1
+            _LOGGER.error("Failed to publish message on %s: %s", message.topic, err)
+        else:
+            latency = time.monotonic() - message.queued
+            stats.published += 1
+            stats.latency_total += latency
+            stats.latency_max = max(stats.latency_max, latency)
+        finally:
+            self._in_flight -= 1
+            self._async_publish_next()
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the statistics of the queue."""
+        stats = self._stats
+        return {
+            "depth": len(self._queue),
+            "max_depth": stats.max_depth,
+            "in_flight": self._in_flight,
+            "window": self.window,
+            "published": stats.published,
+            "coalesced": stats.coalesced,
+            "errors": stats.errors,
+            "latency_mean": (
+                stats.latency_total / stats.published if stats.published else 0.0
+            ),
+            "latency_max": stats.latency_max,
+        }
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -374,7 +521,15 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions: TopicTrie[Subscription] = TopicTrie()
+        self._match_cache: LRU = LRU(MATCH_CACHE_SIZE)
+        self._match_cache_invalidations = 0
+        # Messages received by the paho thread, handed over to the event loop
+        # in batches with their time of arrival
+        self._inbound: deque[tuple[float, mqtt.MQTTMessage]] = deque()
+        self._inbound_lock = threading.Lock()
+        self._inbound_scheduled = False
+        self._inbound_stats = _InboundStats()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -419,7 +574,7 @@ class MQTT:
         """Return the tracked subscriptions."""
         return [
             *chain.from_iterable(self._simple_subscriptions.values()),
-            *self._wildcard_subscriptions,
+            *self._wildcard_subscriptions.values(),
         ]
 
     def cleanup(self) -> None:
@@ -448,8 +603,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_filter(topic)
         )
 
     async def async_publish(
@@ -526,30 +681,26 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription.topic, subscription)
+        self._async_invalidate_match_cache(subscription.topic)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -559,9 +710,40 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions.remove(topic, subscription)
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
+        self._async_invalidate_match_cache(topic)
+
+    @callback
+    def _async_invalidate_match_cache(self, topic: str) -> None:
+        """Drop the cached matches a changed subscription affects."""
+        match_cache = self._match_cache
+        if _is_simple_match(topic):
+            if topic in match_cache:
+                del match_cache[topic]
+                self._match_cache_invalidations += 1
+            return
+        # The keys of an LRU are a copy, entries can be deleted while iterating
+        cached_topics: list[str] = match_cache.keys()
+        for cached_topic in cached_topics:
+            if topic_matches(topic, cached_topic):
+                del match_cache[cached_topic]
+                self._match_cache_invalidations += 1
+
+    @callback
+    def async_match_cache_stats(self) -> dict[str, int]:
+        """Return the statistics of the subscription match cache."""
+        hits, misses = self._match_cache.get_stats()
+        return {
+            "size": len(self._match_cache),
+            "max_size": self._match_cache.get_size(),
+            "hits": hits,
+            "misses": misses,
+            "invalidations": self._match_cache_invalidations,
+            "simple_subscriptions": len(self._simple_subscriptions),
+            "wildcard_subscriptions": len(self._wildcard_subscriptions),
+        }
 
     @callback
     def _async_queue_subscriptions(
@@ -591,11 +773,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -605,7 +784,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             # Only unsubscribe if currently connected
             if self.connected:
                 self.hass.async_create_task(self._async_unsubscribe(topic))
@@ -764,17 +942,67 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        The event loop is only woken up if it is not already going to handle
+        the messages received before this one.
+        """
+        self._inbound.append((time.monotonic(), msg))
+        with self._inbound_lock:
+            if self._inbound_scheduled:
+                return
+            self._inbound_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_handle_inbound_messages)
+
+    @callback
+    def _async_handle_inbound_messages(self) -> None:
+        """Handle a batch of the messages received by the paho thread."""
+        inbound = self._inbound
+        stats = self._inbound_stats
+        depth = len(inbound)
+        batch_size = min(depth, INBOUND_BATCH_SIZE)
+        stats.batches += 1
+        stats.max_depth = max(stats.max_depth, depth)
+        now = time.monotonic()
+        try:
+            for _ in range(batch_size):
+                received, msg = inbound.popleft()
+                latency = now - received
+                stats.messages += 1
+                stats.latency_total += latency
+                stats.latency_max = max(stats.latency_max, latency)
+                self._mqtt_handle_message(msg)
+        finally:
+            with self._inbound_lock:
+                pending = bool(inbound)
+                self._inbound_scheduled = pending
+            if pending:
+                # Give other jobs a turn before handling the next batch
+                self.hass.loop.call_soon(self._async_handle_inbound_messages)
+
+    @callback
+    def async_inbound_stats(self) -> dict[str, Any]:
+        """Return the statistics of the handover of received messages."""
+        stats = self._inbound_stats
+        return {
+            "depth": len(self._inbound),
+            "max_depth": stats.max_depth,
+            "messages": stats.messages,
+            "batches": stats.batches,
+            "latency_mean": (
+                stats.latency_total / stats.messages if stats.messages else 0.0
+            ),
+            "latency_max": stats.latency_max,
+        }
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        if (cached := self._match_cache.get(topic)) is not None:
+            return cached  # type: ignore[no-any-return]
+        subscriptions = [
+            *self._simple_subscriptions.get(topic, ()),
+            *self._wildcard_subscriptions.match(topic),
+        ]
+        self._match_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -920,13 +1148,3 @@ def _raise_on_errors(result_codes: Iterable[int]) -> None:
 def _raise_on_error(result_code: int) -> None:
     """Raise error if error result."""
     _raise_on_errors((result_code,))
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
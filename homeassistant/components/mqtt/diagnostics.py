@@ -44,7 +44,8 @@ def _async_get_diagnostics(
     device: DeviceEntry | None = None,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    mqtt_instance = get_mqtt_data(hass).client
+    mqtt_data = get_mqtt_data(hass)
+    mqtt_instance = mqtt_data.client
     assert mqtt_instance is not None
 
     redacted_config = async_redact_data(mqtt_instance.conf, REDACT_CONFIG)
@@ -67,6 +68,12 @@ def _async_get_diagnostics(
                 )
             ],
             mqtt_debug_info=debug_info.info_for_config_entry(hass),
+            subscription_match_cache=mqtt_instance.async_match_cache_stats(),
+            inbound_messages=mqtt_instance.async_inbound_stats(),
+            publish_queues={
+                name: queue.async_stats()
+                for name, queue in mqtt_data.publish_queues.items()
+            },
         )
 
     return data
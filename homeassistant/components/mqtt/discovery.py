@@ -70,6 +70,7 @@ SUPPORTED_COMPONENTS = [
 
 MQTT_DISCOVERY_UPDATED = "mqtt_discovery_updated_{}"
 MQTT_DISCOVERY_NEW = "mqtt_discovery_new_{}_{}"
+MQTT_DISCOVERY_NEW_BULK = "mqtt_discovery_new_bulk_{}_{}"
 MQTT_DISCOVERY_DONE = "mqtt_discovery_done_{}"
 
 TOPIC_BASE = "~"
@@ -97,6 +98,8 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = get_mqtt_data(hass)
     mqtt_integrations = {}
+    # New components found in retained messages, waiting to be set up in bulk
+    bulk_discovered: dict[str, list[MQTTDiscoveryPayload]] = {}
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -206,13 +209,23 @@ async def async_start(  # noqa: C901
             )
             return
 
-        async_process_discovery_payload(component, discovery_id, discovery_payload)
+        async_process_discovery_payload(
+            component, discovery_id, discovery_payload, bulk=msg.retain
+        )
 
     @callback
     def async_process_discovery_payload(
-        component: str, discovery_id: str, payload: MQTTDiscoveryPayload
+        component: str,
+        discovery_id: str,
+        payload: MQTTDiscoveryPayload,
+        bulk: bool = False,
     ) -> None:
-        """Process the payload of a new discovery."""
+        """Process the payload of a new discovery.
+
+        New components received with bulk set are collected and set up
+        together with the other new components received in the same event loop
+        iteration, like the burst of retained messages after subscribing.
+        """
 
         _LOGGER.debug("Process discovery payload %s", payload)
         discovery_hash = (component, discovery_id)
@@ -255,15 +268,31 @@ async def async_start(  # noqa: C901
             # Add component
             _LOGGER.info("Found new component: %s %s", component, discovery_id)
             mqtt_data.discovery_already_discovered.add(discovery_hash)
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
-            )
+            if not bulk:
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
+                )
+                return
+            if not bulk_discovered:
+                hass.loop.call_soon(async_setup_bulk_discovered)
+            bulk_discovered.setdefault(component, []).append(payload)
         else:
             # Unhandled discovery message
             async_dispatcher_send(
                 hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
             )
 
+    @callback
+    def async_setup_bulk_discovered() -> None:
+        """Set up the new components collected from retained messages."""
+        discovered = bulk_discovered.copy()
+        bulk_discovered.clear()
+        for component, payloads in discovered.items():
+            _LOGGER.debug("Setting up %s new %s components", len(payloads), component)
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_NEW_BULK.format(component, "mqtt"), payloads
+            )
+
     discovery_topics = [
         f"{discovery_topic}/+/+/config",
         f"{discovery_topic}/+/+/+/config",
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from functools import partial
 import logging
 from typing import Any, Protocol, cast, final
@@ -51,6 +51,7 @@ from homeassistant.helpers.entity import (
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_entity_registry_updated_event
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
+from homeassistant.helpers.json import json_dumps_sorted
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util.json import json_loads
 
@@ -75,6 +76,7 @@ from .debug_info import log_message, log_messages
 from .discovery import (
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
+    MQTT_DISCOVERY_NEW_BULK,
     MQTT_DISCOVERY_UPDATED,
     MQTTDiscoveryPayload,
     clear_discovery_hash,
@@ -298,6 +300,35 @@ async def async_setup_entry_helper(
 ) -> None:
     """Set up entity, automation or tag creation dynamically through MQTT discovery."""
     mqtt_data = get_mqtt_data(hass)
+    schema_cache = mqtt_data.discovery_schema_cache
+
+    def _validate(discovery_payload: MQTTDiscoveryPayload) -> DiscoveryInfoType:
+        """Validate a discovery payload.
+
+        The result is reused when an identical payload is discovered again,
+        like after the MQTT entry was reloaded.
+        """
+        key = (domain, json_dumps_sorted(discovery_payload))
+        if (config := schema_cache.get(key)) is None:
+            config = schema_cache[key] = discovery_schema(discovery_payload)
+        return cast(DiscoveryInfoType, config)
+
+    async def _async_setup_discovered(
+        discovery_payload: MQTTDiscoveryPayload,
+        setup: partial[Coroutine[Any, Any, None]] = async_setup,
+    ) -> None:
+        """Set up a discovered MQTT entity, automation or tag."""
+        discovery_data = discovery_payload.discovery_data
+        try:
+            config = _validate(discovery_payload)
+            await setup(config, discovery_data=discovery_data)
+        except Exception:
+            discovery_hash: tuple[str, str] = discovery_data[ATTR_DISCOVERY_HASH]
+            clear_discovery_hash(hass, discovery_hash)
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+            )
+            raise
 
     async def async_discover(discovery_payload: MQTTDiscoveryPayload) -> None:
         """Discover and add an MQTT entity, automation or tag."""
@@ -311,21 +342,79 @@ async def async_setup_entry_helper(
                 discovery_payload,
             )
             return
-        discovery_data = discovery_payload.discovery_data
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            await async_setup(config, discovery_data=discovery_data)
-        except Exception:
-            discovery_hash: tuple[str, str] = discovery_data[ATTR_DISCOVERY_HASH]
-            clear_discovery_hash(hass, discovery_hash)
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+        await _async_setup_discovered(discovery_payload)
+
+    async def async_discover_bulk(
+        discovery_payloads: list[MQTTDiscoveryPayload],
+    ) -> None:
+        """Discover and add MQTT entities, automations or tags in bulk.
+
+        The items are set up concurrently. The setup of entity platforms is
+        bound to the hass object and the AddEntitiesCallback of the platform,
+        so the entities are collected and added with a single call.
+        """
+        if not mqtt_config_entry_enabled(hass):
+            _LOGGER.warning(
+                (
+                    "MQTT integration is disabled, skipping setup of %s discovered "
+                    "items MQTT %s"
+                ),
+                len(discovery_payloads),
+                domain,
+            )
+            return
+        setup = async_setup
+        new_entities: list[Entity] = []
+        # Entity platforms bind the hass object and their AddEntitiesCallback,
+        # device automations and tags only bind the hass object
+        if len(async_setup.args) == 2:
+            async_add_entities: AddEntitiesCallback = async_setup.args[1]
+
+            @callback
+            def _async_collect_entities(
+                entities: Iterable[Entity], update_before_add: bool = False
+            ) -> None:
+                """Collect the entities to add them together."""
+                if update_before_add:
+                    async_add_entities(entities, update_before_add=True)
+                else:
+                    new_entities.extend(entities)
+
+            setup = partial(
+                async_setup.func,
+                async_setup.args[0],
+                _async_collect_entities,
+                **async_setup.keywords,
             )
-            raise
 
-    mqtt_data.reload_dispatchers.append(
-        async_dispatcher_connect(
-            hass, MQTT_DISCOVERY_NEW.format(domain, "mqtt"), async_discover
+        results = await asyncio.gather(
+            *(
+                _async_setup_discovered(discovery_payload, setup)
+                for discovery_payload in discovery_payloads
+            ),
+            return_exceptions=True,
+        )
+        if new_entities:
+            async_add_entities(new_entities)
+        for discovery_payload, result in zip(discovery_payloads, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error setting up discovered item MQTT %s, payload %s",
+                    domain,
+                    discovery_payload,
+                    exc_info=result,
+                )
+
+    mqtt_data.reload_dispatchers.extend(
+        (
+            async_dispatcher_connect(
+                hass, MQTT_DISCOVERY_NEW.format(domain, "mqtt"), async_discover
+            ),
+            async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_NEW_BULK.format(domain, "mqtt"),
+                async_discover_bulk,
+            ),
         )
     )
 
@@ -7,10 +7,12 @@ from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 import datetime as dt
+from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import attr
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.backports.enum import StrEnum
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME
@@ -23,7 +25,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, Template
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
 
-    from .client import MQTT, Subscription
+    from .client import MQTT, PublishQueue, Subscription
     from .debug_info import TimestampedPublishMessage
     from .device_trigger import Trigger
     from .discovery import MQTTDiscoveryPayload
@@ -39,6 +41,9 @@ class PayloadSentinel(StrEnum):
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of validated discovery payloads to keep
+DISCOVERY_SCHEMA_CACHE_SIZE = 8192
+
 ATTR_THIS = "this"
 
 PublishPayloadType = str | bytes | int | float | None
@@ -303,9 +308,13 @@ class MqttData:
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
+    discovery_schema_cache: LRU = field(
+        default_factory=partial(LRU, DISCOVERY_SCHEMA_CACHE_SIZE)
+    )
     discovery_unsubscribe: list[CALLBACK_TYPE] = field(default_factory=list)
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     last_discovery: float = 0.0
+    publish_queues: dict[str, PublishQueue] = field(default_factory=dict)
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_entry: bool = False
     reload_handlers: dict[str, Callable[[], Coroutine[Any, Any, None]]] = field(
@@ -0,0 +1,146 @@
+"""Match MQTT topics against many topic filters at once."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import count
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _TrieNode(Generic[_T]):
+    """A level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode[_T]] = {}
+        # The values of the filters ending at this level with their sequence
+        self.values: list[tuple[int, _T]] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Trie of topic filters which can contain + and # wildcards.
+
+    Matching a topic walks the levels of the topic once instead of testing
+    every filter. Values are returned in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TrieNode[_T] = _TrieNode()
+        self._sequence = count()
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._len
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+        node.values.append((next(self._sequence), value))
+        self._len += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path = [self._root]
+        for level in topic_filter.split("/"):
+            if (child := path[-1].children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append(child)
+        values = path[-1].values
+        for idx, (_, other) in enumerate(values):
+            if other is value:
+                del values[idx]
+                break
+        else:
+            raise KeyError(topic_filter)
+        self._len -= 1
+
+        # Prune the levels no filter uses anymore
+        levels = topic_filter.split("/")
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.values or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if a value was added for the exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the filters matching a topic."""
+        # A topic containing wildcards can reach a filter in more than one way
+        matches = dict(self._iter_match(topic))
+        if len(matches) > 1:
+            return [matches[sequence] for sequence in sorted(matches)]
+        return list(matches.values())
+
+    def values(self) -> list[_T]:
+        """Return all values."""
+        found: list[tuple[int, _T]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            found.extend(node.values)
+            stack.extend(node.children.values())
+        found.sort()
+        return [value for _, value in found]
+
+    def _iter_match(self, topic: str) -> Iterator[tuple[int, _T]]:
+        """Iterate the values of the filters matching a topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level don't match topics starting with $
+        normal = not topic.startswith("$")
+        stack: list[tuple[_TrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            if (
+                (multi := children.get("#")) is not None
+                and multi.values
+                and (normal or idx > 0)
+            ):
+                yield from multi.values
+            if idx == last:
+                yield from node.values
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if (single := children.get("+")) is not None and (normal or idx > 0):
+                stack.append((single, idx + 1))
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return if a topic filter matches a topic."""
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    normal = not topic.startswith("$")
+    for idx, level in enumerate(filter_levels):
+        if level == "#":
+            return normal or idx > 0
+        if idx == len(topic_levels):
+            return False
+        if level == "+":
+            if not normal and idx == 0:
+                return False
+            continue
+        if level != topic_levels[idx]:
+            return False
+    return len(filter_levels) == len(topic_levels)
@@ -20,6 +20,7 @@ from homeassistant.helpers.typing import ConfigType
 CONF_BASE_TOPIC = "base_topic"
 CONF_PUBLISH_ATTRIBUTES = "publish_attributes"
 CONF_PUBLISH_TIMESTAMPS = "publish_timestamps"
+CONF_PUBLISH_WINDOW = "publish_window"
 
 DOMAIN = "mqtt_statestream"
 
@@ -30,6 +31,9 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Required(CONF_BASE_TOPIC): valid_publish_topic,
                 vol.Optional(CONF_PUBLISH_ATTRIBUTES, default=False): cv.boolean,
                 vol.Optional(CONF_PUBLISH_TIMESTAMPS, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_PUBLISH_WINDOW, default=mqtt.DEFAULT_PUBLISH_WINDOW
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
             }
         ),
     },
@@ -53,28 +57,31 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     publish_timestamps: bool = conf[CONF_PUBLISH_TIMESTAMPS]
     if not base_topic.endswith("/"):
         base_topic = f"{base_topic}/"
+    # Only the last state of an entity is published when the broker can't keep up
+    publish_queue = mqtt.async_create_publish_queue(
+        hass, DOMAIN, conf[CONF_PUBLISH_WINDOW]
+    )
 
-    async def _state_publisher(evt: Event) -> None:
+    @callback
+    def _state_publisher(evt: Event) -> None:
         entity_id: str = evt.data["entity_id"]
         new_state: State = evt.data["new_state"]
 
         payload = new_state.state
 
         mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
-        await mqtt.async_publish(hass, f"{mybase}state", payload, 1, True)
+        publish_queue.async_publish(f"{mybase}state", payload, 1, True)
 
         if publish_timestamps:
             if new_state.last_updated:
-                await mqtt.async_publish(
-                    hass,
+                publish_queue.async_publish(
                     f"{mybase}last_updated",
                     new_state.last_updated.isoformat(),
                     1,
                     True,
                 )
             if new_state.last_changed:
-                await mqtt.async_publish(
-                    hass,
+                publish_queue.async_publish(
                     f"{mybase}last_changed",
                     new_state.last_changed.isoformat(),
                     1,
@@ -84,7 +91,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if publish_attributes:
             for key, val in new_state.attributes.items():
                 encoded_val = json.dumps(val, cls=JSONEncoder)
-                await mqtt.async_publish(hass, mybase + key, encoded_val, 1, True)
+                publish_queue.async_publish(mybase + key, encoded_val, 1, True)
 
     @callback
     def _ha_started(hass: HomeAssistant) -> None:
@@ -14,14 +14,20 @@ from typing import Any, cast
 from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_get_timer_wheel_stats,
+    async_track_time_interval,
+)
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import get_bytecode_cache_stats
+from homeassistant.util import import_profiler
+from homeassistant.util.loop_monitor import DEFAULT_STALL_THRESHOLD, LoopMonitor
 
 from .const import DOMAIN
 
@@ -35,6 +41,10 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_IMPORT_TIMES = "log_import_times"
+SERVICE_START_LOOP_MONITOR = "start_loop_monitor"
+SERVICE_STOP_LOOP_MONITOR = "stop_loop_monitor"
+SERVICE_LOG_LOOP_MONITOR = "log_loop_monitor"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -47,6 +57,7 @@ _KNOWN_LRU_CLASSES = (
     "StatisticsMetaManager",
     "DomainData",
     "IntegrationMatcher",
+    "MQTT",
 )
 
 SERVICES = (
@@ -58,14 +69,22 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_STOP_LOOP_MONITOR,
+    SERVICE_LOG_LOOP_MONITOR,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+IMPORT_TIMES_LOG_LIMIT = 25
+LOOP_MONITOR_LOG_LIMIT = 25
+
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_STALL_THRESHOLD = "stall_threshold"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -84,6 +103,43 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_profile(hass, call)
 
+    async def _async_log_import_times(call: ServiceCall) -> None:
+        """Log and write out the recorded import times."""
+        await _async_generate_import_profile(hass, call)
+
+    @callback
+    def _async_start_loop_monitor(call: ServiceCall) -> None:
+        """Start timing the jobs run in the event loop."""
+        if hass.loop_monitor is not None:
+            raise HomeAssistantError("The loop monitor is already running")
+        hass.loop_monitor = LoopMonitor(call.data[CONF_STALL_THRESHOLD])
+        persistent_notification.async_create(
+            hass,
+            (
+                "Jobs running in the event loop are now timed and stalls are"
+                " logged. This continues until the profiler.stop_loop_monitor"
+                " service is called."
+            ),
+            title="Loop monitor started",
+            notification_id="profile_loop_monitor",
+        )
+
+    @callback
+    def _async_stop_loop_monitor(call: ServiceCall) -> None:
+        """Stop timing the jobs run in the event loop."""
+        if hass.loop_monitor is None:
+            raise HomeAssistantError("The loop monitor is not running")
+        _log_loop_monitor(hass.loop_monitor)
+        hass.loop_monitor = None
+        persistent_notification.async_dismiss(hass, "profile_loop_monitor")
+
+    @callback
+    def _async_log_loop_monitor(call: ServiceCall) -> None:
+        """Log the jobs that kept the event loop busy the longest."""
+        if hass.loop_monitor is None:
+            raise HomeAssistantError("The loop monitor is not running")
+        _log_loop_monitor(hass.loop_monitor)
+
     async def _async_run_memory_profile(call: ServiceCall) -> None:
         async with lock:
             await _async_generate_memory_profile(hass, call)
@@ -215,6 +271,11 @@ async def async_setup_entry(  # noqa: C901
                         "Cache data for sqlalchemy LRUCache %s: %s: %s", lru, key, value
                     )
 
+        if bytecode_cache_stats := get_bytecode_cache_stats(hass):
+            _LOGGER.critical(
+                "Cache stats for template bytecode cache: %s", bytecode_cache_stats
+            )
+
         persistent_notification.create(
             hass,
             (
@@ -251,6 +312,7 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            _LOGGER.critical("Timer wheel: %s", async_get_timer_wheel_stats(hass))
         finally:
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
@@ -349,6 +411,43 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_IMPORT_TIMES,
+        _async_log_import_times,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_MONITOR,
+        _async_start_loop_monitor,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_STALL_THRESHOLD, default=DEFAULT_STALL_THRESHOLD
+                ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_MONITOR,
+        _async_stop_loop_monitor,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_LOOP_MONITOR,
+        _async_log_loop_monitor,
+    )
+
+    websocket_api.async_register_command(hass, websocket_loop_monitor)
+
     return True
 
 
@@ -358,10 +457,44 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.loop_monitor = None
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_monitor"})
+@callback
+def websocket_loop_monitor(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the latency histograms and stalls of the loop monitor."""
+    if (loop_monitor := hass.loop_monitor) is None:
+        connection.send_result(msg["id"], {"running": False})
+        return
+    connection.send_result(msg["id"], {"running": True, **loop_monitor.as_dict()})
+
+
+def _log_loop_monitor(loop_monitor: LoopMonitor) -> None:
+    """Log the jobs that kept the event loop busy the longest."""
+    stats = loop_monitor.as_dict(LOOP_MONITOR_LOG_LIMIT)
+    for name, histogram in stats["jobs"].items():
+        _LOGGER.critical(
+            "Loop time of %s: %s runs, %.6f seconds in total, %.6f mean, %.6f max,"
+            " histogram %s",
+            name,
+            histogram["count"],
+            histogram["total"],
+            histogram["mean"],
+            histogram["max"],
+            histogram["buckets"],
+        )
+    for stall in stats["stalls"]:
+        _LOGGER.critical(
+            "Loop stall of %.3f seconds by %s", stall["duration"], stall["job"]
+        )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -435,6 +568,30 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_generate_import_profile(hass: HomeAssistant, call: ServiceCall):
+    if (profiler := import_profiler.get_import_profiler()) is None:
+        raise HomeAssistantError(
+            "Import times are only recorded when Home Assistant is started with"
+            " --profile-imports"
+        )
+
+    _LOGGER.critical("%s", profiler.report(IMPORT_TIMES_LOG_LIMIT))
+    start_time = int(time.time() * 1000000)
+    import_profile_path = hass.config.path(f"import_profile.{start_time}.txt")
+    await hass.async_add_executor_job(
+        _write_import_profile, profiler, import_profile_path
+    )
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Wrote import times to {import_profile_path}. See [the"
+            " logs](/config/logs) for the slowest imports."
+        ),
+        title="Import times dumped",
+        notification_id="profile_import_times",
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -555,3 +712,10 @@ def _log_object_sources(
         _LOGGER.critical("New objects overflowed by %s", new_objects_overflow)
     elif not had_new_object_growth:
         _LOGGER.critical("No new object growth found")
+
+
+def _write_import_profile(
+    profiler: import_profiler.ImportProfiler, import_profile_path: str
+) -> None:
+    with open(import_profile_path, "w", encoding="utf8") as report:
+        report.write(profiler.report())
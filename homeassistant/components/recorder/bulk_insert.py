@@ -0,0 +1,224 @@
+"""Write States and Events with multi-row INSERT statements."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import PendingRollbackError
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Base
+
+
+@dataclass(slots=True, frozen=True)
+class _InsertPlan:
+    """How to turn ORM objects of a table into INSERT parameters."""
+
+    table: Table
+    primary_key: str
+    columns: tuple[str, ...]
+    # relationship name, local column, remote column and
+    # if the relationship links to the same table
+    links: tuple[tuple[str, str, str, bool], ...]
+
+
+@lru_cache(maxsize=16)
+def _insert_plan(cls: type[Base]) -> _InsertPlan:
+    """Return the insert plan for an ORM class."""
+    mapper = class_mapper(cls)
+    table = mapper.local_table
+    assert isinstance(table, Table)
+    links: list[tuple[str, str, str, bool]] = []
+    for relationship in mapper.relationships:
+        assert relationship.local_remote_pairs
+        local, remote = relationship.local_remote_pairs[0]
+        assert local.key is not None and remote.key is not None
+        links.append(
+            (relationship.key, local.key, remote.key, relationship.mapper is mapper)
+        )
+    return _InsertPlan(
+        table,
+        mapper.primary_key[0].key,
+        tuple(column.key for column in table.columns if not column.primary_key),
+        tuple(links),
+    )
+
+
+def _add_to_generation(
+    obj: Base,
+    primary_key: str,
+    self_links: list[str],
+    generations: list[list[Base]],
+    generation_by_object: dict[int, int],
+) -> int:
+    """Add an object to its generation after the objects it links to.
+
+    This is a module level function instead of a closure since a
+    recursive closure references itself and would keep the objects
+    alive until the garbage collector breaks the cycle.
+    """
+    if (generation := generation_by_object.get(id(obj))) is not None:
+        return generation
+    generation = 0
+    for relationship in self_links:
+        if (target := getattr(obj, relationship)) is not None and getattr(
+            target, primary_key
+        ) is None:
+            # An object that was never queued is still written, the
+            # same as the session would cascade it.
+            target_generation = _add_to_generation(
+                target, primary_key, self_links, generations, generation_by_object
+            )
+            generation = max(generation, target_generation + 1)
+    generation_by_object[id(obj)] = generation
+    if generation == len(generations):
+        generations.append([])
+    generations[generation].append(obj)
+    return generation
+
+
+def _insert_objects(
+    session: Session, objects: Sequence[Base], returning: bool
+) -> list[tuple[Base, int]]:
+    """Insert ORM objects that were not added to the session.
+
+    Objects are written in generations so rows which link to a row of the
+    same table (States.old_state) are inserted after the row they link to.
+    Every generation is written with a single executemany statement.
+
+    If returning is True, the objects and their new primary keys are
+    returned so they can be set once the transaction is committed.
+    """
+    plan = _insert_plan(type(objects[0]))
+    primary_key = plan.primary_key
+    self_links = [link[0] for link in plan.links if link[3]]
+    generations: list[list[Base]] = []
+    generation_by_object: dict[int, int] = {}
+    for obj in objects:
+        _add_to_generation(
+            obj, primary_key, self_links, generations, generation_by_object
+        )
+
+    new_ids: dict[int, int] = {}
+    inserted: list[tuple[Base, int]] = []
+    for generation_objects in generations:
+        params: list[dict[str, Any]] = []
+        for obj in generation_objects:
+            values = {column: getattr(obj, column) for column in plan.columns}
+            for relationship, local, remote, self_link in plan.links:
+                if (
+                    values[local] is None
+                    and (target := getattr(obj, relationship)) is not None
+                ):
+                    if self_link and id(target) in new_ids:
+                        values[local] = new_ids[id(target)]
+                    else:
+                        values[local] = getattr(target, remote)
+            params.append(values)
+        if not returning and not self_links:
+            session.execute(insert(plan.table), params)
+            continue
+        result = session.execute(
+            insert(plan.table).returning(
+                plan.table.c[primary_key], sort_by_parameter_order=True
+            ),
+            params,
+        )
+        for obj, new_id in zip(generation_objects, result.scalars()):
+            new_ids[id(obj)] = new_id
+            inserted.append((obj, new_id))
+    return inserted
+
+
+class BulkInsertQueue:
+    """Queue of States and Events that are written in bulk on commit.
+
+    Adding States to the session makes the unit of work insert them one
+    row at a time since every state links to the state it replaced. The
+    queue bypasses the unit of work and writes them with executemany
+    instead. The rows they link to in other tables (StateAttributes,
+    StatesMeta, EventData and EventTypes) are still added to the session
+    and are flushed first so their ids are known.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert queue."""
+        self._states: list[Base] = []
+        self._events: list[Base] = []
+        self._inserted: list[tuple[Base, int]] = []
+        self._failed = False
+
+    def __bool__(self) -> bool:
+        """Return True if there are queued rows."""
+        return bool(self._states or self._events)
+
+    def add_state(self, dbstate: Base) -> None:
+        """Queue a state.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.append(dbstate)
+
+    def add_event(self, dbevent: Base) -> None:
+        """Queue an event.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.append(dbevent)
+
+    def write(self, session: Session) -> None:
+        """Write the queued rows in the current transaction of the session.
+
+        The queue is kept until post_commit so the rows can be written
+        again if the commit has to be retried. If writing the rows fails,
+        some of them may already be in the transaction, so like a session
+        after a failed flush, the queue refuses to write again until it is
+        reset together with the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._failed:
+            raise PendingRollbackError(
+                "The queued rows were not written due to a previous exception"
+                " during write; the session must be rolled back and the queue"
+                " reset"
+            )
+        session.flush()
+        self._inserted = []
+        try:
+            if self._states:
+                self._inserted.extend(_insert_objects(session, self._states, True))
+            if self._events:
+                _insert_objects(session, self._events, False)
+        except BaseException:
+            self._failed = True
+            self._inserted = []
+            raise
+
+    def post_commit(self) -> None:
+        """Call after commit to set the primary keys of the written States.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for obj, new_id in self._inserted:
+            setattr(obj, _insert_plan(type(obj)).primary_key, new_id)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all queued rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.clear()
+        self._events.clear()
+        self._inserted = []
+        self._failed = False
@@ -46,6 +46,7 @@ EXCLUDE_ATTRIBUTES = f"{DOMAIN}_exclude_attributes_by_domain"
 
 
 STATISTICS_ROWS_SCHEMA_VERSION = 23
+STATE_ATTRIBUTES_SCHEMA_VERSION = 25
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
@@ -42,6 +42,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertQueue
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -57,6 +58,7 @@ from .const import (
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_URL_PREFIX,
+    STATE_ATTRIBUTES_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
@@ -79,6 +81,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -172,10 +175,12 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        entity_keep_days: dict[str, int],
         commit_interval: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        bulk_insert: bool,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
@@ -188,12 +193,15 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.entity_keep_days = entity_keep_days
+        self.purge_progress = PurgeProgress()
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.bulk_insert = bulk_insert
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -227,6 +235,7 @@ class Recorder(threading.Thread):
         self.statistics_meta_manager = StatisticsMetaManager(self)
 
         self.event_session: Session | None = None
+        self.bulk_insert_queue: BulkInsertQueue | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
@@ -765,6 +774,11 @@ class Recorder(threading.Thread):
             if self.schema_version >= STATISTICS_ROWS_SCHEMA_VERSION:
                 self.statistics_meta_manager.load(session)
 
+            # Prime the state attributes cache so the first states recorded
+            # after a restart do not each need a query for their attributes
+            if self.schema_version >= STATE_ATTRIBUTES_SCHEMA_VERSION:
+                self.state_attributes_manager.load_recent(session)
+
             if (
                 self.schema_version < CONTEXT_ID_AS_BINARY_SCHEMA_VERSION
                 or execute_stmt_lambda_element(
@@ -1020,7 +1034,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            session.add(dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1045,7 +1059,21 @@ class Recorder(threading.Thread):
             session.add(dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        session.add(dbevent)
+        self._add_event_to_session(session, dbevent)
+
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add an event to the session or the bulk insert queue."""
+        if self.bulk_insert_queue is not None:
+            self.bulk_insert_queue.add_event(dbevent)
+        else:
+            session.add(dbevent)
+
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a state to the session or the bulk insert queue."""
+        if self.bulk_insert_queue is not None:
+            self.bulk_insert_queue.add_state(dbstate)
+        else:
+            session.add(dbstate)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1118,7 +1146,7 @@ class Recorder(threading.Thread):
             session.add(dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        session.add(dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1133,7 +1161,9 @@ class Recorder(threading.Thread):
     def _event_session_has_pending_writes(self) -> bool:
         """Return True if there are pending writes in the event session."""
         session = self.event_session
-        return bool(session and (session.new or session.dirty))
+        return bool(
+            session and (session.new or session.dirty or self.bulk_insert_queue)
+        )
 
     def _commit_event_session_or_retry(self) -> None:
         """Commit the event session if there is work to do."""
@@ -1162,7 +1192,11 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if bulk_insert_queue := self.bulk_insert_queue:
+            bulk_insert_queue.write(session)
         session.commit()
+        if bulk_insert_queue:
+            bulk_insert_queue.post_commit()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1193,6 +1227,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self.bulk_insert_queue is not None:
+            self.bulk_insert_queue.reset()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1387,6 +1423,18 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        # If enabled, States and Events are written with multi-row INSERT
+        # statements if the database can return the new ids in order
+        self.bulk_insert_queue = (
+            BulkInsertQueue()
+            if self.bulk_insert
+            and getattr(
+                self.engine.dialect,
+                "insert_executemany_returning_sort_by_parameter_order",
+                False,
+            )
+            else None
+        )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
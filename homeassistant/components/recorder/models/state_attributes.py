@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from homeassistant.util.json import json_loads_object
+from homeassistant.util.read_only_dict import intern_read_only_dict
 
 EMPTY_JSON_OBJECT = "{}"
 _LOGGER = logging.getLogger(__name__)
@@ -20,7 +21,11 @@ def decode_attributes_from_source(
     if (attributes := attr_cache.get(source)) is not None:
         return attributes
     try:
-        attr_cache[source] = attributes = json_loads_object(source)
+        # Decoded attributes are shared with identical attributes of
+        # other history results and the state machine
+        attr_cache[source] = attributes = intern_read_only_dict(
+            json_loads_object(source)
+        )
     except ValueError:
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
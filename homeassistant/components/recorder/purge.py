@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -35,11 +36,17 @@ from .queries import (
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
+    find_legacy_detached_states_to_purge_excluding_metadata_ids,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_legacy_rows_to_purge_excluding_metadata_ids,
+    find_legacy_states_to_unlink,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
+    find_states_to_purge_excluding_metadata_ids,
     find_statistics_runs_to_purge,
+    unlink_legacy_states_rows,
 )
 from .repack import repack_database
 from .util import chunked, retryable_database_job, session_scope
@@ -52,6 +59,117 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Seconds a purge cycle may hold the recorder thread before the rest of the
+# purge is rescheduled behind the events that were queued in the meantime.
+DEFAULT_PURGE_TIME_BUDGET = 2.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge run.
+
+    A purge run is split in cycles that each work to a time budget. If a
+    run has not finished when the next nightly purge starts, the next
+    run continues to count on the same progress.
+
+    Rows are only counted between start_cycle and end_cycle, so purging
+    entities with the purge_entities service does not skew the rates.
+    """
+
+    purge_before: datetime | None = None
+    started: datetime | None = None
+    finished: datetime | None = None
+    cycles: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    elapsed: float = 0.0
+    # last_updated_ts of the oldest state when the run started and when
+    # the last cycle started, with the time spent purging until then
+    first_oldest_ts: float | None = None
+    oldest_ts: float | None = None
+    oldest_elapsed: float = 0.0
+    _cycle_start: float | None = None
+    _cycle_states: int = 0
+    _cycle_events: int = 0
+
+    def start_cycle(self, purge_before: datetime, oldest_ts: float | None) -> None:
+        """Start a purge cycle."""
+        if self.started is None or self.finished is not None:
+            self.started = dt_util.utcnow()
+            self.finished = None
+            self.cycles = self.states_purged = self.events_purged = 0
+            self.elapsed = 0.0
+            self.first_oldest_ts = oldest_ts
+        self.purge_before = purge_before
+        self.oldest_ts = oldest_ts
+        self.oldest_elapsed = self.elapsed
+        self._cycle_start = time.monotonic()
+        self._cycle_states = self._cycle_events = 0
+
+    def add_states(self, count: int) -> None:
+        """Count purged states."""
+        if self._cycle_start is not None:
+            self._cycle_states += count
+
+    def add_events(self, count: int) -> None:
+        """Count purged events."""
+        if self._cycle_start is not None:
+            self._cycle_events += count
+
+    def end_cycle(self, finished: bool) -> None:
+        """End a purge cycle."""
+        assert self._cycle_start is not None
+        self.elapsed += time.monotonic() - self._cycle_start
+        self._cycle_start = None
+        self.cycles += 1
+        self.states_purged += self._cycle_states
+        self.events_purged += self._cycle_events
+        if finished:
+            self.finished = dt_util.utcnow()
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of purged rows per second of purging."""
+        if not self.elapsed:
+            return None
+        return (self.states_purged + self.events_purged) / self.elapsed
+
+    @property
+    def eta(self) -> float | None:
+        """Return the estimated seconds of purging left.
+
+        Counting the rows that are left is too slow on large databases,
+        instead the estimate is based on how fast the oldest state moves
+        towards purge_before.
+        """
+        if self.finished is not None:
+            return 0.0
+        if (
+            self.purge_before is None
+            or self.first_oldest_ts is None
+            or self.oldest_ts is None
+            or not self.oldest_elapsed
+        ):
+            return None
+        if (left := self.purge_before.timestamp() - self.oldest_ts) <= 0:
+            return 0.0
+        if (purged := self.oldest_ts - self.first_oldest_ts) <= 0:
+            return None
+        return left * self.oldest_elapsed / purged
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before and self.purge_before.timestamp(),
+            "started": self.started and self.started.timestamp(),
+            "finished": self.finished and self.finished.timestamp(),
+            "cycles": self.cycles,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "elapsed": self.elapsed,
+            "rows_per_second": self.rows_per_second,
+            "eta": self.eta,
+        }
 
 
 @retryable_database_job("purge")
@@ -62,90 +180,264 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = DEFAULT_PURGE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Batches are purged until the time budget is used up. At least one
+    batch of each kind is purged per call so the purge always makes
+    progress. Entities with a retention override in entity_keep_days
+    are purged by their own cutoff in the same pass.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = time.monotonic() + time_budget
+    progress = instance.purge_progress
     with session_scope(session=instance.get_session()) as session:
-        # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
-        has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
-            _LOGGER.debug(
-                "Purge running in legacy format as there are states with event_id"
-                " remaining"
-            )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
-        else:
-            _LOGGER.debug(
-                "Purge running in new format as there are NO states with event_id"
-                " remaining"
-            )
-            # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
-
-        statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before
+        progress.start_cycle(
+            purge_before, session.execute(find_oldest_state_ts()).scalar()
+        )
+        finished = _purge_old_data(
+            instance,
+            session,
+            purge_before,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            deadline,
         )
-        if statistics_runs:
-            _purge_statistics_runs(session, statistics_runs)
+        progress.end_cycle(finished)
+    _log_purge_progress(progress)
+    if finished and repack:
+        repack_database(instance)
+    return finished
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
-            # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
-            return False
+def _log_purge_progress(progress: PurgeProgress) -> None:
+    """Log the rate and the estimated time left of the purge run."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    _LOGGER.debug(
+        "Purged %s states and %s events in %s cycles (%.1f rows/s), "
+        "estimated time left: %s",
+        progress.states_purged,
+        progress.events_purged,
+        progress.cycles,
+        progress.rows_per_second or 0,
+        "unknown" if (eta := progress.eta) is None else timedelta(seconds=int(eta)),
+    )
 
-        if apply_filter and _purge_filtered_data(instance, session) is False:
-            _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
-            return False
 
-        # This purge cycle is finished, clean up old event types and
-        # recorder runs
-        if instance.event_type_manager.active:
-            _purge_old_event_types(instance, session)
+def _purge_old_data(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+) -> bool:
+    """Run a purge cycle and return True if the purge is finished."""
+    # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
+    has_more_to_purge = False
+    kept_metadata_ids, entity_purge_before = _entity_retention_overrides(
+        instance, session, purge_before
+    )
+    if instance.use_legacy_events_index and _purging_legacy_format(session):
+        _LOGGER.debug(
+            "Purge running in legacy format as there are states with event_id"
+            " remaining"
+        )
+        has_more_to_purge |= _purge_legacy_format(
+            instance, session, purge_before, deadline, kept_metadata_ids
+        )
+    else:
+        _LOGGER.debug(
+            "Purge running in new format as there are NO states with event_id"
+            " remaining"
+        )
+        # Once we are done purging legacy rows, we use the new method
+        has_more_to_purge |= _purge_states_and_attributes_ids(
+            instance,
+            session,
+            states_batch_size,
+            purge_before,
+            deadline,
+            kept_metadata_ids,
+        )
+        has_more_to_purge |= _purge_events_and_data_ids(
+            instance, session, events_batch_size, purge_before, deadline
+        )
+    if entity_purge_before:
+        has_more_to_purge |= _purge_entity_retention_overrides(
+            instance, session, entity_purge_before, deadline
+        )
+
+    statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
+    short_term_statistics = _select_short_term_statistics_to_purge(
+        session, purge_before
+    )
+    if statistics_runs:
+        _purge_statistics_runs(session, statistics_runs)
 
-        if instance.states_meta_manager.active:
-            _purge_old_entity_ids(instance, session)
+    if short_term_statistics:
+        _purge_short_term_statistics(session, short_term_statistics)
 
-        _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
+    if has_more_to_purge or statistics_runs or short_term_statistics:
+        # Return false, as we might not be done yet.
+        _LOGGER.debug("Purging hasn't fully completed yet")
+        return False
+
+    if apply_filter and _purge_filtered_data(instance, session) is False:
+        _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+        return False
+
+    # This purge cycle is finished, clean up old event types and
+    # recorder runs
+    if instance.event_type_manager.active:
+        _purge_old_event_types(instance, session)
+
+    if instance.states_meta_manager.active:
+        _purge_old_entity_ids(instance, session)
+
+    _purge_old_recorder_runs(instance, session, purge_before)
     return True
 
 
+def _entity_retention_overrides(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> tuple[list[int], dict[float, list[int]]]:
+    """Return the retention overrides of entity_keep_days.
+
+    Returns the metadata_ids that are kept longer than purge_before, and
+    the metadata_ids of all entities with an override grouped by the
+    timestamp to purge them before.
+    """
+    if not instance.entity_keep_days or not instance.states_meta_manager.active:
+        return [], {}
+    now = dt_util.utcnow()
+    purge_before_ts = purge_before.timestamp()
+    kept_metadata_ids: list[int] = []
+    entity_purge_before: dict[float, list[int]] = {}
+    for entity_id, metadata_id in instance.states_meta_manager.get_many(
+        instance.entity_keep_days, session, True
+    ).items():
+        if metadata_id is None:
+            continue
+        entity_purge_before_ts = (
+            now - timedelta(days=instance.entity_keep_days[entity_id])
+        ).timestamp()
+        if entity_purge_before_ts < purge_before_ts:
+            kept_metadata_ids.append(metadata_id)
+        entity_purge_before.setdefault(entity_purge_before_ts, []).append(metadata_id)
+    return kept_metadata_ids, entity_purge_before
+
+
+def _purge_entity_retention_overrides(
+    instance: Recorder,
+    session: Session,
+    entity_purge_before: dict[float, list[int]],
+    deadline: float,
+) -> bool:
+    """Purge the states of entities with a retention override.
+
+    Returns true if there are more states to purge.
+    """
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    for purge_before_ts, metadata_ids in entity_purge_before.items():
+        while not _purge_filtered_states(
+            instance, session, metadata_ids, database_engine, purge_before_ts
+        ):
+            if time.monotonic() >= deadline:
+                return True
+    return False
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    deadline: float,
+    kept_metadata_ids: list[int],
 ) -> bool:
-    """Purge rows that are still linked by the event_ids."""
+    """Purge rows that are still linked by the event_ids.
+
+    The states of kept_metadata_ids are left to the retention override
+    of their entity. They are unlinked from their event instead, so the
+    purge can switch to the new format once the other legacy rows are
+    gone.
+
+    Returns true if rows were purged or unlinked, the next cycle checks
+    again if there are legacy rows left.
+    """
+    has_purged = bool(kept_metadata_ids) and _unlink_legacy_states(
+        session, purge_before, deadline, kept_metadata_ids
+    )
+    if has_purged and time.monotonic() >= deadline:
+        return True
+    while _purge_legacy_format_batch(
+        instance, session, purge_before, kept_metadata_ids
+    ):
+        has_purged = True
+        if time.monotonic() >= deadline:
+            break
+    return has_purged
+
+
+def _unlink_legacy_states(
+    session: Session,
+    purge_before: datetime,
+    deadline: float,
+    kept_metadata_ids: list[int],
+) -> bool:
+    """Unlink the legacy states of kept_metadata_ids from their event.
+
+    Returns true if states were unlinked.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    has_unlinked = False
+    while state_ids := {
+        state_id
+        for (state_id,) in session.execute(
+            find_legacy_states_to_unlink(purge_before_ts, kept_metadata_ids)
+        ).all()
+    }:
+        session.execute(unlink_legacy_states_rows(state_ids))
+        _LOGGER.debug("Unlinked %s legacy states that are kept", len(state_ids))
+        has_unlinked = True
+        if time.monotonic() >= deadline:
+            break
+    return has_unlinked
+
+
+def _purge_legacy_format_batch(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    kept_metadata_ids: list[int],
+) -> bool:
+    """Purge a batch of rows that are still linked by the event_ids."""
     (
         event_ids,
         state_ids,
         attributes_ids,
         data_ids,
     ) = _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
-        session, purge_before
+        session, purge_before, kept_metadata_ids
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -157,7 +449,7 @@ def _purge_legacy_format(
         detached_state_ids,
         detached_attributes_ids,
     ) = _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
-        session, purge_before
+        session, purge_before, kept_metadata_ids
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
@@ -176,9 +468,14 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
+    kept_metadata_ids: list[int],
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
+    The states of kept_metadata_ids are left to the retention override
+    of their entity.
+
     Returns true if there are more states to purge.
     """
     database_engine = instance.database_engine
@@ -191,13 +488,15 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before
+            session, purge_before, kept_metadata_ids
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -212,6 +511,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -228,8 +528,10 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -240,14 +542,19 @@ def _purge_events_and_data_ids(
 
 
 def _select_state_attributes_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, kept_metadata_ids: list[int]
 ) -> tuple[set[int], set[int]]:
     """Return sets of state and attribute ids to purge."""
     state_ids = set()
     attributes_ids = set()
-    for state_id, attributes_id in session.execute(
-        find_states_to_purge(dt_util.utc_to_timestamp(purge_before))
-    ).all():
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    if kept_metadata_ids:
+        stmt = find_states_to_purge_excluding_metadata_ids(
+            purge_before_ts, kept_metadata_ids
+        )
+    else:
+        stmt = find_states_to_purge(purge_before_ts)
+    for state_id, attributes_id in session.execute(stmt).all():
         state_ids.add(state_id)
         if attributes_id:
             attributes_ids.add(attributes_id)
@@ -435,7 +742,7 @@ def _select_short_term_statistics_to_purge(
 
 
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, kept_metadata_ids: list[int]
 ) -> tuple[set[int], set[int]]:
     """Return a list of state, and attribute ids to purge.
 
@@ -443,11 +750,14 @@ def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     do not exist in the events table anymore, however we
     still need to be able to purge them.
     """
-    states = session.execute(
-        find_legacy_detached_states_and_attributes_to_purge(
-            dt_util.utc_to_timestamp(purge_before)
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    if kept_metadata_ids:
+        stmt = find_legacy_detached_states_to_purge_excluding_metadata_ids(
+            purge_before_ts, kept_metadata_ids
         )
-    ).all()
+    else:
+        stmt = find_legacy_detached_states_and_attributes_to_purge(purge_before_ts)
+    states = session.execute(stmt).all()
     _LOGGER.debug("Selected %s state ids to remove", len(states))
     state_ids = set()
     attributes_ids = set()
@@ -460,7 +770,7 @@ def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
 
 
 def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, purge_before: datetime, kept_metadata_ids: list[int]
 ) -> tuple[set[int], set[int], set[int], set[int]]:
     """Return a list of event, state, and attribute ids to purge linked by the event_id.
 
@@ -468,11 +778,16 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     do not exist in the events table anymore, however we
     still need to be able to purge them.
     """
-    events = session.execute(
-        find_legacy_event_state_and_attributes_and_data_ids_to_purge(
-            dt_util.utc_to_timestamp(purge_before)
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    if kept_metadata_ids:
+        stmt = find_legacy_rows_to_purge_excluding_metadata_ids(
+            purge_before_ts, kept_metadata_ids
         )
-    ).all()
+    else:
+        stmt = find_legacy_event_state_and_attributes_and_data_ids_to_purge(
+            purge_before_ts
+        )
+    events = session.execute(stmt).all()
     _LOGGER.debug("Selected %s event ids to remove", len(events))
     event_ids = set()
     state_ids = set()
@@ -503,6 +818,7 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 
     deleted_rows = session.execute(delete_states_rows(state_ids))
     _LOGGER.debug("Deleted %s states", deleted_rows)
+    instance.purge_progress.add_states(len(state_ids))
 
     # Evict eny entries in the old_states cache referring to a purged state
     instance.states_manager.evict_purged_state_ids(state_ids)
@@ -550,12 +866,13 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
+    instance.purge_progress.add_events(len(event_ids))
 
 
 def _purge_old_recorder_runs(
@@ -620,7 +937,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -656,7 +973,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -685,7 +1002,7 @@ def _purge_filtered_states(
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
+    _purge_event_ids(instance, session, filtered_event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
         session, {id_ for id_ in attributes_ids if id_ is not None}, database_engine
     )
@@ -732,7 +1049,7 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
     if unused_data_ids_set := _select_unused_event_data_ids(
         session, set(data_ids), database_engine
     ):
@@ -749,7 +1066,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
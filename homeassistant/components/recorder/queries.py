@@ -42,6 +42,25 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def find_recent_shared_attributes(limit: int) -> Select:
+    """Find the shared attributes of the most recently recorded states.
+
+    This query is intentionally not a lambda statement as it
+    only runs once at startup.
+    """
+    recent_states = (
+        select(States.attributes_id)
+        .order_by(States.state_id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    recent_attributes_ids = select(recent_states.c.attributes_id).distinct().subquery()
+    return select(StateAttributes.attributes_id, StateAttributes.shared_attrs).join(
+        recent_attributes_ids,
+        StateAttributes.attributes_id == recent_attributes_ids.c.attributes_id,
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -542,6 +561,16 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def unlink_legacy_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Unlink states rows from their legacy state_changed event."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.state_id.in_(state_ids))
+        .values(event_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
@@ -634,6 +663,25 @@ def find_states_to_purge(purge_before: float) -> StatementLambdaElement:
     )
 
 
+def find_states_to_purge_excluding_metadata_ids(
+    purge_before: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Find states to purge that do not belong to the given metadata_ids."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id)
+        .filter(States.last_updated_ts < purge_before)
+        .filter(States.metadata_id.not_in(metadata_ids) | States.metadata_id.is_(None))
+        .limit(SQLITE_MAX_BIND_VARS)
+    )
+
+
+def find_oldest_state_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest state."""
+    # https://github.com/sqlalchemy/sqlalchemy/issues/9189
+    # pylint: disable-next=not-callable
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime,
 ) -> StatementLambdaElement:
@@ -694,6 +742,57 @@ def find_legacy_detached_states_and_attributes_to_purge(
     )
 
 
+def find_legacy_rows_to_purge_excluding_metadata_ids(
+    purge_before: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Find the latest row in the legacy format to purge.
+
+    Events linked to states of the given metadata_ids are left alone.
+    """
+    return lambda_stmt(
+        lambda: select(
+            Events.event_id, Events.data_id, States.state_id, States.attributes_id
+        )
+        .outerjoin(States, Events.event_id == States.event_id)
+        .filter(Events.time_fired_ts < purge_before)
+        .filter(States.metadata_id.not_in(metadata_ids) | States.metadata_id.is_(None))
+        .limit(SQLITE_MAX_BIND_VARS)
+    )
+
+
+def find_legacy_detached_states_to_purge_excluding_metadata_ids(
+    purge_before: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Find states rows with event_id set but not linked event_id in Events.
+
+    States of the given metadata_ids are left alone.
+    """
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id)
+        .outerjoin(Events, States.event_id == Events.event_id)
+        .filter(States.event_id.isnot(None))
+        .filter(
+            (States.last_updated_ts < purge_before) | States.last_updated_ts.is_(None)
+        )
+        .filter(Events.event_id.is_(None))
+        .filter(States.metadata_id.not_in(metadata_ids) | States.metadata_id.is_(None))
+        .limit(SQLITE_MAX_BIND_VARS)
+    )
+
+
+def find_legacy_states_to_unlink(
+    purge_before: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Find states rows of the given metadata_ids still linked by event_id."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.metadata_id.in_(metadata_ids))
+        .filter(States.event_id.isnot(None))
+        .filter(States.last_updated_ts < purge_before)
+        .limit(SQLITE_MAX_BIND_VARS)
+    )
+
+
 def find_legacy_row() -> StatementLambdaElement:
     """Check if there are still states in the table with an event_id."""
     # https://github.com/sqlalchemy/sqlalchemy/issues/9189
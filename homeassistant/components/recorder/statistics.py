@@ -1,6 +1,7 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import contextlib
@@ -11,7 +12,7 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from statistics import mean
+from statistics import fmean, mean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
@@ -882,6 +883,112 @@ def _reduce_statistics(
     return result
 
 
+def _period_boundaries(
+    period_start_end: Callable[[float], tuple[float, float]],
+    first_start: float,
+    last_start: float,
+) -> list[float]:
+    """Return the boundaries of the consecutive periods from first to last start."""
+    start, end = period_start_end(first_start)
+    boundaries = [start, end]
+    while end <= last_start:
+        end = period_start_end(end)[1]
+        boundaries.append(end)
+    return boundaries
+
+
+def _column(stat_list: list[StatisticsRow], key: str) -> list[float | None]:
+    """Return a column of statistics rows."""
+    return [statistic.get(key) for statistic in stat_list]  # type: ignore[misc]
+
+
+def _reduce_column(
+    column: list[float | None],
+    lo: int,
+    hi: int,
+    reducer: Callable[[list[float]], float],
+) -> float | None:
+    """Reduce a slice of a column, ignoring missing values."""
+    values = column[lo:hi]
+    if None in values:
+        values = [value for value in values if value is not None]
+    return reducer(cast(list[float], values)) if values else None
+
+
+def _reduce_statistics_batched(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics in bulk.
+
+    The period boundaries are calculated once for all statistics, each
+    statistic is split into periods by bisecting its start column and
+    mean, min and max are aggregated over column slices.
+
+    Statistics which are not ordered by start are reduced row by row
+    by _reduce_statistics.
+    """
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    if not (stats := {key: value for key, value in stats.items() if value}):
+        return result
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    boundaries = _period_boundaries(
+        period_start_end,
+        min(stat_list[0]["start"] for stat_list in stats.values()),
+        max(stat_list[-1]["start"] for stat_list in stats.values()),
+    )
+    for statistic_id, stat_list in stats.items():
+        starts = [statistic["start"] for statistic in stat_list]
+        if starts != sorted(starts):
+            result.update(
+                _reduce_statistics(
+                    {statistic_id: stat_list},
+                    same_period,
+                    period_start_end,
+                    period,
+                    types,
+                )
+            )
+            continue
+        mean_column = _column(stat_list, "mean") if _want_mean else []
+        min_column = _column(stat_list, "min") if _want_min else []
+        max_column = _column(stat_list, "max") if _want_max else []
+        reduced = result[statistic_id]
+        boundary_idx = 0
+        num_rows = len(starts)
+        lo = 0
+        while lo < num_rows:
+            boundary_idx = bisect_right(boundaries, starts[lo], boundary_idx) - 1
+            end = boundaries[boundary_idx + 1]
+            hi = bisect_left(starts, end, lo)
+            last_stat = stat_list[hi - 1]
+            row: StatisticsRow = {"start": boundaries[boundary_idx], "end": end}
+            if _want_mean:
+                row["mean"] = _reduce_column(mean_column, lo, hi, fmean)
+            if _want_min:
+                row["min"] = _reduce_column(min_column, lo, hi, min)
+            if _want_max:
+                row["max"] = _reduce_column(max_column, lo, hi, max)
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            reduced.append(row)
+            lo = hi
+
+    return result
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -925,7 +1032,7 @@ def _reduce_statistics_per_day(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
     _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_batched(
         stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
     )
 
@@ -975,7 +1082,7 @@ def _reduce_statistics_per_week(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
     _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_batched(
         stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
     )
 
@@ -1027,7 +1134,7 @@ def _reduce_statistics_per_month(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
     _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_batched(
         stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
     )
 
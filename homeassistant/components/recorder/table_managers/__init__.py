@@ -1,7 +1,8 @@
 """Managers for each table."""
 
-from collections.abc import MutableMapping
-from typing import TYPE_CHECKING, Generic, TypeVar
+from collections import OrderedDict
+from collections.abc import ItemsView, Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from lru import LRU  # pylint: disable=no-name-in-module
 
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
 
 _DataT = TypeVar("_DataT")
 
+# Estimated memory used by a cache entry besides the shared data itself
+ENTRY_OVERHEAD_BYTES = 128
+
 
 class BaseTableManager(Generic[_DataT]):
     """Base class for table managers."""
@@ -73,3 +77,140 @@ class BaseLRUTableManager(BaseTableManager[_DataT]):
         lru: LRU = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class SizeLimitedLRU(MutableMapping[str, int]):
+    """LRU of shared data to ids limited by the memory the shared data takes.
+
+    Large shared data counts for its size so a few large entries can not
+    push out many small ones. Shared data larger than max_entry_bytes is
+    not cached at all.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        """Initialize the LRU."""
+        self._data: OrderedDict[str, int] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the id of shared data and mark it as recently used."""
+        if (value := self._data.get(key)) is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def __getitem__(self, key: str) -> int:
+        """Return the id of shared data."""
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: int) -> None:
+        """Add the id of shared data and evict the least recently used."""
+        data = self._data
+        if key in data:
+            data[key] = value
+            data.move_to_end(key)
+            return
+        if (entry_bytes := len(key) + ENTRY_OVERHEAD_BYTES) > self._max_entry_bytes:
+            return
+        data[key] = value
+        self._bytes += entry_bytes
+        while self._bytes > self._max_bytes:
+            evicted, _ = data.popitem(last=False)
+            self._bytes -= len(evicted) + ENTRY_OVERHEAD_BYTES
+            self.evictions += 1
+
+    def __delitem__(self, key: str) -> None:
+        """Remove shared data."""
+        del self._data[key]
+        self._bytes -= len(key) + ENTRY_OVERHEAD_BYTES
+
+    def __contains__(self, key: object) -> bool:
+        """Return if shared data is cached."""
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the cached shared data."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+    def items(self) -> ItemsView[str, int]:
+        """Return the cached shared data and ids."""
+        return self._data.items()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._bytes = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Return the maximum memory the cache may use."""
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Change the maximum memory the cache may use."""
+        self._max_bytes = max_bytes
+        while self._bytes > max_bytes:
+            evicted, _ = self._data.popitem(last=False)
+            self._bytes -= len(evicted) + ENTRY_OVERHEAD_BYTES
+            self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class BaseSizeLimitedLRUTableManager(BaseTableManager[_DataT]):
+    """Base class for table managers of shared data with a size limited LRU."""
+
+    def __init__(
+        self,
+        recorder: "Recorder",
+        max_bytes: int,
+        max_entry_bytes: int,
+        bytes_per_entry: int,
+    ) -> None:
+        """Initialize the size limited LRU table manager.
+
+        We keep track of the most recently used shared data and evict the
+        least recently used when the memory used by the cache is too high.
+        bytes_per_entry is the expected size of an average entry.
+        """
+        super().__init__(recorder)
+        self._lru = SizeLimitedLRU(max_bytes, max_entry_bytes)
+        self._id_map = self._lru
+        self._bytes_per_entry = bytes_per_entry
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size to fit new_size average entries.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (new_max_bytes := new_size * self._bytes_per_entry) > self._lru.max_bytes:
+            self._lru.set_max_bytes(new_max_bytes)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return the cache statistics.
+
+        Counters are only updated from the recorder thread but
+        may be read from any thread.
+        """
+        return self._lru.stats()
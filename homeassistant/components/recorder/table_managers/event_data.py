@@ -10,7 +10,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from . import BaseLRUTableManager
+from . import BaseSizeLimitedLRUTableManager
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
@@ -20,17 +20,21 @@ if TYPE_CHECKING:
     from ..core import Recorder
 
 
-CACHE_SIZE = 2048
+CACHE_BYTES_PER_ENTRY = 512
+CACHE_SIZE_BYTES = 2048 * CACHE_BYTES_PER_ENTRY
+CACHE_MAX_ENTRY_BYTES = 64 * 1024
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseSizeLimitedLRUTableManager[EventData]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(
+            recorder, CACHE_SIZE_BYTES, CACHE_MAX_ENTRY_BYTES, CACHE_BYTES_PER_ENTRY
+        )
         self.active = True  # always active
 
     def serialize_from_event(self, event: Event) -> bytes | None:
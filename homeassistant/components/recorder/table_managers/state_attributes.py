@@ -11,34 +11,41 @@ from homeassistant.core import Event
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from . import BaseLRUTableManager
+from . import BaseSizeLimitedLRUTableManager
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import chunked, execute_stmt_lambda_element
 
 if TYPE_CHECKING:
     from ..core import Recorder
 
-# The number of attribute ids to cache in memory
+# The memory used to cache attribute ids
 #
 # Based on:
 # - The number of overlapping attributes
 # - How frequently states with overlapping attributes will change
 # - How much memory our low end hardware has
-CACHE_SIZE = 2048
+CACHE_BYTES_PER_ENTRY = 512
+CACHE_SIZE_BYTES = 2048 * CACHE_BYTES_PER_ENTRY
+# Large attributes that would push out many small ones are not cached
+CACHE_MAX_ENTRY_BYTES = 64 * 1024
+# The number of most recent states to load the attributes ids of at startup
+PREWARM_STATES = 4096
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseSizeLimitedLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(
         self, recorder: Recorder, exclude_attributes_by_domain: dict[str, set[str]]
     ) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(
+            recorder, CACHE_SIZE_BYTES, CACHE_MAX_ENTRY_BYTES, CACHE_BYTES_PER_ENTRY
+        )
         self.active = True  # always active
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
         self._entity_sources = entity_sources(recorder.hass)
@@ -73,6 +80,20 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the attributes_ids of the most recent states into memory.
+
+        Called at startup so the first states that are recorded do not
+        each need a query to find their attributes_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for attributes_id, shared_attrs in session.execute(
+            find_recent_shared_attributes(PREWARM_STATES)
+        ):
+            self._id_map[shared_attrs] = attributes_id
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -508,6 +508,11 @@ def ws_info(
         "migration_is_live": migration_is_live,
         "recording": recording,
         "thread_running": thread_alive,
+        "caches": {
+            "state_attributes": instance.state_attributes_manager.cache_stats(),
+            "event_data": instance.event_data_manager.cache_stats(),
+        },
+        "purge": instance.purge_progress.as_dict(),
     }
     connection.send_result(msg["id"], recorder_info)
 
@@ -9,7 +9,15 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
-from . import commands, connection, const, decorators, http, messages  # noqa: F401
+from . import (  # noqa: F401
+    commands,
+    connection,
+    const,
+    decorators,
+    http,
+    messages,
+    snapshot,
+)
 from .connection import ActiveConnection, current_connection  # noqa: F401
 from .const import (  # noqa: F401
     ERR_HOME_ASSISTANT_ERROR,
@@ -67,4 +75,5 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
     hass.http.register_view(http.WebsocketAPIView())
     commands.async_register_commands(hass, async_register_command)
+    snapshot.async_get_states_snapshot(hass)
     return True
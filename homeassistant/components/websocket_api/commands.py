@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from contextlib import suppress
 import datetime as dt
-from functools import lru_cache
+from functools import lru_cache, partial
 import json
 from typing import Any, cast
 
@@ -43,12 +42,17 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
+from .snapshot import async_get_states_snapshot
 
 
 @callback
@@ -62,6 +66,7 @@ def async_register_commands(
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
+    async_reg(hass, handle_get_connection_stats)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
@@ -242,33 +247,23 @@ def handle_get_states(
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.result_message(msg["id"], states)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
+    # The snapshot serializes each state once for all connections and
+    # leaves out states containing unserializable data. This command is
+    # required to succeed for the UI to show.
+    states_json, unserializable = async_get_states_snapshot(hass).async_states_json(
+        states, connection.user.permissions.access_all_entities("read")
+    )
+    if unserializable:
         connection.logger.error(
             "Unable to serialize to JSON. Bad data found at %s",
             format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
+                find_paths_unserializable_data(
+                    messages.result_message(msg["id"], states), dump=JSON_DUMP
+                )
             ),
         )
-    del response
 
-    # If we can't serialize, we'll filter out unserializable states
-    serialized = []
-    for state in states:
-        # Error is already logged above
-        with suppress(ValueError, TypeError):
-            serialized.append(JSON_DUMP(state))
-
-    # We now have partially serialized states. Craft some JSON.
-    response2 = JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
-    response2 = response2.replace('"TO_REPLACE"', ", ".join(serialized))
-    connection.send_message(response2)
+    connection.send_message(messages.construct_result_message(msg["id"], states_json))
 
 
 @callback
@@ -283,18 +278,46 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    # Changes that are queued while the client is behind, keyed by entity_id
+    # with the state the client last received and the latest event
+    pending_changes: dict[str, tuple[State | None, Event]] = {}
+
+    @callback
+    def pending_change_message(entity_id: str) -> str:
+        """Build the message of a queued change when it is written."""
+        old_state, event = pending_changes.pop(entity_id)
+        if old_state is event.data["old_state"]:
+            return messages.cached_state_diff_message(msg["id"], event)
+        return messages.state_diff_message(
+            msg["id"], entity_id, old_state, event.data["new_state"]
+        )
 
     @callback
     def forward_entity_changes(event: Event) -> None:
         """Forward entity state changed events to websocket."""
-        if not connection.user.permissions.check_entity(
-            event.data["entity_id"], POLICY_READ
-        ):
+        entity_id = event.data["entity_id"]
+        if not connection.user.permissions.check_entity(entity_id, POLICY_READ):
             return
-        if entity_ids and event.data["entity_id"] not in entity_ids:
+        if entity_ids and entity_id not in entity_ids:
             return
 
-        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+        if (pending_change := pending_changes.get(entity_id)) is not None:
+            # The previous change has not been written yet, so this
+            # change supersedes it
+            pending_changes[entity_id] = (pending_change[0], event)
+            connection.stats.entity_changes_collapsed += 1
+            return
+
+        if connection.stats.queue_depth < const.PENDING_MSG_COLLAPSE:
+            connection.send_message(
+                messages.cached_state_diff_message(msg["id"], event)
+            )
+            return
+
+        # The client is behind, build the message when it gets written
+        # so later changes of the entity can be collapsed into it
+        pending_changes[entity_id] = (event.data["old_state"], event)
+        connection.send_message(partial(pending_change_message, entity_id))
 
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
@@ -304,42 +327,42 @@ def handle_subscribe_entities(
         EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
     )
     connection.send_result(msg["id"])
-    data: dict[str, dict[str, dict]] = {
-        messages.ENTITY_EVENT_ADD: {
-            state.entity_id: state.as_compressed_state()
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        }
-    }
-
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.event_message(msg["id"], data)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
+    if entity_ids:
+        states = [state for state in states if state.entity_id in entity_ids]
+
+    # The snapshot serializes each state once for all connections and
+    # leaves out states containing unserializable data. This command is
+    # required to succeed for the UI to show.
+    states_json, unserializable = async_get_states_snapshot(
+        hass
+    ).async_compressed_states_json(
+        states,
+        not entity_ids and connection.user.permissions.access_all_entities("read"),
+    )
+    if unserializable:
         connection.logger.error(
             "Unable to serialize to JSON. Bad data found at %s",
             format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
+                find_paths_unserializable_data(
+                    messages.event_message(
+                        msg["id"],
+                        {
+                            messages.ENTITY_EVENT_ADD: {
+                                state.entity_id: state.as_compressed_state()
+                                for state in unserializable
+                            }
+                        },
+                    ),
+                    dump=JSON_DUMP,
+                )
             ),
         )
-    del response
-
-    add_entities = data[messages.ENTITY_EVENT_ADD]
-    cannot_serialize: list[str] = []
-    for entity_id, state_dict in add_entities.items():
-        try:
-            JSON_DUMP(state_dict)
-        except (ValueError, TypeError):
-            cannot_serialize.append(entity_id)
-
-    for entity_id in cannot_serialize:
-        del add_entities[entity_id]
 
-    connection.send_message(JSON_DUMP(messages.event_message(msg["id"], data)))
+    connection.send_message(
+        messages.construct_event_message(
+            msg["id"], f'{{"{messages.ENTITY_EVENT_ADD}":{states_json}}}'
+        )
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -405,15 +428,19 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
-    connection.send_result(
-        msg["id"],
-        [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
-            for integration, timedelta in cast(
-                dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
-            ).items()
-        ],
-    )
+    timeline: dict[str, dict[str, dt.datetime]] = hass.data.get(DATA_SETUP_TIMELINE, {})
+    setup_info: list[dict[str, Any]] = []
+    for integration, timedelta in cast(
+        dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
+    ).items():
+        info: dict[str, Any] = {
+            "domain": integration,
+            "seconds": timedelta.total_seconds(),
+        }
+        if integration in timeline:
+            info["timeline"] = timeline[integration]
+        setup_info.append(info)
+    connection.send_result(msg["id"], setup_info)
 
 
 @callback
@@ -719,6 +746,15 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_connection_stats"})
+def handle_get_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get connection stats command."""
+    connection.send_result(msg["id"], connection.stats.as_dict())
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
@@ -4,6 +4,8 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -29,6 +31,34 @@ MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], N
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
 
 
+@dataclass(slots=True)
+class ConnectionStats:
+    """Counters of the messages written to a connection."""
+
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    messages_sent: int = 0
+    # Uncompressed length of the sent payloads
+    bytes_sent: int = 0
+    entity_changes_collapsed: int = 0
+    # Negotiated permessage-deflate window bits, False if not negotiated
+    compression: int | bool = False
+    connected: float = field(default_factory=monotonic)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dict."""
+        connected_seconds = max(monotonic() - self.connected, 1e-3)
+        return {
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "messages_sent": self.messages_sent,
+            "bytes_sent": self.bytes_sent,
+            "bytes_per_second": round(self.bytes_sent / connected_seconds, 1),
+            "entity_changes_collapsed": self.entity_changes_collapsed,
+            "compression": self.compression,
+        }
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -53,6 +83,7 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.stats = ConnectionStats()
         current_connection.set(self)
 
     def get_description(self, request: web.Request | None) -> str:
@@ -23,6 +23,9 @@ DOMAIN: Final = "websocket_api"
 URL: Final = "/api/websocket"
 PENDING_MSG_PEAK: Final = 1024
 PENDING_MSG_PEAK_TIME: Final = 5
+# Number of pending messages after which changes of the same entity
+# are collapsed into a single message until the client catches up.
+PENDING_MSG_COLLAPSE: Final = 256
 # Maximum number of messages that can be pending at any given time.
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
@@ -55,3 +58,6 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Data used to store the shared snapshot of the states
+DATA_STATES_SNAPSHOT: Final = f"{DOMAIN}.states_snapshot"
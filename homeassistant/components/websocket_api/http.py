@@ -105,6 +105,7 @@ class WebSocketHandler:
                         not in self.connection.supported_features
                     ):
                         logger.debug("Sending %s", message)
+                        self._record_sent(message, 1)
                         await wsock.send_str(message)
                         continue
 
@@ -118,11 +119,22 @@ class WebSocketHandler:
 
                     coalesced_messages = "[" + ",".join(messages) + "]"
                     logger.debug("Sending %s", coalesced_messages)
+                    self._record_sent(coalesced_messages, len(messages))
                     await wsock.send_str(coalesced_messages)
         finally:
             # Clean up the peaker checker when we shut down the writer
             self._cancel_peak_checker()
 
+    @callback
+    def _record_sent(self, message: str, count: int) -> None:
+        """Update the connection counters after taking messages off the queue."""
+        if (connection := self.connection) is None:
+            return
+        stats = connection.stats
+        stats.messages_sent += count
+        stats.bytes_sent += len(message)
+        stats.queue_depth = self._to_write.qsize()
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -163,9 +175,16 @@ class WebSocketHandler:
             )
             self._cancel()
 
+        queue_depth = to_write.qsize()
+        if (connection := self.connection) is not None:
+            stats = connection.stats
+            stats.queue_depth = queue_depth
+            if queue_depth > stats.peak_queue_depth:
+                stats.peak_queue_depth = queue_depth
+
         peak_checker_active = self._peak_checker_unsub is not None
 
-        if to_write.qsize() < PENDING_MSG_PEAK:
+        if queue_depth < PENDING_MSG_PEAK:
             if peak_checker_active:
                 self._cancel_peak_checker()
             return
@@ -263,6 +282,9 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             self.connection = connection = await auth.async_handle(msg_data)
+            # aiohttp negotiates permessage-deflate during the handshake when
+            # the client offers it, reusing one compressor per connection
+            connection.stats.compression = wsock.compress
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -49,6 +49,16 @@ def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message JSON from a serialized result."""
+    return f'{{"id":{iden},"type":"result","success":true,"result":{payload}}}'
+
+
+def construct_event_message(iden: int, payload: str) -> str:
+    """Construct an event message JSON from a serialized event."""
+    return f'{{"id":{iden},"type":"event","event":{payload}}}'
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -108,6 +118,19 @@ def _cached_state_diff_message(event: Event) -> str:
     return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
 
 
+def state_diff_message(
+    iden: int, entity_id: str, old_state: State | None, new_state: State | None
+) -> str:
+    """Return an event message with the changes between two states of an entity.
+
+    Used when several state changes of an entity are sent as one message,
+    so unlike cached_state_diff_message the result is not cached.
+    """
+    return message_to_json(
+        event_message(iden, _state_diff_states(entity_id, old_state, new_state))
+    )
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -119,17 +142,24 @@ def _state_diff_event(event: Event) -> dict:
         "r": [entity_id,…]
     }
     """
-    if (event_new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    assert isinstance(event_new_state, State)
-    if (event_old_state := event.data["old_state"]) is None:
+    return _state_diff_states(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def _state_diff_states(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict:
+    """Convert the old and new state of an entity to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    assert isinstance(new_state, State)
+    if old_state is None:
         return {
-            ENTITY_EVENT_ADD: {
-                event_new_state.entity_id: event_new_state.as_compressed_state()
-            }
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state()}
         }
-    assert isinstance(event_old_state, State)
-    return _state_diff(event_old_state, event_new_state)
+    assert isinstance(old_state, State)
+    return _state_diff(old_state, new_state)
 
 
 def _state_diff(
@@ -0,0 +1,128 @@
+"""Shared JSON snapshot of the state machine for websocket connections."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import JSON_DUMP
+
+from .const import DATA_STATES_SNAPSHOT
+
+
+def _state_dict_json(state: State) -> str:
+    """Serialize a state to the get_states format."""
+    return JSON_DUMP(state.as_dict())
+
+
+def _compressed_state_json(state: State) -> str:
+    """Serialize a state to a subscribe_entities addition."""
+    return f"{JSON_DUMP(state.entity_id)}:{JSON_DUMP(state.as_compressed_state())}"
+
+
+class StatesSnapshot:
+    """Incrementally maintained JSON of all states.
+
+    Every state is serialized once and the JSON fragment is shared by
+    all connections until the state changes. The joined payload for
+    connections that can read all entities is cached as well, so a
+    reconnecting client only costs a string copy.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._dict_fragments: dict[str, str] = {}
+        self._compressed_fragments: dict[str, str] = {}
+        self._all_dict_json: str | None = None
+        self._all_compressed_json: str | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start following state changes."""
+        self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Drop the fragments of a changed state."""
+        entity_id = event.data["entity_id"]
+        self._dict_fragments.pop(entity_id, None)
+        self._compressed_fragments.pop(entity_id, None)
+        self._all_dict_json = None
+        self._all_compressed_json = None
+
+    @callback
+    def async_states_json(
+        self, states: Iterable[State], all_states: bool
+    ) -> tuple[str, list[State]]:
+        """Return a JSON array of states in the get_states format.
+
+        all_states must only be True if states are all states of the
+        state machine so the joined result can be cached.
+
+        Also returns the states that could not be serialized, which are
+        left out of the JSON.
+        """
+        if all_states and self._all_dict_json is not None:
+            return self._all_dict_json, []
+        fragments, unserializable = _async_fragments(
+            states, self._dict_fragments, _state_dict_json
+        )
+        states_json = f"[{','.join(fragments)}]"
+        if all_states and not unserializable:
+            self._all_dict_json = states_json
+        return states_json, unserializable
+
+    @callback
+    def async_compressed_states_json(
+        self, states: Iterable[State], all_states: bool
+    ) -> tuple[str, list[State]]:
+        """Return a JSON object of states keyed by entity_id in compressed format.
+
+        all_states must only be True if states are all states of the
+        state machine so the joined result can be cached.
+
+        Also returns the states that could not be serialized, which are
+        left out of the JSON.
+        """
+        if all_states and self._all_compressed_json is not None:
+            return self._all_compressed_json, []
+        fragments, unserializable = _async_fragments(
+            states, self._compressed_fragments, _compressed_state_json
+        )
+        states_json = f"{{{','.join(fragments)}}}"
+        if all_states and not unserializable:
+            self._all_compressed_json = states_json
+        return states_json, unserializable
+
+
+@callback
+def _async_fragments(
+    states: Iterable[State],
+    fragments: dict[str, str],
+    serialize: Callable[[State], str],
+) -> tuple[list[str], list[State]]:
+    """Return the cached fragments of states, serializing missing ones."""
+    state_fragments: list[str] = []
+    unserializable: list[State] = []
+    for state in states:
+        if (fragment := fragments.get(state.entity_id)) is None:
+            try:
+                fragment = serialize(state)
+            except (ValueError, TypeError):
+                unserializable.append(state)
+                continue
+            fragments[state.entity_id] = fragment
+        state_fragments.append(fragment)
+    return state_fragments, unserializable
+
+
+@callback
+def async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the shared states snapshot."""
+    if (snapshot := hass.data.get(DATA_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_STATES_SNAPSHOT] = StatesSnapshot(hass)
+        snapshot.async_setup()
+    return snapshot
@@ -20,7 +20,10 @@ from contextvars import ContextVar
 import datetime
 import enum
 import functools
+import heapq
+import itertools
 import logging
+from operator import attrgetter
 import os
 import pathlib
 import re
@@ -82,7 +85,8 @@ from .exceptions import (
 from .helpers.aiohttp_compat import restore_original_aiohttp_cancel_behavior
 from .util import dt as dt_util, location, ulid as ulid_util
 from .util.async_ import run_callback_threadsafe, shutdown_run_callback_threadsafe
-from .util.read_only_dict import ReadOnlyDict
+from .util.loop_monitor import LoopMonitor
+from .util.read_only_dict import ReadOnlyDict, intern_read_only_dict
 from .util.timeout import TimeoutManager
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
@@ -306,6 +310,8 @@ class HomeAssistant:
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
+        # Times callbacks run in the event loop when set
+        self.loop_monitor: LoopMonitor | None = None
 
     @property
     def is_running(self) -> bool:
@@ -505,7 +511,10 @@ class HomeAssistant:
         elif hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            self.loop.call_soon(hassjob.target, *args)
+            if self.loop_monitor is None:
+                self.loop.call_soon(hassjob.target, *args)
+            else:
+                self.loop.call_soon(self.loop_monitor.run_job, hassjob, *args)
             return None
         else:
             if TYPE_CHECKING:
@@ -604,7 +613,10 @@ class HomeAssistant:
         if hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            hassjob.target(*args)
+            if self.loop_monitor is None:
+                hassjob.target(*args)
+            else:
+                self.loop_monitor.run_job(hassjob, *args)
             return None
 
         return self.async_add_hass_job(hassjob, *args)
@@ -950,6 +962,51 @@ class _FilterableJob(NamedTuple):
     job: HassJob[[Event], Coroutine[Any, Any, None] | None]
     event_filter: Callable[[Event], bool] | None
     run_immediately: bool
+    # Registration order, to dispatch indexed listeners in order
+    # with the other listeners of the event type
+    seq: int
+
+
+_seq_of_job = attrgetter("seq")
+
+
+class _EventIndex:
+    """Listeners of an event type indexed by the entity_id of the event data.
+
+    Listeners registered with entity_ids or domains are only considered
+    for events whose data contains a matching entity_id, so an event only
+    reaches the listeners that are interested in it instead of walking
+    every filter on the event type.
+    """
+
+    __slots__ = ("entity_ids", "domains")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.entity_ids: dict[str, list[_FilterableJob]] = {}
+        self.domains: dict[str, list[_FilterableJob]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed listeners."""
+        return len(
+            {
+                filterable_job
+                for index in (self.entity_ids, self.domains)
+                for filterable_jobs in index.values()
+                for filterable_job in filterable_jobs
+            }
+        )
+
+    def async_get(self, entity_id: str) -> list[_FilterableJob]:
+        """Return the listeners that match an entity_id in registration order."""
+        entity_id_jobs = self.entity_ids.get(entity_id)
+        domain_jobs = self.domains.get(entity_id.partition(".")[0])
+        if domain_jobs is None:
+            return entity_id_jobs or []
+        if entity_id_jobs is None:
+            return domain_jobs
+        # A listener may be registered for both the entity_id and its domain
+        return sorted(set(entity_id_jobs).union(domain_jobs), key=_seq_of_job)
 
 
 class EventBus:
@@ -958,6 +1015,11 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        self._indexed_listeners: dict[str, _EventIndex] = {}
+        # Merged MATCH_ALL and event type listeners, with the number of
+        # MATCH_ALL listeners, rebuilt when they change
+        self._dispatch_cache: dict[str, tuple[tuple[_FilterableJob, ...], int]] = {}
+        self._listener_seq = itertools.count()
         self._hass = hass
 
     @callback
@@ -966,7 +1028,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, index in self._indexed_listeners.items():
+            listeners[key] = listeners.get(key, 0) + len(index)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -985,6 +1050,33 @@ class EventBus:
             self.async_fire, event_type, event_data, origin, context
         )
 
+    @callback
+    def _async_dispatch_listeners(
+        self, event_type: str
+    ) -> tuple[tuple[_FilterableJob, ...], int]:
+        """Return the non-indexed listeners and the number of MATCH_ALL ones."""
+        if (dispatch := self._dispatch_cache.get(event_type)) is not None:
+            return dispatch
+
+        listeners = tuple(self._listeners.get(event_type, ()))
+        match_all_count = 0
+        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
+        match_all_listeners = self._listeners.get(MATCH_ALL)
+        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = tuple(match_all_listeners) + listeners
+            match_all_count = len(match_all_listeners)
+
+        dispatch = self._dispatch_cache[event_type] = (listeners, match_all_count)
+        return dispatch
+
+    @callback
+    def _async_invalidate_dispatch_cache(self, event_type: str) -> None:
+        """Invalidate the merged listeners after listeners changed."""
+        if event_type == MATCH_ALL:
+            self._dispatch_cache.clear()
+        else:
+            self._dispatch_cache.pop(event_type, None)
+
     @callback
     def async_fire(
         self,
@@ -1003,12 +1095,22 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners, match_all_count = self._async_dispatch_listeners(event_type)
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (
+            event_data
+            and (index := self._indexed_listeners.get(event_type)) is not None
+            and type(entity_id := event_data.get("entity_id")) is str
+            and (indexed_listeners := index.async_get(entity_id))
+        ):
+            # MATCH_ALL listeners go first, the listeners of the event type
+            # run in the order they were registered
+            listeners = (
+                *listeners[:match_all_count],
+                *heapq.merge(
+                    listeners[match_all_count:], indexed_listeners, key=_seq_of_job
+                ),
+            )
 
         event = Event(event_type, event_data, origin, time_fired, context)
         if not event.context.origin_event:
@@ -1019,7 +1121,8 @@ class EventBus:
         if not listeners:
             return
 
-        for job, event_filter, run_immediately in listeners:
+        loop_monitor = self._hass.loop_monitor
+        for job, event_filter, run_immediately, _ in listeners:
             if event_filter is not None:
                 try:
                     if not event_filter(event):
@@ -1029,7 +1132,10 @@ class EventBus:
                     continue
             if run_immediately:
                 try:
-                    job.target(event)
+                    if loop_monitor is None:
+                        job.target(event)
+                    else:
+                        loop_monitor.run_job(job, event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error running job: %s", job)
             else:
@@ -1062,6 +1168,9 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        *,
+        entity_ids: Iterable[str] | None = None,
+        domains: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1076,17 +1185,35 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        If entity_ids or domains are passed, the listener is added to
+        the dispatch index of the event type and is only considered for
+        events with an ``entity_id`` in the event data that matches
+        one of the entity_ids or domains. The event_filter still runs
+        for matching events.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         if run_immediately and not is_callback(listener):
             raise HomeAssistantError(f"Event listener {listener} is not a callback")
-        return self._async_listen_filterable_job(
+        filterable_job = _FilterableJob(
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+            run_immediately,
+            next(self._listener_seq),
+        )
+        if entity_ids is None and domains is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                "Indexed listeners can not be registered for all events"
+            )
+        return self._async_listen_indexed_job(
             event_type,
-            _FilterableJob(
-                HassJob(listener, f"listen {event_type}"), event_filter, run_immediately
-            ),
+            filterable_job,
+            tuple(entity_ids or ()),
+            tuple(domains or ()),
         )
 
     @callback
@@ -1094,6 +1221,7 @@ class EventBus:
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch_cache(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1101,6 +1229,29 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def _async_listen_indexed_job(
+        self,
+        event_type: str,
+        filterable_job: _FilterableJob,
+        entity_ids: tuple[str, ...],
+        domains: tuple[str, ...],
+    ) -> CALLBACK_TYPE:
+        """Add a listener to the dispatch index of an event type."""
+        index = self._indexed_listeners.setdefault(event_type, _EventIndex())
+        for entity_id in entity_ids:
+            index.entity_ids.setdefault(entity_id, []).append(filterable_job)
+        for domain in domains:
+            index.domains.setdefault(domain, []).append(filterable_job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_indexed_listener(
+                event_type, filterable_job, entity_ids, domains
+            )
+
+        return remove_listener
+
     def listen_once(
         self,
         event_type: str,
@@ -1164,6 +1315,7 @@ class EventBus:
             HassJob(_onetime_listener, f"onetime listen {event_type} {listener}"),
             None,
             False,
+            next(self._listener_seq),
         )
 
         return self._async_listen_filterable_job(event_type, filterable_job)
@@ -1188,6 +1340,39 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+        else:
+            self._async_invalidate_dispatch_cache(event_type)
+
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: str,
+        filterable_job: _FilterableJob,
+        entity_ids: tuple[str, ...],
+        domains: tuple[str, ...],
+    ) -> None:
+        """Remove a listener from the dispatch index of an event type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            index = self._indexed_listeners[event_type]
+            for keys, index_by_key in (
+                (entity_ids, index.entity_ids),
+                (domains, index.domains),
+            ):
+                for key in keys:
+                    index_by_key[key].remove(filterable_job)
+                    if not index_by_key[key]:
+                        del index_by_key[key]
+
+            # delete event_type index if empty
+            if not index.entity_ids and not index.domains:
+                del self._indexed_listeners[event_type]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
 
 
 class State:
@@ -1243,7 +1428,12 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDicts are immutable and can be shared between states
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1378,6 +1568,9 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # States indexed by domain to avoid scanning all states
+        # when filtering by domain
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1395,19 +1588,18 @@ class StateMachine:
     ) -> list[str]:
         """List of entity ids that are being tracked.
 
+        With an iterable domain_filter the entity ids are grouped by domain,
+        in the order of the filter.
+
         This method must be run in the event loop.
         """
         if domain_filter is None:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        return [state.entity_id for state in self._async_domain_states(domain_filter)]
 
     @callback
     def async_entity_ids_count(
@@ -1421,10 +1613,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in dict.fromkeys(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1445,11 +1638,24 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
+        return list(self._async_domain_states(domain_filter))
+
+    @callback
+    def _async_domain_states(self, domain_filter: Iterable[str]) -> Iterable[State]:
+        """Return the states in the domains of the filter in insertion order."""
+        domains = dict.fromkeys(domain_filter)
+        indexes = [
+            domain_states
+            for domain in domains
+            if (domain_states := self._domain_index.get(domain))
         ]
+        if not indexes:
+            return ()
+        if len(indexes) == 1:
+            return indexes[0].values()
+        return (state for state in self._states.values() if state.domain in domains)
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1492,6 +1698,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1575,10 +1786,24 @@ class StateMachine:
             same_state = False
             same_attr = False
             last_changed = None
+            attributes = intern_read_only_dict(attributes)
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
+            if (old_attributes := old_state.attributes) is attributes:
+                same_attr = True
+            else:
+                # Share identical attributes between states and entities
+                attributes = intern_read_only_dict(attributes)
+                if (
+                    attributes.content_hash is not None
+                    and old_attributes.content_hash is not None
+                ):
+                    # Interned attributes are only equal if they are identical
+                    same_attr = attributes is old_attributes
+                elif same_attr := old_attributes == attributes:
+                    # Reuse the unchanged attributes of the previous state
+                    attributes = old_attributes
 
         if same_state and same_attr:
             return
@@ -1599,6 +1824,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
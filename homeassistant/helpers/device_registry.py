@@ -234,6 +234,9 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     Maintains two additional indexes:
     - (connection_type, connection identifier) -> entry
     - (DOMAIN, identifier) -> entry
+
+    The ids of entries that were added, changed or removed are kept in
+    dirty until the registry saves them.
     """
 
     def __init__(self) -> None:
@@ -241,6 +244,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         super().__init__()
         self._connections: dict[tuple[str, str], _EntryTypeT] = {}
         self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self.dirty: set[str] = set()
 
     def values(self) -> ValuesView[_EntryTypeT]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -256,6 +260,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
                 del self._identifiers[identifier]
         # type ignore linked to mypy issue: https://github.com/python/mypy/issues/13596
         super().__setitem__(key, entry)  # type: ignore[assignment]
+        self.dirty.add(key)
         for connection in entry.connections:
             self._connections[connection] = entry
         for identifier in entry.identifiers:
@@ -268,6 +273,7 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
+        self.dirty.add(key)
         super().__delitem__(key)
 
     def get_entry(
@@ -287,6 +293,38 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+def _device_to_storage(entry: DeviceEntry) -> dict[str, Any]:
+    """Return the data of a device to store in a file."""
+    return {
+        "area_id": entry.area_id,
+        "config_entries": list(entry.config_entries),
+        "configuration_url": entry.configuration_url,
+        "connections": list(entry.connections),
+        "disabled_by": entry.disabled_by,
+        "entry_type": entry.entry_type,
+        "hw_version": entry.hw_version,
+        "id": entry.id,
+        "identifiers": list(entry.identifiers),
+        "manufacturer": entry.manufacturer,
+        "model": entry.model,
+        "name_by_user": entry.name_by_user,
+        "name": entry.name,
+        "sw_version": entry.sw_version,
+        "via_device_id": entry.via_device_id,
+    }
+
+
+def _deleted_device_to_storage(entry: DeletedDeviceEntry) -> dict[str, Any]:
+    """Return the data of a deleted device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "id": entry.id,
+        "orphaned_timestamp": entry.orphaned_timestamp,
+    }
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -302,6 +340,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -645,46 +684,52 @@ class DeviceRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save(
+            self._data_to_save, SAVE_DELAY, changes_func=self._changes_to_save
+        )
 
     @callback
     def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
         """Return data of device registry to store in a file."""
         data: dict[str, list[dict[str, Any]]] = {}
 
-        data["devices"] = [
-            {
-                "area_id": entry.area_id,
-                "config_entries": list(entry.config_entries),
-                "configuration_url": entry.configuration_url,
-                "connections": list(entry.connections),
-                "disabled_by": entry.disabled_by,
-                "entry_type": entry.entry_type,
-                "hw_version": entry.hw_version,
-                "id": entry.id,
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name_by_user": entry.name_by_user,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "via_device_id": entry.via_device_id,
-            }
-            for entry in self.devices.values()
-        ]
+        self.devices.dirty.clear()
+        self.deleted_devices.dirty.clear()
+        data["devices"] = [_device_to_storage(entry) for entry in self.devices.values()]
         data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
+            _deleted_device_to_storage(entry) for entry in self.deleted_devices.values()
         ]
 
         return data
 
+    @callback
+    def _changes_to_save(self) -> storage.JournalChanges:
+        """Return the devices changed since the last save."""
+        changes: storage.JournalChanges = []
+        for device_id in self.devices.dirty:
+            device = self.devices.get(device_id)
+            changes.append(
+                (
+                    "devices",
+                    device_id,
+                    None if device is None else _device_to_storage(device),
+                )
+            )
+        for device_id in self.deleted_devices.dirty:
+            deleted_device = self.deleted_devices.get(device_id)
+            changes.append(
+                (
+                    "deleted_devices",
+                    device_id,
+                    None
+                    if deleted_device is None
+                    else _deleted_device_to_storage(deleted_device),
+                )
+            )
+        self.devices.dirty.clear()
+        self.deleted_devices.dirty.clear()
+        return changes
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
@@ -394,6 +394,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+
+    The ids of entries that were added, changed or removed are kept in
+    dirty until the registry saves them.
     """
 
     def __init__(self) -> None:
@@ -401,6 +404,7 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self.dirty: set[str] = set()
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -412,8 +416,10 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
             old_entry = self[key]
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self.dirty.add(old_entry.id)
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
+        self.dirty.add(entry.id)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
 
     def __delitem__(self, key: str) -> None:
@@ -421,6 +427,7 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self.dirty.add(entry.id)
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
@@ -432,6 +439,35 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         return self._entry_ids.get(key)
 
 
+def _entry_to_storage(entry: RegistryEntry) -> dict[str, Any]:
+    """Return the data of an entry to store in a file."""
+    return {
+        "aliases": list(entry.aliases),
+        "area_id": entry.area_id,
+        "capabilities": entry.capabilities,
+        "config_entry_id": entry.config_entry_id,
+        "device_class": entry.device_class,
+        "device_id": entry.device_id,
+        "disabled_by": entry.disabled_by,
+        "entity_category": entry.entity_category,
+        "entity_id": entry.entity_id,
+        "hidden_by": entry.hidden_by,
+        "icon": entry.icon,
+        "id": entry.id,
+        "has_entity_name": entry.has_entity_name,
+        "name": entry.name,
+        "options": entry.options.as_dict(),
+        "original_device_class": entry.original_device_class,
+        "original_icon": entry.original_icon,
+        "original_name": entry.original_name,
+        "platform": entry.platform,
+        "supported_features": entry.supported_features,
+        "translation_key": entry.translation_key,
+        "unique_id": entry.unique_id,
+        "unit_of_measurement": entry.unit_of_measurement,
+    }
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
@@ -446,6 +482,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1006,44 +1043,39 @@ class EntityRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save(
+            self._data_to_save, SAVE_DELAY, changes_func=self._changes_to_save
+        )
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         data: dict[str, Any] = {}
 
+        self.entities.dirty.clear()
         data["entities"] = [
-            {
-                "aliases": list(entry.aliases),
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "hidden_by": entry.hidden_by,
-                "icon": entry.icon,
-                "id": entry.id,
-                "has_entity_name": entry.has_entity_name,
-                "name": entry.name,
-                "options": entry.options.as_dict(),
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "translation_key": entry.translation_key,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self.entities.values()
+            _entry_to_storage(entry) for entry in self.entities.values()
         ]
 
         return data
 
+    @callback
+    def _changes_to_save(self) -> storage.JournalChanges:
+        """Return the entities changed since the last save."""
+        entities = self.entities
+        changes: storage.JournalChanges = [
+            (
+                "entities",
+                entry_id,
+                None
+                if (entry := entities.get_entry(entry_id)) is None
+                else _entry_to_storage(entry),
+            )
+            for entry_id in entities.dirty
+        ]
+        entities.dirty.clear()
+        return changes
+
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
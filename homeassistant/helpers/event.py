@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Callable, Coroutine, Iterable, Sequence
 import copy
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 import functools as ft
 import logging
+import math
 from random import randint
 import time
 from typing import Any, Concatenate, ParamSpec, cast
@@ -54,6 +56,10 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TEMPLATE_SHARED_RENDERS = "track_template_shared_renders"
+
+TRACK_TIMER_WHEEL = "track_timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -63,6 +69,11 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Timers due within the same tick share a single event loop timer
+TIMER_WHEEL_RESOLUTION = 0.05
+
+TIME_PATTERN_CACHE_SIZE = 1024
+
 _P = ParamSpec("_P")
 
 
@@ -812,6 +823,60 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _SharedTemplateRenders:
+    """Share the renders of identical templates between template trackers.
+
+    Trackers of the same template string with equal variables that
+    re-render because of the same state_changed event get the same
+    RenderInfo instead of rendering the template again. Templates are
+    only shared if they are also both limited or both strict since they
+    render in different environments. The renders are only kept for the
+    event that caused them.
+    """
+
+    __slots__ = ("_event", "_renders")
+
+    def __init__(self) -> None:
+        """Initialize the shared renders."""
+        self._event: Event | None = None
+        self._renders: dict[
+            tuple[str, bool, bool], list[tuple[TemplateVarsType, RenderInfo]]
+        ] = {}
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType, event: Event
+    ) -> RenderInfo:
+        """Render the template or return the render of an identical template."""
+        if event is not self._event:
+            self._event = event
+            self._renders.clear()
+
+        # pylint: disable-next=protected-access
+        key = (template.template, bool(template._limited), bool(template._strict))
+        renders = self._renders.setdefault(key, [])
+        for rendered_variables, info in renders:
+            if rendered_variables == variables:
+                return info
+
+        info = template.async_render_to_info(variables)
+        renders.append((variables, info))
+        return info
+
+
+@callback
+def _async_shared_template_renders(hass: HomeAssistant) -> _SharedTemplateRenders:
+    """Return the renders shared by all template trackers."""
+    shared_renders: _SharedTemplateRenders | None = hass.data.get(
+        TRACK_TEMPLATE_SHARED_RENDERS
+    )
+    if shared_renders is None:
+        shared_renders = hass.data[
+            TRACK_TEMPLATE_SHARED_RENDERS
+        ] = _SharedTemplateRenders()
+    return shared_renders
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -834,6 +899,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._shared_renders = _async_shared_template_renders(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -957,9 +1023,14 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: datetime,
         event: Event | None,
+        replayed: bool | None = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        The render is shared with identical templates that re-render
+        because of the same event, unless the event is replayed after
+        a rate limit since the states may have changed in the meantime.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -996,9 +1067,13 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event and not replayed:
+            info = self._shared_renders.async_render_to_info(
+                template, track_template_.variables, event
+            )
+        else:
+            info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1068,7 +1143,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= _apply_update(update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1099,7 +1176,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
@@ -1275,6 +1354,254 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+@ft.lru_cache(maxsize=512)
+def _module_timer_owner(module: str) -> str:
+    """Return the integration that owns timers scheduled by a module."""
+    parts = module.split(".")
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return parts[0] or "unknown"
+
+
+def _timer_owner(target: Callable[..., Any]) -> str:
+    """Return the integration that owns a timer calling target."""
+    while isinstance(target, ft.partial):
+        target = target.func
+    if (owner := getattr(target, "__self__", None)) is not None:
+        # Bound methods of classes that are subclassed by integrations,
+        # like DataUpdateCoordinator, belong to the integration.
+        return _module_timer_owner(type(owner).__module__)
+    return _module_timer_owner(getattr(target, "__module__", None) or "")
+
+
+class _WheelTimer:
+    """A timer scheduled on the timer wheel."""
+
+    __slots__ = ("when", "action", "job", "owner", "bucket", "cancelled")
+
+    def __init__(
+        self,
+        when: float,
+        action: Callable[[HassJob[[datetime], Any]], None],
+        job: HassJob[[datetime], Any],
+        owner: str,
+    ) -> None:
+        """Initialize the timer."""
+        self.when = when
+        self.action = action
+        self.job = job
+        self.owner = owner
+        self.bucket: _TimerBucket | None = None
+        self.cancelled = False
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self.bucket is not None:
+            self.bucket.wheel.async_remove(self)
+
+
+class _TimerBucket:
+    """Timers that are due in the same tick of the timer wheel."""
+
+    __slots__ = ("wheel", "key", "timers", "active", "handle")
+
+    def __init__(self, wheel: _TimerWheel, key: int) -> None:
+        """Initialize the bucket and schedule it at the end of the tick."""
+        self.wheel = wheel
+        self.key = key
+        self.timers: list[_WheelTimer] = []
+        self.active = 0
+        self.handle = wheel.loop.call_at(
+            key * TIMER_WHEEL_RESOLUTION, wheel.async_run_bucket, self
+        )
+
+    @property
+    def earliest(self) -> float:
+        """Return the loop time of the earliest active timer."""
+        return min(timer.when for timer in self.timers if not timer.cancelled)
+
+    def __repr__(self) -> str:
+        """Return the representation of the bucket."""
+        jobs = ", ".join(
+            timer.job.name or repr(timer.job)
+            for timer in self.timers
+            if not timer.cancelled
+        )
+        return f"<_TimerBucket {jobs}>"
+
+
+class _TimerWheel:
+    """Coalesce timers that are due in the same tick into one loop timer.
+
+    Every call_later adds a handle to the heap of the event loop and
+    wakes the loop up when it is due. Timers scheduled on the wheel are
+    grouped in buckets of TIMER_WHEEL_RESOLUTION seconds instead, and each
+    bucket has a single loop timer at the end of its tick that runs all
+    of them. Timers never run early, at most one tick late.
+    """
+
+    __slots__ = ("loop", "_buckets", "_owners", "wakeups", "fired")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self.loop = loop
+        self._buckets: dict[int, _TimerBucket] = {}
+        self._owners: Counter[str] = Counter()
+        self.wakeups = 0
+        self.fired = 0
+
+    @callback
+    def async_schedule(
+        self,
+        delay: float,
+        action: Callable[[HassJob[[datetime], Any]], None],
+        job: HassJob[[datetime], Any],
+        owner: str,
+    ) -> _WheelTimer:
+        """Schedule action to be called with job after delay seconds."""
+        timer = _WheelTimer(self.loop.time() + delay, action, job, owner)
+        self._async_add(timer)
+        self._owners[owner] += 1
+        return timer
+
+    @callback
+    def _async_add(self, timer: _WheelTimer) -> None:
+        """Add a timer to the bucket of the tick it is due in."""
+        key = math.ceil(timer.when / TIMER_WHEEL_RESOLUTION)
+        if (bucket := self._buckets.get(key)) is None:
+            bucket = self._buckets[key] = _TimerBucket(self, key)
+        bucket.timers.append(timer)
+        bucket.active += 1
+        timer.bucket = bucket
+
+    @callback
+    def _async_remove_bucket(self, bucket: _TimerBucket) -> None:
+        """Remove a bucket from the wheel and cancel its loop timer."""
+        if self._buckets.get(bucket.key) is bucket:
+            del self._buckets[bucket.key]
+        bucket.handle.cancel()
+
+    @callback
+    def _async_timer_done(self, timer: _WheelTimer) -> None:
+        """Stop counting a timer that was cancelled or has run."""
+        if (count := self._owners[timer.owner] - 1) > 0:
+            self._owners[timer.owner] = count
+        else:
+            del self._owners[timer.owner]
+
+    @callback
+    def async_remove(self, timer: _WheelTimer) -> None:
+        """Remove a cancelled timer."""
+        bucket = timer.bucket
+        assert bucket is not None
+        timer.bucket = None
+        self._async_timer_done(timer)
+        bucket.active -= 1
+        if not bucket.active:
+            self._async_remove_bucket(bucket)
+
+    @callback
+    def async_run_bucket(
+        self, bucket: _TimerBucket, until: float | None = None
+    ) -> None:
+        """Run the timers of a bucket.
+
+        If until is set, only the timers due by that loop time are run
+        and the others are added to the wheel again.
+        """
+        self._async_remove_bucket(bucket)
+        self.wakeups += 1
+        for timer in bucket.timers:
+            if timer.cancelled:
+                continue
+            if until is not None and timer.when > until:
+                self._async_add(timer)
+                continue
+            timer.cancelled = True
+            timer.bucket = None
+            self._async_timer_done(timer)
+            self.fired += 1
+            try:
+                timer.action(timer.job)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer {timer.job}",
+                        "exception": exc,
+                    }
+                )
+
+    @callback
+    def async_run_due(self, until: float | None) -> None:
+        """Run the timers that are due by loop time until, or all if None."""
+        for bucket in list(self._buckets.values()):
+            if until is None or bucket.earliest <= until:
+                self.async_run_bucket(bucket, until)
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the statistics of the timer wheel."""
+        return {
+            "buckets": len(self._buckets),
+            "wakeups": self.wakeups,
+            "fired": self.fired,
+            "timers": dict(self._owners.most_common()),
+        }
+
+
+@callback
+def _async_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel of the event loop."""
+    wheel: _TimerWheel | None = hass.data.get(TRACK_TIMER_WHEEL)
+    if wheel is None:
+        wheel = hass.data[TRACK_TIMER_WHEEL] = _TimerWheel(hass.loop)
+    return wheel
+
+
+@callback
+def _async_schedule_timer(
+    hass: HomeAssistant,
+    delay: float,
+    action: Callable[[HassJob[[datetime], Any]], None],
+    job: HassJob[[datetime], Any],
+    owner: str,
+) -> asyncio.TimerHandle | _WheelTimer:
+    """Schedule action to be called with job after delay seconds.
+
+    Jobs that are cancelled on shutdown keep their own loop timer so
+    HomeAssistant.async_stop can find them.
+    """
+    if delay <= 0 or job.cancel_on_shutdown:
+        return hass.loop.call_later(delay, action, job)
+    return _async_timer_wheel(hass).async_schedule(delay, action, job, owner)
+
+
+@callback
+def async_get_timer_wheel_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the number of buckets, wakeups and fired timers of the timer wheel.
+
+    The scheduled timers are counted per integration under "timers".
+    """
+    return _async_timer_wheel(hass).async_stats()
+
+
+@callback
+def async_run_timer_wheel(hass: HomeAssistant, until: float | None = None) -> None:
+    """Run the timers on the timer wheel that are due by loop time until.
+
+    All timers are run if until is None. This lets tests move time forward
+    without waiting for the end of the tick of a bucket.
+    """
+    if (wheel := hass.data.get(TRACK_TIMER_WHEEL)) is not None:
+        wheel.async_run_due(until)
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1300,7 +1627,9 @@ def async_track_point_in_time(
         name=f"{job.name} UTC converter",
         cancel_on_shutdown=job.cancel_on_shutdown,
     )
-    return async_track_point_in_utc_time(hass, track_job, point_in_time)
+    return _async_track_point_in_utc_time(
+        hass, track_job, point_in_time, _timer_owner(job.target)
+    )
 
 
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
@@ -1315,13 +1644,31 @@ def async_track_point_in_utc_time(
     point_in_time: datetime,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in UTC time."""
+    # Since this is called once, we accept a HassJob so we can avoid
+    # having to figure out how to call the action every time its called.
+    job = (
+        action
+        if isinstance(action, HassJob)
+        else HassJob(action, f"track point in utc time {dt_util.as_utc(point_in_time)}")
+    )
+    return _async_track_point_in_utc_time(
+        hass, job, point_in_time, _timer_owner(job.target)
+    )
+
+
+@callback
+def _async_track_point_in_utc_time(
+    hass: HomeAssistant,
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+    point_in_time: datetime,
+    owner: str,
+) -> CALLBACK_TYPE:
+    """Add a listener owned by an integration that fires at a point in UTC time."""
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
     expected_fire_timestamp = dt_util.utc_to_timestamp(utc_point_in_time)
 
-    # Since this is called once, we accept a HassJob so we can avoid
-    # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    cancel_callback: asyncio.TimerHandle | _WheelTimer | None = None
 
     @callback
     def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
@@ -1335,18 +1682,13 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
+            cancel_callback = _async_schedule_timer(hass, delta, run_action, job, owner)
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
 
-    job = (
-        action
-        if isinstance(action, HassJob)
-        else HassJob(action, f"track point in utc time {utc_point_in_time}")
-    )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
+    cancel_callback = _async_schedule_timer(hass, delta, run_action, job, owner)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1382,7 +1724,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    cancel_callback = hass.loop.call_later(delay, run_action, job)
+    cancel_callback = _async_schedule_timer(
+        hass, delay, run_action, job, _timer_owner(job.target)
+    )
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -1424,8 +1768,8 @@ def async_track_time_interval(
         nonlocal remove
         nonlocal interval_listener_job
 
-        remove = async_track_point_in_utc_time(
-            hass, interval_listener_job, next_interval()
+        remove = _async_track_point_in_utc_time(
+            hass, interval_listener_job, next_interval(), owner
         )
         hass.async_run_hass_job(job, now)
 
@@ -1437,7 +1781,10 @@ def async_track_time_interval(
     interval_listener_job = HassJob(
         interval_listener, job_name, cancel_on_shutdown=cancel_on_shutdown
     )
-    remove = async_track_point_in_utc_time(hass, interval_listener_job, next_interval())
+    owner = _timer_owner(action)
+    remove = _async_track_point_in_utc_time(
+        hass, interval_listener_job, next_interval(), owner
+    )
 
     def remove_listener() -> None:
         """Remove interval listener."""
@@ -1545,6 +1892,26 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+@ft.lru_cache(maxsize=TIME_PATTERN_CACHE_SIZE)
+def _find_next_time_expression_time(
+    now: datetime,
+    time_zone: tzinfo | None,
+    fold: int,
+    seconds: tuple[int, ...],
+    minutes: tuple[int, ...],
+    hours: tuple[int, ...],
+) -> datetime:
+    """Find the next time a time pattern matches, cached per pattern.
+
+    Time pattern listeners with the same pattern that fire in the same
+    second share the result. The time zone and fold are part of the key
+    since datetimes of the same instant compare equal.
+    """
+    return dt_util.find_next_time_expression_time(
+        now, list(seconds), list(minutes), list(hours)
+    )
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1567,19 +1934,26 @@ def async_track_utc_time_change(
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
     job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
-    matching_seconds = dt_util.parse_time_expression(second, 0, 59)
-    matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
-    matching_hours = dt_util.parse_time_expression(hour, 0, 23)
+    matching_seconds = tuple(dt_util.parse_time_expression(second, 0, 59))
+    matching_minutes = tuple(dt_util.parse_time_expression(minute, 0, 59))
+    matching_hours = tuple(dt_util.parse_time_expression(hour, 0, 23))
     # Avoid aligning all time trackers to the same second
     # since it can create a thundering herd problem
     # https://github.com/home-assistant/core/issues/82231
     microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
 
+    owner = _timer_owner(action)
+
     def calculate_next(now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+        return _find_next_time_expression_time(
+            localized_now.replace(microsecond=0),
+            localized_now.tzinfo,
+            localized_now.fold,
+            matching_seconds,
+            matching_minutes,
+            matching_hours,
         ).replace(microsecond=microsecond)
 
     time_listener: CALLBACK_TYPE | None = None
@@ -1595,18 +1969,22 @@ def async_track_utc_time_change(
         hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
         assert pattern_time_change_listener_job is not None
 
-        time_listener = async_track_point_in_utc_time(
+        time_listener = _async_track_point_in_utc_time(
             hass,
             pattern_time_change_listener_job,
             calculate_next(now + timedelta(seconds=1)),
+            owner,
         )
 
     pattern_time_change_listener_job = HassJob(
         pattern_time_change_listener,
         "time change listener {hour}:{minute}:{second} {action}",
     )
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener_job, calculate_next(dt_util.utcnow())
+    time_listener = _async_track_point_in_utc_time(
+        hass,
+        pattern_time_change_listener_job,
+        calculate_next(dt_util.utcnow()),
+        owner,
     )
 
     @callback
@@ -1691,16 +2069,21 @@ def _render_infos_to_track_states(render_infos: Iterable[RenderInfo]) -> TrackSt
 
 @callback
 def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
-    """Determine if a template should be re-rendered from an event."""
+    """Determine if a template should be re-rendered from an event.
+
+    A state change of an entity the template read only triggers a
+    re-render if one of the fields or attributes it read has changed.
+    """
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
+    new_state: State | None = event.data.get("new_state")
+    old_state: State | None = event.data.get("old_state")
 
     if info.filter(entity_id):
-        return True
+        if new_state is None or old_state is None:
+            return True
+        return info.fields_changed(entity_id, old_state, new_state)
 
-    if (
-        event.data.get("new_state") is not None
-        and event.data.get("old_state") is not None
-    ):
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -23,6 +23,7 @@ class IntegrationPlatform:
     platform_name: str
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None]]
     seen_components: set[str]
+    lazy: bool = False
 
 
 async def _async_process_single_integration_platform_component(
@@ -47,7 +48,10 @@ async def _async_process_single_integration_platform_component(
     platform_name = integration_platform.platform_name
 
     try:
-        platform = integration.get_platform(platform_name)
+        if integration_platform.lazy:
+            platform = integration.get_lazy_platform(platform_name)
+        else:
+            platform = integration.get_platform(platform_name)
     except ImportError as err:
         if f"{component_name}.{platform_name}" not in str(err):
             _LOGGER.exception(
@@ -109,8 +113,14 @@ async def async_process_integration_platforms(
     platform_name: str,
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None]],
+    *,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If lazy is set, the platforms passed to process_platform are only imported
+    once one of their attributes is used.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         hass.data[DATA_INTEGRATION_PLATFORMS] = []
 
@@ -134,7 +144,9 @@ async def async_process_integration_platforms(
     integration_platforms: list[IntegrationPlatform] = hass.data[
         DATA_INTEGRATION_PLATFORMS
     ]
-    integration_platform = IntegrationPlatform(platform_name, process_platform, set())
+    integration_platform = IntegrationPlatform(
+        platform_name, process_platform, set(), lazy
+    )
     integration_platforms.append(integration_platform)
     if top_level_components := [
         comp for comp in hass.config.components if "." not in comp
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping
 from datetime import datetime, timedelta
 import logging
 from typing import Any, cast
@@ -19,7 +20,7 @@ from .entity import Entity
 from .event import async_track_time_interval
 from .json import JSONEncoder
 from .singleton import singleton
-from .storage import Store
+from .storage import JournalChanges, Store
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
 
@@ -34,6 +35,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long an unchanged state is kept before it is saved again to update
+# when it was last seen
+STATE_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +101,67 @@ class StoredState:
         )
 
 
+class StoredStates(MutableMapping[str, StoredState]):
+    """Stored states that are decoded when they are first accessed."""
+
+    def __init__(
+        self, states: Mapping[str, StoredState | dict[str, Any]] | None = None
+    ) -> None:
+        """Initialize the stored states."""
+        self._states: dict[str, StoredState | dict[str, Any]] = dict(states or {})
+
+    def __getitem__(self, entity_id: str) -> StoredState:
+        """Get a stored state, decoding it if needed."""
+        stored = self._states[entity_id]
+        if isinstance(stored, StoredState):
+            return stored
+        try:
+            stored_state = StoredState.from_dict(stored)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.error("Error decoding last state of %s: %s", entity_id, err)
+            del self._states[entity_id]
+            raise KeyError(entity_id) from err
+        self._states[entity_id] = stored_state
+        return stored_state
+
+    def __setitem__(self, entity_id: str, stored_state: StoredState) -> None:
+        """Set a stored state."""
+        self._states[entity_id] = stored_state
+
+    def __delitem__(self, entity_id: str) -> None:
+        """Delete a stored state."""
+        del self._states[entity_id]
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return if there is a stored state for the entity."""
+        return entity_id in self._states
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity ids."""
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        """Return the number of stored states."""
+        return len(self._states)
+
+    def raw_items(self) -> ItemsView[str, StoredState | dict[str, Any]]:
+        """Return the stored states without decoding them.
+
+        States that were not accessed yet are the dicts loaded from storage.
+        """
+        return self._states.items()
+
+
+def _last_seen(stored: StoredState | dict[str, Any]) -> datetime | None:
+    """Return when a stored state was last seen without decoding it."""
+    if isinstance(stored, StoredState):
+        return stored.last_seen
+    last_seen = stored.get("last_seen")
+    if isinstance(last_seen, str):
+        return dt_util.parse_datetime(last_seen)
+    return last_seen
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -113,13 +179,16 @@ class RestoreStateData:
 
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            data.last_states = {}
+            data.last_states = StoredStates()
         else:
-            data.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
+            # The states are only decoded when an entity restores them
+            data.last_states = StoredStates(
+                {
+                    item["state"]["entity_id"]: item
+                    for item in stored_states
+                    if valid_entity_id(item["state"]["entity_id"])
+                }
+            )
             _LOGGER.debug("Created cache with %s", list(data.last_states))
 
         async def hass_start(hass: HomeAssistant) -> None:
@@ -140,10 +209,31 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_keys={"": "state.entity_id"},
         )
-        self.last_states: dict[str, StoredState] = {}
+        self._last_states = StoredStates()
         self.entities: dict[str, RestoreEntity] = {}
+        # What the states written by the last dump were created from and
+        # when they were last seen, to only write the states that changed
+        self._dumped: dict[str, tuple[Any, dict[str, Any] | None, datetime]] = {}
+
+    @property
+    def last_states(self) -> StoredStates:
+        """Return the stored states from the previous run."""
+        return self._last_states
+
+    @last_states.setter
+    def last_states(
+        self, last_states: Mapping[str, StoredState | dict[str, Any]]
+    ) -> None:
+        """Set the stored states from the previous run."""
+        if not isinstance(last_states, StoredStates):
+            last_states = StoredStates(last_states)
+        self._last_states = last_states
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -189,19 +279,108 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_dump_records(self, full: bool) -> dict[str, dict[str, Any] | None]:
+        """Return the records of the states to store.
+
+        Unless full is set, only the records that changed since the last dump
+        are returned, and None for the states that should no longer be stored.
+        Old states are written as they were loaded if they were not decoded.
+        """
+        now = dt_util.utcnow()
+        refresh_time = now - STATE_REFRESH_INTERVAL
+        expiration_time = now - STATE_EXPIRATION
+        last_dumped = self._dumped
+        dumped = self._dumped = {}
+        records: dict[str, dict[str, Any] | None] = {}
+
+        current_entity_ids: set[str] = set()
+        for state in self.hass.states.async_all():
+            # Ignore all states that are entity registry placeholders
+            if state.attributes.get(ATTR_RESTORED):
+                continue
+            entity_id = state.entity_id
+            current_entity_ids.add(entity_id)
+            if (entity := self.entities.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_dict = extra_data.as_dict() if extra_data else None
+            if (
+                full
+                or (previous := last_dumped.get(entity_id)) is None
+                or previous[0] is not state
+                or previous[1] != extra_dict
+                or previous[2] < refresh_time
+            ):
+                records[entity_id] = {
+                    "state": state.as_dict(),
+                    "extra_data": extra_dict,
+                    "last_seen": now,
+                }
+                dumped[entity_id] = (state, extra_dict, now)
+            else:
+                dumped[entity_id] = previous
+
+        for entity_id, stored in self.last_states.raw_items():
+            # Don't save old states that have entities in the current run
+            # They are either registered and already part of the records,
+            # or no longer care about restoring.
+            if entity_id in current_entity_ids:
+                continue
+
+            # Don't save old states that have expired
+            if (last_seen := _last_seen(stored)) is None or (
+                last_seen < expiration_time
+            ):
+                continue
+
+            if (
+                full
+                or (previous := last_dumped.get(entity_id)) is None
+                or previous[0] is not stored
+            ):
+                records[entity_id] = (
+                    stored.as_dict() if isinstance(stored, StoredState) else stored
+                )
+            dumped[entity_id] = (stored, None, last_seen)
+
+        if not full:
+            for entity_id in last_dumped.keys() - dumped.keys():
+                records[entity_id] = None
+
+        return records
+
+    @callback
+    def _async_all_records(self) -> list[dict[str, Any]]:
+        """Return the records of all states to store."""
+        return cast(list[dict[str, Any]], list(self._async_dump_records(True).values()))
+
+    @callback
+    def _async_changed_records(self) -> JournalChanges:
+        """Return the records that changed since the last dump."""
+        return [
+            ("", entity_id, record)
+            for entity_id, record in self._async_dump_records(False).items()
+        ]
+
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the states that changed since the last dump to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+            await self.store.async_save_changes(
+                self._async_all_records, self._async_changed_records
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    async def _async_dump_all_states(self) -> None:
+        """Save all states to storage."""
+        _LOGGER.debug("Dumping all states")
+        try:
+            await self.store.async_save(self._async_all_records())
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving current states", exc_info=exc)
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -224,7 +403,9 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            # Write a full snapshot so the next start does not need to
+            # replay the journal
+            await self._async_dump_all_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -311,9 +492,7 @@ class RestoreEntity(Entity):
             )
             return None
         data = await RestoreStateData.async_get_instance(self.hass)
-        if self.entity_id not in data.last_states:
-            return None
-        return data.last_states[self.entity_id]
+        return data.last_states.get(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
@@ -6,10 +6,11 @@ from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
@@ -27,8 +28,53 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Number of changed records after which a full snapshot is written
+JOURNAL_MAX_ENTRIES = 1000
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
+# A changed record: collection, key and the record or None if it was removed
+JournalChanges = list[tuple[str, str, dict[str, Any] | None]]
+
+
+def apply_journal(
+    data: Any, journal_keys: Mapping[str, str], changes: JournalChanges
+) -> None:
+    """Apply changed records to the collections of stored data.
+
+    journal_keys maps the collections, which are lists of records, to the
+    field of the records that holds their key. The collection "" is the
+    stored data itself and fields of nested dicts are separated by dots.
+    Changed records replace the record with the same key in place, new
+    records are appended.
+    """
+    collections: dict[str, dict[str, dict[str, Any]]] = {}
+    for collection, key, record in changes:
+        if (records := collections.get(collection)) is None:
+            path = journal_keys[collection].split(".")
+            stored = data if not collection else data.get(collection, ())
+            records = collections[collection] = {
+                _record_key(item, path): item for item in stored
+            }
+        if record is None:
+            records.pop(key, None)
+        else:
+            records[key] = record
+    for collection, records in collections.items():
+        if collection:
+            data[collection] = list(records.values())
+        else:
+            data[:] = records.values()
+
+
+def _record_key(record: dict[str, Any], path: list[str]) -> str:
+    """Return the key of a stored record."""
+    value: Any = record
+    for field in path:
+        value = value[field]
+    return cast(str, value)
+
 
 @bind_hass
 async def async_migrator(
@@ -84,8 +130,15 @@ class Store(Generic[_T]):
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
+        journal_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal_keys is set, saves that pass a changes_func append the
+        changed records of those collections to a journal next to the
+        file. A full snapshot replaces the journal once it has grown to
+        JOURNAL_MAX_ENTRIES records.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -98,12 +151,21 @@ class Store(Generic[_T]):
         self._load_task: asyncio.Future[_T | None] | None = None
         self._encoder = encoder
         self._atomic_writes = atomic_writes
+        self._journal_keys = journal_keys
+        # Journal entries can only be appended once a snapshot was written
+        self._journal_ready = False
+        self._journal_entries = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -140,15 +202,14 @@ class Store(Generic[_T]):
 
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
+                data.pop("changes_func", None)
                 data["data"] = data.pop("data_func")()
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -187,6 +248,45 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_data(self) -> Any:
+        """Load the data and apply the journal."""
+        data = json_util.load_json(self.path)
+        if isinstance(data, dict) and data and self._journal_keys is not None:
+            self._apply_journal_file(data)
+        return data
+
+    def _apply_journal_file(self, data: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the snapshot."""
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.error("Error reading journal for %s: %s", self.key, err)
+            return
+
+        changes: JournalChanges = []
+        for idx, line in enumerate(lines):
+            try:
+                entry = json_util.json_loads(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last entry is incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring incomplete journal entry for %s", self.key)
+                break
+            if idx:
+                changes.append(cast(tuple[str, str, dict[str, Any] | None], entry))
+            elif cast(dict[str, Any], entry).get("base") != [
+                stat.st_mtime_ns,
+                stat.st_size,
+            ]:
+                # A snapshot was written after the journal but it could
+                # not be removed.
+                _LOGGER.debug("Ignoring journal of older snapshot for %s", self.key)
+                return
+        apply_journal(data["data"], self._journal_keys or {}, changes)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -202,13 +302,45 @@ class Store(Generic[_T]):
 
         await self._async_handle_write_data()
 
+    async def async_save_changes(
+        self, data_func: Callable[[], _T], changes_func: Callable[[], JournalChanges]
+    ) -> None:
+        """Save the records changed since the last save.
+
+        Like async_delay_save, changes_func is only called if the changes
+        can be appended to the journal, otherwise data_func is called to
+        write a full snapshot.
+        """
+        self._data = {
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "key": self.key,
+            "data_func": data_func,
+        }
+        if self._journal_keys is not None:
+            self._data["changes_func"] = changes_func
+
+        if self.hass.state == CoreState.stopping:
+            self._async_ensure_final_write_listener()
+            return
+
+        await self._async_handle_write_data()
+
     @callback
     def async_delay_save(
         self,
         data_func: Callable[[], _T],
         delay: float = 0,
+        *,
+        changes_func: Callable[[], JournalChanges] | None = None,
     ) -> None:
-        """Save data with an optional delay."""
+        """Save data with an optional delay.
+
+        If the store has journal_keys, changes_func is called instead of
+        data_func to only append the records changed since the last save
+        to the journal. Both functions are expected to return all records
+        that changed since either of them was last called.
+        """
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
@@ -218,6 +350,8 @@ class Store(Generic[_T]):
             "key": self.key,
             "data_func": data_func,
         }
+        if changes_func is not None and self._journal_keys is not None:
+            self._data["changes_func"] = changes_func
 
         self._async_cleanup_delay_listener()
         self._async_ensure_final_write_listener()
@@ -275,16 +409,44 @@ class Store(Generic[_T]):
                 return
 
             data = self._data
+            changes_func = data.pop("changes_func", None)
+
+            if (
+                changes_func is not None
+                and self._journal_ready
+                and self._journal_entries < JOURNAL_MAX_ENTRIES
+            ):
+                self._data = None
+                await self._async_handle_write_journal(changes_func())
+                return
 
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
 
             self._data = None
+            self._journal_ready = False
 
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                return
+
+            self._journal_ready = self._journal_keys is not None
+            self._journal_entries = 0
+
+    async def _async_handle_write_journal(self, changes: JournalChanges) -> None:
+        """Append changed records to the journal."""
+        if not changes:
+            return
+        try:
+            await self._async_write_journal(self.path, changes)
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error writing journal for %s: %s", self.key, err)
+            # The journal may be incomplete, write a snapshot next time
+            self._journal_ready = False
+            return
+        self._journal_entries += len(changes)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -301,6 +463,58 @@ class Store(Generic[_T]):
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal_keys is not None:
+            # The snapshot contains all changes of the journal
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}{JOURNAL_SUFFIX}")
+
+    async def _async_write_journal(self, path: str, changes: JournalChanges) -> None:
+        await self.hass.async_add_executor_job(
+            self._write_journal, path, changes, not self._journal_entries
+        )
+
+    def _write_journal(self, path: str, changes: JournalChanges, new: bool) -> None:
+        """Append changed records to the journal.
+
+        A new journal starts with the modification time and size of the
+        snapshot it applies to, so it is ignored if the snapshot was
+        replaced but the journal could not be removed.
+        """
+        _LOGGER.debug("Writing %s changes for %s to journal", len(changes), self.key)
+        try:
+            if self._encoder and self._encoder is not JSONEncoder:
+                # The same slow path that save_json uses for custom encoders
+                lines = [
+                    json.dumps(change, cls=self._encoder).encode("utf-8")
+                    for change in changes
+                ]
+            else:
+                lines = [json_helper.json_bytes(change) for change in changes]
+        except (TypeError, ValueError) as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize journal for {self.key}: {err}"
+            ) from err
+        try:
+            if new:
+                stat = os.stat(path)
+                lines.insert(
+                    0,
+                    json_helper.json_bytes({"base": [stat.st_mtime_ns, stat.st_size]}),
+                )
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            else:
+                flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+            with open(
+                os.open(
+                    f"{path}{JOURNAL_SUFFIX}", flags, 0o600 if self._private else 0o644
+                ),
+                "wb",
+            ) as fdesc:
+                fdesc.write(b"\n".join(lines) + b"\n")
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        except OSError as err:
+            raise WriteError(err) from err
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -310,6 +524,10 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._journal_ready = False
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_keys is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -10,6 +10,7 @@ from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
 import math
@@ -20,6 +21,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType
 from typing import (
     Any,
@@ -38,6 +40,7 @@ import async_timeout
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.bccache import Bucket, BytecodeCache
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -47,6 +50,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -56,6 +60,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -80,6 +85,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -93,6 +99,12 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+BYTECODE_CACHE_MAX_ENTRIES = 4096
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -114,6 +126,20 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# The fields of a state a template can read. Reading "attributes"
+# means all attributes were read.
+_STATE_FIELDS = frozenset(
+    {"state", "attributes", "last_changed", "last_updated", "context"}
+)
+# The fields that are read through the collectable state attributes,
+# domain and object_id never change for an entity.
+_FIELDS_BY_STATE_ATTRIBUTE: dict[str, frozenset[str]] = {
+    **{field: frozenset({field}) for field in _STATE_FIELDS},
+    "domain": frozenset(),
+    "object_id": frozenset(),
+    "name": frozenset({"attributes"}),
+}
+
 _T = TypeVar("_T")
 _R = TypeVar("_R")
 _P = ParamSpec("_P")
@@ -340,6 +366,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The fields and the attributes of the entities that were read
+        self.entity_fields: dict[str, set[str]] = {}
+        self.entity_attributes: dict[str, set[str]] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -382,6 +411,62 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_fields(self, entity_id: str, fields: Iterable[str]) -> None:
+        """Collect the fields of an entity that were read."""
+        if (entity_fields := self.entity_fields.get(entity_id)) is None:
+            self.entity_fields[entity_id] = set(fields)
+        else:
+            entity_fields.update(fields)
+
+    def _collect_attribute(self, entity_id: str, attribute: str) -> None:
+        """Collect an attribute of an entity that was read."""
+        if (attributes := self.entity_attributes.get(entity_id)) is None:
+            self.entity_attributes[entity_id] = {attribute}
+        else:
+            attributes.add(attribute)
+
+    def fields_changed(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return True if a field of the entity the template read has changed.
+
+        Entities that are matched by a domain or all states are
+        iterated by the template, which may read any of their fields.
+        """
+        if self.all_states or split_entity_id(entity_id)[0] in self.domains:
+            return True
+
+        entity_fields = self.entity_fields.get(entity_id)
+        entity_attributes = self.entity_attributes.get(entity_id)
+        if entity_fields is None and entity_attributes is None:
+            # Collected without knowing which fields were read
+            return True
+
+        if entity_fields:
+            if "last_updated" in entity_fields or "context" in entity_fields:
+                return True
+            if "state" in entity_fields and old_state.state != new_state.state:
+                return True
+            if (
+                "last_changed" in entity_fields
+                and old_state.last_changed != new_state.last_changed
+            ):
+                return True
+            if (
+                "attributes" in entity_fields
+                and old_state.attributes != new_state.attributes
+            ):
+                return True
+
+        if entity_attributes:
+            old_attributes = old_state.attributes
+            new_attributes = new_state.attributes
+            for attribute in entity_attributes:
+                if old_attributes.get(attribute) != new_attributes.get(attribute):
+                    return True
+
+        return False
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -911,9 +996,19 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, fields: Iterable[str] = _STATE_FIELDS) -> None:
+        if self._collect and (_render_info := self._hass.data.get(_RENDER_INFO)):
+            _render_info.entities.add(self._entity_id)
+            _render_info._collect_fields(  # pylint: disable=protected-access
+                self._entity_id, fields
+            )
+
+    def _collect_attribute(self, attribute: str) -> None:
         if self._collect and (_render_info := self._hass.data.get(_RENDER_INFO)):
             _render_info.entities.add(self._entity_id)
+            _render_info._collect_attribute(  # pylint: disable=protected-access
+                self._entity_id, attribute
+            )
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -923,6 +1018,14 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (_render_info := self._hass.data.get(_RENDER_INFO)):
                 _render_info.entities.add(self._entity_id)
+                if item == "name":
+                    _render_info._collect_attribute(  # pylint: disable=protected-access
+                        self._entity_id, ATTR_FRIENDLY_NAME
+                    )
+                else:
+                    _render_info._collect_fields(  # pylint: disable=protected-access
+                        self._entity_id, _FIELDS_BY_STATE_ATTRIBUTE[item]
+                    )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -941,49 +1044,49 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["state"])
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["attributes"])
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["last_changed"])
         return self._state.last_changed
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["last_updated"])
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["context"])
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["domain"])
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(_FIELDS_BY_STATE_ATTRIBUTE["object_id"])
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_attribute(ATTR_FRIENDLY_NAME)
         return self._state.name
 
     @property
@@ -1058,6 +1161,9 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := hass.data.get(_RENDER_INFO)) is not None:
         entity_collect.entities.add(entity_id)
+        entity_collect._collect_fields(  # pylint: disable=protected-access
+            entity_id, _STATE_FIELDS
+        )
 
 
 def _state_generator(
@@ -1559,7 +1665,9 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        # pylint: disable-next=protected-access
+        state_obj._collect_attribute(name)
+        return state_obj._state.attributes.get(name)  # pylint: disable=protected-access
     return None
 
 
@@ -2259,6 +2367,130 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class TemplateBytecodeCache(BytecodeCache):
+    """A bytecode cache that keeps compiled templates across restarts.
+
+    The bytecode is stored in .storage. Buckets are checked against the
+    versions of Home Assistant and Jinja, and marshalled code that does
+    not match the running Python is rejected by the bucket itself. Once
+    there are more than BYTECODE_CACHE_MAX_ENTRIES entries, the least
+    recently used entries are evicted.
+
+    Templates can be compiled outside of the event loop, so the entries
+    are guarded by a lock. A save is scheduled on the event loop when
+    the cache becomes dirty.
+    """
+
+    checksum = f"{HA_VERSION}-{jinja2.__version__}"
+
+    def __init__(
+        self, hass: HomeAssistant, max_entries: int = BYTECODE_CACHE_MAX_ENTRIES
+    ) -> None:
+        """Initialize the bytecode cache."""
+        self._hass = hass
+        self._store = Store[dict[str, str]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._lock = threading.Lock()
+        # Base64 encoded bytecode by key
+        self._entries: MutableMapping[str, str] = LRU(
+            max_entries, callback=self._evicted
+        )
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evicted(self, key: str, value: str) -> None:
+        """Count an evicted entry."""
+        self.evictions += 1
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        if data := await self._store.async_load():
+            with self._lock:
+                # Stored from the most recently used entry
+                for key, encoded in reversed(data.items()):
+                    self._entries[key] = encoded
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the bytecode of a bucket."""
+        with self._lock:
+            encoded = self._entries.get(bucket.key)
+        if encoded is None:
+            self.misses += 1
+            return
+        bucket.bytecode_from_string(base64.b64decode(encoded))
+        if bucket.code is None:
+            # Written by another version, dump_bytecode replaces it
+            self.misses += 1
+            return
+        self.hits += 1
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store the bytecode of a bucket."""
+        encoded = base64.b64encode(bucket.bytecode_to_string()).decode()
+        with self._lock:
+            self._entries[bucket.key] = encoded
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Mark the cache dirty and schedule a save if it was clean."""
+        with self._lock:
+            if self._dirty:
+                return
+            self._dirty = True
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, str]:
+        """Return the data to store."""
+        with self._lock:
+            self._dirty = False
+            return dict(self._entries.items())
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the stats of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the bytecode cache of compiled templates."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+def get_bytecode_cache_stats(
+    hass: HomeAssistant,
+) -> dict[str, int | float] | None:
+    """Return the stats of the bytecode cache of compiled templates."""
+    if (bytecode_cache := hass.data.get(_BYTECODE_CACHE)) is None:
+        return None
+    return cast(TemplateBytecodeCache, bytecode_cache).stats()
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2274,6 +2506,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
+        if hass is not None:
+            self.bytecode_cache = hass.data.get(_BYTECODE_CACHE)
+        if limited:
+            self._bytecode_cache_type = "limited"
+        elif strict:
+            self._bytecode_cache_type = "strict"
+        else:
+            self._bytecode_cache_type = "normal"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2556,9 +2796,30 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_with_bytecode_cache(
+                source
+            )
 
         return cached
 
+    def _compile_with_bytecode_cache(
+        self, source: str | jinja2.nodes.Template
+    ) -> CodeType:
+        """Compile the template or load it from the bytecode cache."""
+        if self.bytecode_cache is None or not isinstance(source, str):
+            return super().compile(source)
+
+        key = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        bucket = Bucket(
+            self,
+            f"{self._bytecode_cache_type}-{key}",
+            TemplateBytecodeCache.checksum,
+        )
+        self.bytecode_cache.load_bytecode(bucket)
+        if bucket.code is None:
+            bucket.code = super().compile(source)
+            self.bytecode_cache.dump_bytecode(bucket)
+        return bucket.code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
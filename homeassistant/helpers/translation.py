@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Mapping
 import logging
+import os
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
@@ -151,6 +152,8 @@ async def _async_get_component_strings(
 ) -> dict[str, Any]:
     """Load translations."""
     translations: dict[str, Any] = {}
+    # Files that are known to not exist load as empty translations
+    loaded_translations: dict[str, dict[str, Any]] = {}
     # Determine paths of missing components/platforms
     files_to_load = {}
     for loaded in components:
@@ -161,18 +164,24 @@ async def _async_get_component_strings(
         # No translation available
         if path is None:
             translations[loaded] = {}
+        elif (
+            integration.translation_files is not None
+            and os.path.basename(path) not in integration.translation_files
+        ):
+            loaded_translations[loaded] = {}
         else:
             files_to_load[loaded] = path
 
-    if not files_to_load:
+    if not files_to_load and not loaded_translations:
         return translations
 
     # Load files
-    load_translations_job = hass.async_add_executor_job(
-        load_translations_files, files_to_load
-    )
-    assert load_translations_job is not None
-    loaded_translations = await load_translations_job
+    if files_to_load:
+        load_translations_job = hass.async_add_executor_job(
+            load_translations_files, files_to_load
+        )
+        assert load_translations_job is not None
+        loaded_translations.update(await load_translations_job)
 
     # Translations that miss "title" will get integration put in.
     for loaded, loaded_translation in loaded_translations.items():
@@ -11,7 +11,10 @@ from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
 import importlib
+from importlib.machinery import all_suffixes
+import importlib.util
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -25,6 +28,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__ as HA_VERSION
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +52,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_DESCRIPTIONS = "integration_descriptions"
+DATA_INTEGRATION_INDEX = "integration_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +69,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+INTEGRATION_INDEX_STORAGE_KEY = "core.integration_index"
+INTEGRATION_INDEX_STORAGE_VERSION = 1
+INTEGRATION_INDEX_SAVE_DELAY = 10
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -177,6 +187,148 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class IntegrationIndexEntry(TypedDict):
+    """Metadata of an integration kept in the integration index."""
+
+    stat: list[int]
+    manifest: Manifest
+    platforms: list[str]
+    translations: list[str]
+
+
+class IntegrationIndex:
+    """Index of integration metadata that is kept across restarts.
+
+    Entries hold the parsed manifest, the modules and the translation files
+    of an integration directory. They are validated against the
+    modification time and size of the manifest and the modification times
+    of the integration and translations directories, so a warm start only
+    needs to stat them. The sub directories of the custom components
+    directories are validated against their modification time.
+
+    Reading is done in the executor, saving is scheduled on the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the integration index."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store[dict[str, Any]](
+            hass, INTEGRATION_INDEX_STORAGE_VERSION, INTEGRATION_INDEX_STORAGE_KEY
+        )
+        self._integrations: dict[str, IntegrationIndexEntry] = {}
+        self._directories: dict[str, tuple[int, list[str]]] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the index from storage."""
+        if (data := await self._store.async_load()) is None:
+            return
+        # Built-in integrations only change with Home Assistant
+        if data["ha_version"] != HA_VERSION:
+            return
+        self._integrations = data["integrations"]
+        self._directories = {
+            path: (mtime, names) for path, (mtime, names) in data["directories"].items()
+        }
+
+    def async_schedule_save(self) -> None:
+        """Schedule saving the index if it changed."""
+        if self.dirty:
+            self.dirty = False
+            self._store.async_delay_save(
+                self._data_to_save, INTEGRATION_INDEX_SAVE_DELAY
+            )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "ha_version": HA_VERSION,
+            "integrations": dict(self._integrations),
+            "directories": dict(self._directories),
+        }
+
+    def sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a path."""
+        mtime = os.stat(path).st_mtime_ns
+        if (cached := self._directories.get(path)) is not None and cached[0] == mtime:
+            return cached[1]
+        names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+        self._directories[path] = (mtime, names)
+        self.dirty = True
+        return names
+
+    def read(self, integration_dir: str) -> IntegrationIndexEntry | None:
+        """Return the metadata of an integration directory.
+
+        Returns None if there is no manifest. Raises if it can't be parsed.
+        """
+        manifest_path = f"{integration_dir}{os.sep}manifest.json"
+        try:
+            manifest_stat = os.stat(manifest_path)
+            dir_mtime = os.stat(integration_dir).st_mtime_ns
+        except OSError:
+            return None
+        entry = self._integrations.get(integration_dir)
+        if entry is not None and entry["stat"][2:] == [dir_mtime, 0]:
+            # Adding a translations directory changes the directory mtime
+            translations_mtime = 0
+        else:
+            try:
+                translations_mtime = os.stat(
+                    f"{integration_dir}{os.sep}translations"
+                ).st_mtime_ns
+            except OSError:
+                translations_mtime = 0
+        stat = [
+            manifest_stat.st_mtime_ns,
+            manifest_stat.st_size,
+            dir_mtime,
+            translations_mtime,
+        ]
+        if entry is not None and entry["stat"] == stat:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        with open(manifest_path, "rb") as fdesc:
+            manifest = cast(Manifest, json_loads(fdesc.read()))
+        suffixes = tuple(all_suffixes())
+        platforms = {
+            item.name.partition(".")[0]
+            for item in os.scandir(integration_dir)
+            if not item.name.startswith("__")
+            and (item.name.endswith(suffixes) or item.is_dir())
+        }
+        translations: list[str] = []
+        if translations_mtime:
+            translations = os.listdir(f"{integration_dir}{os.sep}translations")
+        entry = self._integrations[integration_dir] = {
+            "stat": stat,
+            "manifest": manifest,
+            "platforms": sorted(platforms),
+            "translations": sorted(translations),
+        }
+        self.dirty = True
+        return entry
+
+
+async def async_load_integration_index(hass: HomeAssistant) -> None:
+    """Load the integration index so integrations are resolved from it."""
+    index = IntegrationIndex(hass)
+    await index.async_load()
+    hass.data[DATA_INTEGRATION_INDEX] = index
+
+
+def _async_save_integration_index(hass: HomeAssistant) -> None:
+    """Schedule saving the integration index if it changed."""
+    if (index := hass.data.get(DATA_INTEGRATION_INDEX)) is not None:
+        index.async_schedule_save()
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -189,10 +341,14 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    index: IntegrationIndex | None = hass.data.get(DATA_INTEGRATION_INDEX)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if index is not None:
+            return [name for path in paths for name in index.sub_directories(path)]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -203,11 +359,9 @@ async def _async_get_custom_components(
     )
 
     integrations = await hass.async_add_executor_job(
-        _resolve_integrations_from_root,
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+        _resolve_integrations_from_root, hass, custom_components, dirs
     )
+    _async_save_integration_index(hass)
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -314,11 +468,20 @@ async def async_get_integration_descriptions(
     hass: HomeAssistant,
 ) -> dict[str, Any]:
     """Return cached list of integrations."""
-    base = generated.__path__[0]
-    config_flow_path = pathlib.Path(base) / "integrations.json"
+    if (descriptions := hass.data.get(DATA_INTEGRATION_DESCRIPTIONS)) is None:
+        base = generated.__path__[0]
+        config_flow_path = pathlib.Path(base) / "integrations.json"
 
-    flow = await hass.async_add_executor_job(config_flow_path.read_text)
-    core_flows = cast(dict[str, Any], json_loads(flow))
+        flow = await hass.async_add_executor_job(config_flow_path.read_text)
+        descriptions = hass.data[DATA_INTEGRATION_DESCRIPTIONS] = cast(
+            dict[str, Any], json_loads(flow)
+        )
+    # Copy what is modified below, the descriptions are shared
+    core_flows: dict[str, Any] = {
+        "integration": dict(descriptions["integration"]),
+        "helper": dict(descriptions["helper"]),
+        "translated_name": list(descriptions["translated_name"]),
+    }
     custom_integrations = await async_get_custom_components(hass)
     custom_flows: dict[str, Any] = {
         "integration": {},
@@ -549,14 +712,23 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index: IntegrationIndex | None = hass.data.get(DATA_INTEGRATION_INDEX)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            platforms: set[str] | None = None
+            translation_files: set[str] | None = None
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if index is None:
+                    if not manifest_path.is_file():
+                        continue
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                else:
+                    if (entry := index.read(str(manifest_path.parent))) is None:
+                        continue
+                    manifest = cast(Manifest, dict(entry["manifest"]))
+                    platforms = set(entry["platforms"])
+                    translation_files = set(entry["translations"])
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -568,6 +740,8 @@ class Integration:
                 f"{root_module.__name__}.{domain}",
                 manifest_path.parent,
                 manifest,
+                platforms=platforms,
+                translation_files=translation_files,
             )
 
             if integration.is_built_in:
@@ -620,13 +794,22 @@ class Integration:
         pkg_path: str,
         file_path: pathlib.Path,
         manifest: Manifest,
+        *,
+        platforms: set[str] | None = None,
+        translation_files: set[str] | None = None,
     ) -> None:
-        """Initialize an integration."""
+        """Initialize an integration.
+
+        If known, platforms are the modules of the integration and
+        translation_files the files in its translations directory.
+        """
         self.hass = hass
         self.pkg_path = pkg_path
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        self._platforms = platforms
+        self.translation_files = translation_files
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -845,10 +1028,39 @@ class Integration:
 
         return cache[full_name]
 
+    def get_lazy_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform that is only imported once an attribute is used.
+
+        Raises ModuleNotFoundError right away if the integration does not
+        have the platform.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name in cache:
+            return cache[full_name]
+
+        if self._platforms is not None:
+            if platform_name not in self._platforms:
+                raise self._platform_not_found(platform_name)
+        elif importlib.util.find_spec(f"{self.pkg_path}.{platform_name}") is None:
+            raise self._platform_not_found(platform_name)
+
+        return cast(ModuleType, LazyPlatform(self, platform_name))
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
+        if self._platforms is not None and platform_name not in self._platforms:
+            # Fail fast without searching the file system
+            raise self._platform_not_found(platform_name)
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def _platform_not_found(self, platform_name: str) -> ModuleNotFoundError:
+        """Return the error raised for a platform the integration does not have."""
+        return ModuleNotFoundError(
+            f"No module named '{self.pkg_path}.{platform_name}'",
+            name=f"{self.pkg_path}.{platform_name}",
+        )
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -934,6 +1146,7 @@ async def async_get_integrations(
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, list(needed)
         )
+        _async_save_integration_index(hass)
         for domain, event in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -1051,6 +1264,29 @@ class ModuleWrapper:
         return value
 
 
+class LazyPlatform:
+    """Class to import a platform of an integration on first use."""
+
+    def __init__(self, integration: Integration, platform_name: str) -> None:
+        """Initialize the lazy platform."""
+        self._integration = integration
+        self._platform_name = platform_name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        """Fetch an attribute, importing the platform if needed."""
+        if (module := self._module) is None:
+            module = self._module = self._integration.get_platform(self._platform_name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        """Text representation of class."""
+        return (
+            f"<LazyPlatform {self._platform_name}:"
+            f" {self._integration.pkg_path}.{self._platform_name}>"
+        )
+
+
 class Components:
     """Helper to load components."""
 
@@ -51,6 +51,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    profile_imports: bool = False
 
 
 def can_use_pidfd() -> bool:
@@ -6,10 +6,15 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import importlib
 import json
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
-from typing import TypeVar
+import tracemalloc
+from typing import TypeVar, cast
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -120,6 +125,64 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_listener_scaling(hass):
+    """Fire events while the number of entity_id listeners grows.
+
+    Compares listeners that filter on entity_id with listeners
+    registered in the event bus dispatch index.
+    """
+    event_name = "benchmark_event"
+    events_to_fire = 10**4
+    entity_id = "light.kitchen"
+    total = 0.0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    for listener_count in (10, 100, 1000, 4000):
+        for indexed in (False, True):
+            unsubs = []
+            for idx in range(listener_count):
+                listener_entity_id = f"{entity_id}{idx}"
+
+                @core.callback
+                def event_filter(event, listener_entity_id=listener_entity_id):
+                    """Filter event."""
+                    return event.data["entity_id"] == listener_entity_id
+
+                if indexed:
+                    unsubs.append(
+                        hass.bus.async_listen(
+                            event_name, listener, entity_ids=[listener_entity_id]
+                        )
+                    )
+                else:
+                    unsubs.append(
+                        hass.bus.async_listen(
+                            event_name, listener, event_filter=event_filter
+                        )
+                    )
+
+            event_data = {"entity_id": f"{entity_id}0"}
+            start = timer()
+            for _ in range(events_to_fire):
+                hass.bus.async_fire(event_name, event_data)
+            await hass.async_block_till_done()
+            runtime = timer() - start
+            total += runtime
+
+            print(
+                f"{listener_count:>5} {'indexed' if indexed else 'filtered':>8}"
+                f" listeners: {events_to_fire / runtime:,.0f} events/sec"
+            )
+            for unsub in unsubs:
+                unsub()
+
+    return total
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -314,6 +377,365 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_attributes_memory(hass):
+    """Measure bytes per entity for 5000 entities and their history."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models.state_attributes import (
+        decode_attributes_from_source,
+    )
+
+    entity_count = 5000
+    history_size = 5
+    attributes = [
+        {
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+            "friendly_name": f"Sensor {idx % 50}",
+        }
+        for idx in range(entity_count)
+    ]
+
+    start = timer()
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    for update in range(history_size):
+        for idx in range(entity_count):
+            hass.states.async_set(f"sensor.test_{idx}", str(update), attributes[idx])
+    await hass.async_block_till_done()
+    state_machine_size = _tracemalloc_diff(snapshot_start)
+    print(f"State machine: {state_machine_size / entity_count:.0f} bytes/entity")
+
+    sources = [json.dumps(attrs) for attrs in attributes]
+    snapshot_start = tracemalloc.take_snapshot()
+    history = [
+        # Every row is decoded in its own query like separate
+        # history and logbook subscriptions would do.
+        [decode_attributes_from_source(sources[idx], {}) for _ in range(history_size)]
+        for idx in range(entity_count)
+    ]
+    history_size_bytes = _tracemalloc_diff(snapshot_start)
+    print(f"History: {history_size_bytes / entity_count:.0f} bytes/entity")
+    tracemalloc.stop()
+
+    assert len(history) == entity_count
+    return timer() - start
+
+
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce a year of hourly statistics for 200 meters to days and months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    start_ts = 1640995200.0
+    types = {"max", "mean", "min", "state", "sum"}
+    stats = {
+        f"sensor.meter_{idx}": [
+            {
+                "start": start_ts + hour * 3600,
+                "end": start_ts + (hour + 1) * 3600,
+                "mean": float(hour % 24),
+                "min": float(hour % 24) - 1,
+                "max": float(hour % 24) + 1,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(24 * 365)
+        ]
+        for idx in range(200)
+    }
+
+    same_day, day_start_end = statistics.reduce_day_ts_factory()
+    row_start = timer()
+    statistics._reduce_statistics(  # pylint: disable=protected-access
+        stats, same_day, day_start_end, timedelta(days=1), types
+    )
+    print(f"Row by row per day: {timer() - row_start:.3f}s")
+
+    start = timer()
+    statistics._reduce_statistics_per_day(  # pylint: disable=protected-access
+        stats, types
+    )
+    print(f"Batched per day: {timer() - start:.3f}s")
+    month_start = timer()
+    statistics._reduce_statistics_per_month(  # pylint: disable=protected-access
+        stats, types
+    )
+    print(f"Batched per month: {timer() - month_start:.3f}s")
+    return timer() - start
+
+
+@benchmark
+async def recorder_bulk_insert(hass):
+    """Write 50k state changes through the session and with bulk inserts.
+
+    Uses an in memory SQLite database unless BENCHMARK_DB_URL points to a
+    MariaDB or PostgreSQL database, which will be wiped.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import BulkInsertQueue
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    engine = create_engine(os.environ.get("BENCHMARK_DB_URL", "sqlite://"))
+    entity_count = 100
+    batches = 100
+    changes_per_entity = 5
+
+    def _write_states(bulk_insert_queue: BulkInsertQueue | None) -> float:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            metadata_ids = []
+            attributes_ids = []
+            for idx in range(entity_count):
+                states_meta = StatesMeta(entity_id=f"sensor.test_{idx}")
+                state_attributes = StateAttributes(shared_attrs="{}", hash=idx)
+                session.add_all((states_meta, state_attributes))
+                session.flush()
+                metadata_ids.append(states_meta.metadata_id)
+                attributes_ids.append(state_attributes.attributes_id)
+            session.commit()
+
+            start = timer()
+            committed: dict[int, int] = {}
+            for batch in range(batches):
+                pending: dict[int, States] = {}
+                for change in range(changes_per_entity):
+                    for idx in range(entity_count):
+                        dbstate = States(
+                            state=str(change),
+                            last_updated_ts=batch + change / changes_per_entity,
+                            metadata_id=metadata_ids[idx],
+                            attributes_id=attributes_ids[idx],
+                        )
+                        if old_state := pending.get(idx):
+                            dbstate.old_state = old_state
+                        else:
+                            dbstate.old_state_id = committed.get(idx)
+                        pending[idx] = dbstate
+                        if bulk_insert_queue is None:
+                            session.add(dbstate)
+                        else:
+                            bulk_insert_queue.add_state(dbstate)
+                if bulk_insert_queue is not None:
+                    bulk_insert_queue.write(session)
+                session.commit()
+                if bulk_insert_queue is not None:
+                    bulk_insert_queue.post_commit()
+                committed = {idx: dbstate.state_id for idx, dbstate in pending.items()}
+            return timer() - start
+
+    states_written = entity_count * batches * changes_per_entity
+    session_time = _write_states(None)
+    print(f"Session: {states_written / session_time:.0f} states/sec")
+    bulk_time = _write_states(BulkInsertQueue())
+    print(f"Bulk insert: {states_written / bulk_time:.0f} states/sec")
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+    return bulk_time
+
+
+@benchmark
+async def entity_registry_save(hass):
+    """Save a 10k entity registry after single entity changes.
+
+    Compares writing the changed entity to the journal with writing a full
+    snapshot, and the time the event loop spends collecting the data.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    entity_count = 10000
+    saves = 100
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        for idx in range(entity_count):
+            registry.async_get_or_create(
+                "sensor", "benchmark", str(idx), original_name=f"Sensor {idx}"
+            )
+        entity_ids = list(registry.entities)
+        store = registry._store  # pylint: disable=protected-access
+        # pylint: disable-next=protected-access
+        await store._async_handle_write_data()
+
+        async def _save_changes(name: str, journal: bool) -> float:
+            start = timer()
+            for entity_id in entity_ids[:saves]:
+                registry.async_update_entity(entity_id, name=name)
+                if not journal:
+                    # Replace the scheduled save with one of all data
+                    # pylint: disable-next=protected-access
+                    store.async_delay_save(registry._data_to_save)
+                # pylint: disable-next=protected-access
+                await store._async_handle_write_data()
+            return timer() - start
+
+        journal_time = await _save_changes("Journal", True)
+        snapshot_time = await _save_changes("Snapshot", False)
+
+        registry.async_update_entity(entity_ids[0], name="Loop")
+        start = timer()
+        registry._changes_to_save()  # pylint: disable=protected-access
+        journal_loop_time = timer() - start
+        start = timer()
+        registry._data_to_save()  # pylint: disable=protected-access
+        snapshot_loop_time = timer() - start
+
+    print(
+        f"Journal: {journal_time / saves * 1000:.2f} ms/save,"
+        f" {journal_loop_time * 1000:.3f} ms on the event loop"
+    )
+    print(
+        f"Snapshot: {snapshot_time / saves * 1000:.2f} ms/save,"
+        f" {snapshot_loop_time * 1000:.3f} ms on the event loop"
+    )
+    return journal_time
+
+
+@benchmark
+async def integration_index(hass):
+    """Resolve all built-in integrations with a cold and a warm index.
+
+    A cold start reads and parses every manifest and scans the integration
+    directories, a warm start only checks them against the index. Also
+    looks up a platform that no integration has, like the lookups of
+    optional platforms done at startup.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components, loader
+
+    domains = [
+        entry.name
+        for path in components.__path__
+        for entry in os.scandir(path)
+        if entry.is_dir() and not entry.name.startswith("__")
+    ]
+    # Only look up platforms of integrations that can be imported here
+    imported = []
+    for domain in domains:
+        with suppress(Exception):
+            importlib.import_module(f"homeassistant.components.{domain}")
+            imported.append(domain)
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+
+        async def _resolve(index: bool) -> tuple[float, float]:
+            hass.data.pop(loader.DATA_INTEGRATIONS, None)
+            hass.data.pop(loader.DATA_INTEGRATION_INDEX, None)
+            start = timer()
+            if index:
+                await loader.async_load_integration_index(hass)
+            integrations = await loader.async_get_integrations(hass, domains)
+            resolve_time = timer() - start
+            start = timer()
+            for domain in imported:
+                integration = cast(loader.Integration, integrations[domain])
+                with suppress(ImportError):
+                    integration.get_platform("benchmark_missing")
+            return resolve_time, timer() - start
+
+        no_index = await _resolve(False)
+        cold = await _resolve(True)
+        index = hass.data[loader.DATA_INTEGRATION_INDEX]
+        # pylint: disable-next=protected-access
+        await index._store.async_save(index._data_to_save())
+        warm = await _resolve(True)
+
+    print(f"Integrations: {len(domains)}, imported: {len(imported)}")
+    for name, (resolve_time, platform_time) in (
+        ("Without index", no_index),
+        ("Cold index", cold),
+        ("Warm index", warm),
+    ):
+        print(
+            f"{name}: resolve {resolve_time * 1000:.1f} ms,"
+            f" missing platforms {platform_time * 1000:.1f} ms"
+        )
+    return warm[0]
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match MQTT topics while the number of wildcard subscriptions grows.
+
+    Compares testing every subscription with its own matcher, like the MQTT
+    client did before, with the shared topic trie. Every topic is distinct,
+    so this measures matching without the match cache.
+    """
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    messages = 10**4
+    total = 0.0
+
+    def _matcher_for_topic(topic_filter):
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        return lambda topic: next(matcher.iter_match(topic), False)
+
+    for subscription_count in (10, 100, 1000, 4000):
+        topic_filters = [
+            *(f"zigbee2mqtt/device{idx}/+" for idx in range(subscription_count // 2)),
+            *(
+                f"homeassistant/+/device{idx}/#"
+                for idx in range(subscription_count // 2)
+            ),
+        ]
+        topics = [
+            f"zigbee2mqtt/device{idx % (subscription_count // 2)}/state{idx}"
+            for idx in range(messages)
+        ]
+
+        # Testing every matcher is slow, time it on fewer messages
+        linear_topics = topics[: messages // 10]
+        matchers = [_matcher_for_topic(topic_filter) for topic_filter in topic_filters]
+        start = timer()
+        for topic in linear_topics:
+            [matcher for matcher in matchers if matcher(topic)]
+        linear_runtime = timer() - start
+
+        trie = TopicTrie()
+        for topic_filter in topic_filters:
+            trie.add(topic_filter, topic_filter)
+        start = timer()
+        for topic in topics:
+            trie.match(topic)
+        trie_runtime = timer() - start
+        total += trie_runtime
+
+        print(
+            f"{subscription_count:>5} subscriptions:"
+            f" {len(linear_topics) / linear_runtime:>12,.0f} messages/sec linear,"
+            f" {messages / trie_runtime:>12,.0f} messages/sec trie"
+        )
+
+    return total
+
+
+def _tracemalloc_diff(snapshot_start: tracemalloc.Snapshot) -> int:
+    """Return the bytes allocated since a snapshot."""
+    return sum(
+        stat.size_diff
+        for stat in tracemalloc.take_snapshot().compare_to(snapshot_start, "filename")
+    )
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
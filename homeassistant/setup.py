@@ -53,6 +53,10 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TIMELINE is a dict [str, dict[str, datetime]], indicating when the
+# phases of importing and setting up a component during bootstrap happened.
+DATA_SETUP_TIMELINE = "setup_timeline"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
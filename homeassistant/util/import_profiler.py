@@ -0,0 +1,166 @@
+"""Record how long it takes to import modules.
+
+The import profiler is a meta path finder that wraps the loader of every
+module imported while it is installed and measures how long executing the
+module takes. Imports nested inside a module are included in its cumulative
+time and excluded from its own time. The own time of a module is also
+attributed to the integration that was being imported when it was loaded, so
+the requirements pulled in by an integration are accounted to it.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+_INTEGRATION_PACKAGES = ("homeassistant.components.", "custom_components.")
+
+_ACTIVE_PROFILER: ImportProfiler | None = None
+
+
+@dataclass(slots=True)
+class ModuleImportTime:
+    """Time spent importing a module."""
+
+    own: float
+    cumulative: float
+
+
+def integration_for_module(name: str) -> str | None:
+    """Return the integration domain a module belongs to."""
+    for package in _INTEGRATION_PACKAGES:
+        if name.startswith(package):
+            return name[len(package) :].partition(".")[0]
+    return None
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader that times how long the wrapped loader executes a module."""
+
+    def __init__(self, loader: Any, profiler: ImportProfiler) -> None:
+        """Initialize the loader."""
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the wrapped loader."""
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Any:
+        """Create the module with the wrapped loader."""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Execute the module and record how long it took."""
+        profiler = self._profiler
+        profiler.push(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            profiler.pop()
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Meta path finder that records import times."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.modules: dict[str, ModuleImportTime] = {}
+        self.integrations: defaultdict[str, float] = defaultdict(float)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        """Find the module with the other finders and time its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            if (spec := finder.find_spec(fullname, path, target)) is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def push(self, name: str) -> None:
+        """Start timing a module."""
+        if (stack := getattr(self._local, "stack", None)) is None:
+            stack = self._local.stack = []
+        if (domain := integration_for_module(name)) is None and stack:
+            domain = stack[-1][1]
+        # name, integration, start, time spent in nested imports
+        stack.append([name, domain, time.perf_counter(), 0.0])
+
+    def pop(self) -> None:
+        """Stop timing a module."""
+        stack: list[list[Any]] = self._local.stack
+        name, domain, start, nested = stack.pop()
+        cumulative = time.perf_counter() - start
+        own = cumulative - nested
+        if stack:
+            stack[-1][3] += cumulative
+        with self._lock:
+            self.modules[name] = ModuleImportTime(own, cumulative)
+            if domain is not None:
+                self.integrations[domain] += own
+
+    def report(self, limit: int | None = None) -> str:
+        """Return a human readable report of the slowest imports."""
+        modules = sorted(
+            self.modules.items(), key=lambda item: item[1].cumulative, reverse=True
+        )
+        integrations = sorted(
+            self.integrations.items(), key=lambda item: item[1], reverse=True
+        )
+        lines = [
+            f"Import times of {len(self.modules)} modules and"
+            f" {len(self.integrations)} integrations",
+            "",
+            "Integrations (seconds, including requirements):",
+        ]
+        lines.extend(
+            f"{seconds:10.4f}  {domain}" for domain, seconds in integrations[:limit]
+        )
+        lines.extend(["", "Modules (cumulative seconds / own seconds):"])
+        lines.extend(
+            f"{times.cumulative:10.4f} {times.own:10.4f}  {name}"
+            for name, times in modules[:limit]
+        )
+        return "\n".join(lines) + "\n"
+
+
+def start_import_profiler() -> ImportProfiler:
+    """Install the import profiler in front of the other finders."""
+    global _ACTIVE_PROFILER  # pylint: disable=global-statement
+
+    if _ACTIVE_PROFILER is None:
+        _ACTIVE_PROFILER = ImportProfiler()
+        sys.meta_path.insert(0, _ACTIVE_PROFILER)
+    return _ACTIVE_PROFILER
+
+
+def stop_import_profiler() -> None:
+    """Remove the import profiler."""
+    global _ACTIVE_PROFILER  # pylint: disable=global-statement
+
+    if _ACTIVE_PROFILER is not None:
+        sys.meta_path.remove(_ACTIVE_PROFILER)
+        _ACTIVE_PROFILER = None
+
+
+def get_import_profiler() -> ImportProfiler | None:
+    """Return the active import profiler."""
+    return _ACTIVE_PROFILER
@@ -0,0 +1,135 @@
+"""Measure how long callbacks keep the event loop busy.
+
+The loop monitor is opt-in. When it is set on Home Assistant, callback jobs
+and event listeners that run in the event loop are timed. The durations are
+kept in a latency histogram per job and every run that takes longer than the
+stall threshold is logged together with the job that caused it.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+import functools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..core import HassJob
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STALL_THRESHOLD = 0.1
+MAX_STALLS = 100
+
+# Upper bounds in seconds, the last bucket counts everything above
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+def job_name(job: HassJob[..., Any]) -> str:
+    """Return a name for a job.
+
+    Jobs are named after the function they run since the names of jobs, like
+    the ones of event listeners, are shared by many functions.
+    """
+    target = job.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    if (qualname := getattr(target, "__qualname__", None)) is None:
+        return job.name or repr(target)
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+class LatencyHistogram:
+    """Histogram of how long the runs of a job took."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a run."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": list(self.buckets),
+        }
+
+
+@dataclass(slots=True)
+class LoopStall:
+    """A run of a job that took longer than the stall threshold."""
+
+    job: str
+    duration: float
+    timestamp: float
+
+
+class LoopMonitor:
+    """Time jobs that run in the event loop."""
+
+    def __init__(self, stall_threshold: float = DEFAULT_STALL_THRESHOLD) -> None:
+        """Initialize the loop monitor."""
+        self.stall_threshold = stall_threshold
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.stalls: deque[LoopStall] = deque(maxlen=MAX_STALLS)
+
+    def run_job(self, job: HassJob[..., Any], *args: Any) -> None:
+        """Run a callback job and record how long it took."""
+        start = time.perf_counter()
+        try:
+            job.target(*args)
+        finally:
+            self.record(job, time.perf_counter() - start)
+
+    def record(self, job: HassJob[..., Any], duration: float) -> None:
+        """Record how long a run of a job took."""
+        name = job_name(job)
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.add(duration)
+        if duration >= self.stall_threshold:
+            self.stalls.append(LoopStall(name, duration, time.time()))
+            _LOGGER.warning(
+                "Event loop was blocked for %.3f seconds by %s (%s)",
+                duration,
+                name,
+                job.target,
+            )
+
+    def as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return the jobs that kept the loop busy the longest."""
+        histograms = sorted(
+            self.histograms.items(), key=lambda item: item[1].total, reverse=True
+        )
+        return {
+            "stall_threshold": self.stall_threshold,
+            "bucket_bounds": list(LATENCY_BUCKETS),
+            "jobs": {
+                name: histogram.as_dict() for name, histogram in histograms[:limit]
+            },
+            "stalls": [
+                {
+                    "job": stall.job,
+                    "duration": stall.duration,
+                    "timestamp": stall.timestamp,
+                }
+                for stall in self.stalls
+            ],
+        }
@@ -1,5 +1,8 @@
 """Read only dictionary."""
-from typing import Any, TypeVar
+from collections.abc import Mapping
+from types import NoneType
+from typing import Any, TypeVar, cast
+from weakref import WeakValueDictionary
 
 
 def _readonly(*args: Any, **kwargs: Any) -> Any:
@@ -14,6 +17,10 @@ _VT = TypeVar("_VT")
 class ReadOnlyDict(dict[_KT, _VT]):
     """Read only version of dict that is compatible with dict types."""
 
+    # Hash of the content of an interned read only dict. Interned read
+    # only dicts are equal if and only if they are the same object.
+    content_hash: int | None = None
+
     __setitem__ = _readonly
     __delitem__ = _readonly
     pop = _readonly
@@ -21,3 +28,67 @@ class ReadOnlyDict(dict[_KT, _VT]):
     clear = _readonly
     update = _readonly
     setdefault = _readonly
+
+
+# Interned read only dicts keyed by their frozen content. Entries are
+# dropped as soon as the last State or history result referencing them
+# goes away.
+_INTERNED: WeakValueDictionary[
+    tuple[Any, ...], ReadOnlyDict[Any, Any]
+] = WeakValueDictionary()
+
+# Types that are frozen by value, other values are never shared because
+# values that compare equal may still differ, like datetimes in different
+# time zones or Decimals with a different precision.
+_FROZEN_BY_VALUE = {str, int, bool, NoneType}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of a value.
+
+    The type is part of the representation so values that compare
+    equal but serialize differently (True, 1 and 1.0 or a tuple and a
+    list) are never shared. Mutable containers are never shared, because
+    the owner may still mutate them.
+
+    Raises TypeError if the value can not be represented.
+    """
+    if (value_type := type(value)) is str:
+        return value
+    if value_type in _FROZEN_BY_VALUE:
+        return (value_type, value)
+    if value_type is float:
+        # 0.0 and -0.0 are equal but are not the same value
+        return (float, value.hex())
+    if value_type is tuple:
+        return (tuple, tuple(_freeze(item) for item in value))
+    if value_type is frozenset:
+        return (frozenset, frozenset(_freeze(item) for item in value))
+    raise TypeError(f"{value_type} can not be interned")
+
+
+def intern_read_only_dict(mapping: Mapping[_KT, _VT]) -> ReadOnlyDict[_KT, _VT]:
+    """Return a shared ReadOnlyDict with the content of mapping.
+
+    Identical mappings share a single ReadOnlyDict so they only take
+    memory once and can be compared by identity. Mappings with values
+    that can not be frozen get their own ReadOnlyDict, without a
+    content_hash.
+
+    Safe to call from any thread; a race only results in a missed
+    opportunity to share.
+    """
+    if getattr(mapping, "content_hash", None) is not None:
+        return cast(ReadOnlyDict[_KT, _VT], mapping)
+    try:
+        key = tuple((key, _freeze(value)) for key, value in mapping.items())
+        return _INTERNED[key]
+    except KeyError:
+        read_only_dict: ReadOnlyDict[_KT, _VT] = (
+            mapping if type(mapping) is ReadOnlyDict else ReadOnlyDict(mapping)
+        )
+        read_only_dict.content_hash = hash(key)
+        _INTERNED[key] = read_only_dict
+        return read_only_dict
+    except TypeError:
+        return ReadOnlyDict(mapping)
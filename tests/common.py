@@ -64,6 +64,7 @@ from homeassistant.helpers import (
     storage,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_run_timer_wheel
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import ConfigType, StateType
 from homeassistant.setup import setup_component
@@ -396,7 +397,22 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = date_util.utc_to_timestamp(utc_datetime)
-    for task in list(hass.loop._scheduled):
+    scheduled = list(hass.loop._scheduled)
+    mock_seconds_into_future = timestamp - time.time()
+    with patch(
+        "homeassistant.helpers.event.time_tracker_utcnow",
+        return_value=utc_datetime,
+    ), patch(
+        "homeassistant.helpers.event.time_tracker_timestamp",
+        return_value=timestamp,
+    ):
+        # Timer wheel buckets are scheduled at the end of their tick,
+        # run the timers in them that are due instead.
+        async_run_timer_wheel(
+            hass, None if fire_all else hass.loop.time() + mock_seconds_into_future
+        )
+
+    for task in scheduled:
         if not isinstance(task, asyncio.TimerHandle):
             continue
         if task.cancelled():
@@ -1208,6 +1224,18 @@ def mock_storage(
         raise_contains_mocks(data_to_write)
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    async def mock_write_journal(
+        store: storage.Store, path: str, changes: storage.JournalChanges
+    ) -> None:
+        """Mock version of write journal."""
+        _LOGGER.debug("Writing journal to %s: %s", store.key, changes)
+        raise_contains_mocks(changes)
+        storage.apply_journal(
+            data[store.key]["data"],
+            store._journal_keys,
+            json.loads(json.dumps(changes, cls=store._encoder)),
+        )
+
     async def mock_remove(store: storage.Store) -> None:
         """Remove data."""
         data.pop(store.key, None)
@@ -1220,6 +1248,10 @@ def mock_storage(
         "homeassistant.helpers.storage.Store._async_write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._async_write_journal",
+        side_effect=mock_write_journal,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
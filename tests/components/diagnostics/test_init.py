@@ -1,5 +1,7 @@
 """Test the Diagnostics integration."""
 from http import HTTPStatus
+import threading
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -78,6 +80,39 @@ async def test_websocket(
     }
 
 
+async def test_websocket_imports_platforms_in_executor(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test listing the handlers does not import platforms in the event loop."""
+    info = hass.data["diagnostics"].platforms["fake_integration"]
+    platform = info.platform
+    imported_in: list[int] = []
+
+    class RecordingPlatform:
+        """Platform that records the thread it is imported in."""
+
+        def __getattr__(self, attr: str) -> Any:
+            imported_in.append(threading.get_ident())
+            return getattr(platform, attr)
+
+    info.platform = RecordingPlatform()
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "diagnostics/list"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert imported_in
+    assert threading.get_ident() not in imported_in
+
+    # The handlers are only looked up once
+    imported_in.clear()
+    await client.send_json(
+        {"id": 6, "type": "diagnostics/get", "domain": "fake_integration"}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["handlers"] == {"config_entry": True, "device": True}
+    assert not imported_in
+
+
 async def test_download_diagnostics(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
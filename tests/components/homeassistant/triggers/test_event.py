@@ -415,3 +415,41 @@ async def test_event_data_with_list(hass: HomeAssistant, calls) -> None:
     hass.bus.async_fire("test_event", {"some_attr": [1, 2, 3]})
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_if_fires_on_event_with_entity_id(hass: HomeAssistant, calls) -> None:
+    """Test the firing of events filtered by an entity_id in the event data."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"entity_id": "light.kitchen", "some_attr": 1},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen", "some_attr": 2})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen", "some_attr": 1})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen", "some_attr": 1})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
@@ -18,6 +18,8 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
 
+from tests.common import get_system_health_info
+
 INFLUX_PATH = "homeassistant.components.influxdb"
 INFLUX_CLIENT_PATH = f"{INFLUX_PATH}.InfluxDBClient"
 BASE_V1_CONFIG = {}
@@ -1815,3 +1817,161 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "line_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            lambda lines: call(lines, time_precision=None, protocol="line"),
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            lambda lines: call(bucket=DEFAULT_BUCKET, record=lines),
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, line_call, tmp_path
+) -> None:
+    """Test events are written in line protocol."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"line_protocol": True, "tags": {"instance": "living room"}}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state="on",
+        domain="fake",
+        entity_id="fake.entity-id",
+        object_id="entity",
+        attributes={
+            "unit_of_measurement": "foo,bars",
+            "friendly_name": 'The "entity"',
+            "temperature": "20c",
+            "infinite": float("inf"),
+        },
+    )
+    event = MagicMock(
+        data={"new_state": state},
+        time_fired=datetime.datetime(
+            2023, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+        ),
+    )
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == line_call(
+        [
+            r"foo\,bars,domain=fake,entity_id=entity,instance=living\ room "
+            r'state="on",value=1.0,friendly_name_str="The \"entity\"",'
+            r'temperature_str="20c",temperature=20.0 1672628645678901000'
+        ]
+    )
+    assert hass.data[influxdb.DOMAIN].metrics()["points_written"] == 1
+
+    assert await async_setup_component(hass, "system_health", {})
+    info = await get_system_health_info(hass, influxdb.DOMAIN)
+    assert info["connected"] is True
+    assert info["points_written"] == 1
+    assert info["spooled_points"] == 0
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol_spool(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    tmp_path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test points are spooled while InfluxDB is down and written later."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"line_protocol": True}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    write_api = get_write_api(mock_client)
+
+    def fire_event(value):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="fake.entity-id",
+            object_id="entity",
+            attributes={},
+        )
+        handler_method(
+            MagicMock(
+                data={"new_state": state},
+                time_fired=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+            )
+        )
+        instance.block_till_done()
+
+    def written_values():
+        return [
+            [
+                line.split()[1]
+                for line in (call_args.args or (call_args.kwargs["record"],))[0]
+            ]
+            for call_args in write_api.call_args_list
+        ]
+
+    # The failed batch is spooled and the next one is added to it
+    # without writing
+    write_api.side_effect = OSError("foo")
+    fire_event("1")
+    fire_event("2")
+    assert write_api.call_count == 1
+    assert len(list((tmp_path / ".storage" / "influxdb_spool").iterdir())) == 1
+    assert instance.metrics()["spooled_points"] == 2
+
+    # New points are written first, followed by the spooled batches
+    write_api.side_effect = None
+    write_api.reset_mock()
+    instance._retry_at = 0
+    fire_event("3")
+    assert written_values() == [["value=3.0"], ["value=1.0", "value=2.0"]]
+    assert "Resumed, spooled 2 events to write later." in caplog.text
+
+    # The spooled batches are written back-to-back
+    write_api.reset_mock()
+    for value in ("5", "6", "7"):
+        instance.spool.append([f"fake,entity_id=entity value={value}.0 1"], 1)
+    fire_event("4")
+    assert written_values() == [
+        ["value=4.0"],
+        ["value=5.0"],
+        ["value=6.0"],
+        ["value=7.0"],
+    ]
+    metrics = instance.metrics()
+    assert metrics["points_written"] == 7
+    assert metrics["spooled_batches"] == 0
+    assert metrics["spooled_points"] == 0
+    assert metrics["dropped_points"] == 0
@@ -0,0 +1,62 @@
+"""The tests for the InfluxDB spool."""
+from homeassistant.components.influxdb.spool import InfluxSpool
+
+
+def test_spool_ring_buffer(tmp_path) -> None:
+    """Test the oldest batches are dropped when the spool is full."""
+    spool = InfluxSpool(str(tmp_path), 3)
+    assert spool.peek() is None
+
+    assert spool.append(["a value=1", "a value=2"], 2) == 0
+    assert spool.append(["a value=3"], 2) == 0
+    assert len(spool) == 2
+    assert spool.points == 3
+
+    assert spool.append(["a value=4", "a value=5"], 2) == 2
+    assert len(spool) == 2
+    assert spool.points == 3
+    assert spool.peek() == ["a value=3"]
+
+    spool.pop()
+    assert spool.peek() == ["a value=4", "a value=5"]
+    assert spool.points == 2
+
+    # The newest batch is kept even if it is larger than the spool
+    assert spool.append(["a value=6"] * 4, 4) == 2
+    assert spool.peek() == ["a value=6"] * 4
+
+
+def test_spool_fills_newest_batch(tmp_path) -> None:
+    """Test points are added to the newest batch up to the batch size."""
+    spool = InfluxSpool(str(tmp_path), 100)
+    for value in range(5):
+        spool.append([f"a value={value}"], 2)
+    assert len(spool) == 3
+    assert len(list(tmp_path.iterdir())) == 3
+    assert spool.points == 5
+    assert spool.peek() == ["a value=0", "a value=1"]
+
+    # A larger batch size only applies to the newest batch
+    spool.append(["a value=5", "a value=6"], 4)
+    assert len(spool) == 3
+    spool.pop()
+    spool.pop()
+    assert spool.peek() == ["a value=4", "a value=5", "a value=6"]
+
+
+def test_spool_reloads_batches(tmp_path) -> None:
+    """Test the batches left by a previous run are written in order."""
+    spool = InfluxSpool(str(tmp_path), 10)
+    spool.append(["a value=1", "a value=2"], 2)
+    spool.append(["a value=3"], 2)
+    (tmp_path / "unrelated.txt").write_text("ignored")
+
+    spool = InfluxSpool(str(tmp_path), 10)
+    assert len(spool) == 2
+    assert spool.points == 3
+    assert spool.peek() == ["a value=1", "a value=2"]
+    spool.pop()
+    spool.append(["a value=4"], 2)
+    assert spool.peek() == ["a value=3", "a value=4"]
+    spool.pop()
+    assert spool.peek() is None
@@ -49,6 +49,24 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "subscription_match_cache": {
+            "size": 0,
+            "max_size": 8192,
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "simple_subscriptions": 0,
+            "wildcard_subscriptions": 5,
+        },
+        "inbound_messages": {
+            "depth": 0,
+            "max_depth": 0,
+            "messages": 0,
+            "batches": 0,
+            "latency_mean": 0.0,
+            "latency_max": 0.0,
+        },
+        "publish_queues": {},
     }
 
     # Discover a device with an entity and a trigger
@@ -133,6 +151,9 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "subscription_match_cache": ANY,
+        "inbound_messages": ANY,
+        "publish_queues": ANY,
     }
 
     assert await get_diagnostics_for_device(
@@ -260,6 +281,9 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "subscription_match_cache": ANY,
+        "inbound_messages": ANY,
+        "publish_queues": ANY,
     }
 
     assert await get_diagnostics_for_device(
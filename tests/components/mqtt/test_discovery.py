@@ -25,6 +25,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 
@@ -168,6 +169,64 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+@patch("homeassistant.components.mqtt.PLATFORMS", [Platform.SENSOR])
+async def test_bulk_discovery(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test retained discovery messages are set up in bulk."""
+    await mqtt_mock_entry()
+    mqtt_data = hass.data["mqtt"]
+    with patch.object(
+        EntityPlatform,
+        "async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        for idx in range(3):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/sensor/bla{idx}/config",
+                json.dumps({"name": f"Beer {idx}", "state_topic": "test-topic"}),
+                retain=True,
+            )
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/sensor/invalid/config",
+            '{ "name": "Beer", "state_topic": "test-topic#" }',
+            retain=True,
+        )
+        await hass.async_block_till_done()
+
+    assert mock_add_entities.call_count == 1
+    assert [entity.name for entity in mock_add_entities.call_args[0][1]] == [
+        "Beer 0",
+        "Beer 1",
+        "Beer 2",
+    ]
+    for idx in range(3):
+        assert hass.states.get(f"sensor.beer_{idx}") is not None
+    assert "Error setting up discovered item MQTT sensor" in caplog.text
+    assert ("sensor", "invalid") not in mqtt_data.discovery_already_discovered
+    assert len(mqtt_data.discovery_schema_cache) == 3
+
+    # A removed item discovered again reuses the validated payload
+    config = hass.data["sensor"].get_entity("sensor.beer_0")._config
+    async_fire_mqtt_message(hass, "homeassistant/sensor/bla0/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.beer_0") is None
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla0/config",
+        json.dumps({"name": "Beer 0", "state_topic": "test-topic"}),
+        retain=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.data["sensor"].get_entity("sensor.beer_0")._config is config
+    assert len(mqtt_data.discovery_schema_cache) == 3
+
+
 @patch("homeassistant.components.mqtt.PLATFORMS", [Platform.FAN])
 async def test_discover_fan(
     hass: HomeAssistant,
@@ -1205,6 +1205,52 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+async def test_subscription_match_cache(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test only the cached matches a subscription affects are invalidated."""
+    await mqtt_mock_entry()
+    mqtt_client = mqtt.get_mqtt_data(hass).client
+    await mqtt.async_subscribe(hass, "home/+/state", record_calls)
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    async_fire_mqtt_message(hass, "home/kitchen/state", "off")
+    async_fire_mqtt_message(hass, "garden/pump/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    stats = mqtt_client.async_match_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    assert stats["size"] == 2
+
+    # Subscribing to garden topics keeps the cached matches of home topics
+    unsub = await mqtt.async_subscribe(hass, "garden/#", record_calls)
+    stats = mqtt_client.async_match_cache_stats()
+    assert stats["invalidations"] == 1
+    assert stats["size"] == 1
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    async_fire_mqtt_message(hass, "garden/pump/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+    assert mqtt_client.async_match_cache_stats()["hits"] == 2
+
+    unsub()
+    async_fire_mqtt_message(hass, "garden/pump/state", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    # Subscribing to a topic without wildcards only drops that topic
+    await mqtt.async_subscribe(hass, "home/kitchen/state", record_calls)
+    assert mqtt_client.async_match_cache_stats()["invalidations"] == 3
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
@@ -1758,6 +1804,54 @@ async def test_handle_message_callback(
     assert callbacks[0].payload == "test-payload"
 
 
+@patch("homeassistant.components.mqtt.client.INBOUND_BATCH_SIZE", 2)
+async def test_handle_message_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages received by the paho thread are handled in batches."""
+    mock_mqtt = await mqtt_mock_entry()
+    mqtt_client = mqtt.get_mqtt_data(hass).client
+    mqtt_client_mock.on_connect(mqtt_client_mock, None, None, 0)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    def _receive_messages() -> None:
+        for idx in range(5):
+            msg = ReceiveMessage(f"test-topic/{idx % 2}", f"{idx}".encode(), 0, False)
+            mqtt_client_mock.on_message(mock_mqtt, None, msg)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        await hass.async_add_executor_job(_receive_messages)
+        await hass.async_block_till_done()
+        await hass.async_block_till_done()
+
+    # The event loop was woken up once and handled the messages in order
+    wakeups = [
+        args
+        for args, _ in mock_call_soon_threadsafe.call_args_list
+        if getattr(args[0], "__name__", None) == "_async_handle_inbound_messages"
+    ]
+    assert len(wakeups) == 1
+    assert [(msg.topic, msg.payload) for msg in calls] == [
+        ("test-topic/0", "0"),
+        ("test-topic/1", "1"),
+        ("test-topic/0", "2"),
+        ("test-topic/1", "3"),
+        ("test-topic/0", "4"),
+    ]
+    stats = mqtt_client.async_inbound_stats()
+    assert stats["depth"] == 0
+    assert stats["max_depth"] == 5
+    assert stats["messages"] == 5
+    assert stats["batches"] == 3
+    assert stats["latency_max"] >= stats["latency_mean"] >= 0.0
+
+
 @patch("homeassistant.components.mqtt.PLATFORMS", [])
 async def test_setup_manual_mqtt_with_platform_key(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -0,0 +1,73 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie, topic_matches
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b", "a/b", True),
+        ("a/b", "a/c", False),
+        ("a/+", "a/b", True),
+        ("a/+", "a", False),
+        ("a/+", "a/b/c", False),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b", True),
+        ("+/b", "/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_matching(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against a filter."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+    assert topic_matches(topic_filter, topic) is matches
+
+
+def test_match_order_and_remove() -> None:
+    """Test values are matched in the order they were added and can be removed."""
+    trie: TopicTrie[object] = TopicTrie()
+    first, second, third, fourth = object(), object(), object(), object()
+    trie.add("home/+/state", first)
+    trie.add("home/#", second)
+    trie.add("home/+/state", third)
+    trie.add("other/#", fourth)
+
+    assert len(trie) == 4
+    assert trie.match("home/kitchen/state") == [first, second, third]
+    assert trie.values() == [first, second, third, fourth]
+    assert trie.has_filter("home/+/state")
+    assert not trie.has_filter("home/+")
+
+    trie.remove("home/+/state", first)
+    assert trie.match("home/kitchen/state") == [second, third]
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", first)
+    with pytest.raises(KeyError):
+        trie.remove("home/+/other", first)
+
+    trie.remove("home/+/state", third)
+    assert not trie.has_filter("home/+/state")
+    trie.remove("home/#", second)
+    trie.remove("other/#", fourth)
+    assert len(trie) == 0
+    assert trie.values() == []
+    assert trie.match("home/kitchen/state") == []
+
+
+def test_match_topic_with_wildcards() -> None:
+    """Test a topic containing wildcards matches each value once."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("a/#", "subtree")
+    assert trie.match("a/#") == ["subtree"]
+
+    trie.add("a/+", "level")
+    assert trie.match("a/#") == ["subtree", "level"]
+    assert trie.match("a/+") == ["subtree", "level"]
@@ -233,6 +233,39 @@ async def test_state_changed_attr_sends_message(
     assert mqtt_mock.async_publish.called
 
 
+async def test_state_changed_events_are_coalesced(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test only the last state is published when the window is full."""
+    e_id = "fake.entity"
+
+    assert await async_setup_component(
+        hass,
+        statestream.DOMAIN,
+        {statestream.DOMAIN: {"base_topic": "pub", "publish_window": 1}},
+    )
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish.reset_mock()
+
+    for state in ("1", "2", "3", "4"):
+        mock_state_change_event(hass, State(e_id, state))
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    assert mqtt_mock.async_publish.mock_calls == [
+        call("pub/fake/entity/state", "1", 1, True),
+        call("pub/fake/entity/state", "4", 1, True),
+    ]
+    stats = hass.data["mqtt"].publish_queues[statestream.DOMAIN].async_stats()
+    assert stats["depth"] == 0
+    assert stats["max_depth"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["window"] == 1
+    assert stats["published"] == 2
+    assert stats["coalesced"] == 2
+    assert stats["errors"] == 0
+
+
 async def test_state_changed_event_include_domain(
     hass: HomeAssistant, mqtt_mock: MqttMockHAClient
 ) -> None:
@@ -15,22 +15,28 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
+    SERVICE_LOG_LOOP_MONITOR,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_MONITOR,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import import_profiler
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -251,12 +257,118 @@ async def test_log_scheduled(
     )
 
     assert "Scheduled" in caplog.text
+    assert "Timer wheel" in caplog.text
     caplog.clear()
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
 
+async def test_log_import_times(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, tmp_path: Path
+) -> None:
+    """Test we can log and write out the recorded import times."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_IMPORT_TIMES)
+
+    with pytest.raises(HomeAssistantError, match="--profile-imports"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_IMPORT_TIMES, {}, blocking=True
+        )
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    profiler = import_profiler.ImportProfiler()
+    profiler.push("homeassistant.components.slow.sensor")
+    profiler.pop()
+    with patch(
+        "homeassistant.components.profiler.import_profiler.get_import_profiler",
+        return_value=profiler,
+    ), patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_IMPORT_TIMES, {}, blocking=True
+        )
+
+    assert "homeassistant.components.slow.sensor" in caplog.text
+    with open(last_filename, encoding="utf8") as report:
+        assert "slow" in report.read()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test we can time the jobs run in the event loop."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/loop_monitor"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False}
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_LOOP_MONITOR, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_MONITOR, {"stall_threshold": 0}, blocking=True
+    )
+    assert hass.loop_monitor is not None
+    with pytest.raises(HomeAssistantError, match="already running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LOOP_MONITOR, {}, blocking=True
+        )
+
+    @callback
+    def _listener(event):
+        """Listen to events."""
+
+    hass.bus.async_listen("monitored_event", _listener, run_immediately=True)
+    hass.bus.async_fire("monitored_event")
+    listener_name = f"{__name__}.test_loop_monitor.<locals>._listener"
+    assert f"Event loop was blocked for 0.000 seconds by {listener_name}" in (
+        caplog.text
+    )
+
+    await client.send_json({"id": 2, "type": "profiler/loop_monitor"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    assert response["result"]["stall_threshold"] == 0
+    assert response["result"]["jobs"][listener_name]["count"] == 1
+    assert listener_name in {stall["job"] for stall in response["result"]["stalls"]}
+
+    caplog.clear()
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_LOOP_MONITOR, {}, blocking=True)
+    assert f"Loop time of {listener_name}: 1 runs" in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True)
+    assert hass.loop_monitor is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     """Test logging lru stats."""
 
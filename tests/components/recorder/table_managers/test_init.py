@@ -0,0 +1,46 @@
+"""Test the table managers base classes."""
+from homeassistant.components.recorder.table_managers import (
+    ENTRY_OVERHEAD_BYTES,
+    SizeLimitedLRU,
+)
+
+
+def test_size_limited_lru() -> None:
+    """Test the LRU evicts by the memory the shared data takes."""
+    lru = SizeLimitedLRU(3 * (10 + ENTRY_OVERHEAD_BYTES), 100 + ENTRY_OVERHEAD_BYTES)
+
+    lru["a" * 10] = 1
+    lru["b" * 10] = 2
+    lru["c" * 10] = 3
+    assert len(lru) == 3
+    assert lru.get("a" * 10) == 1
+    assert lru.get("missing") is None
+
+    # Too large to be cached
+    lru["x" * 101] = 4
+    assert "x" * 101 not in lru
+    assert len(lru) == 3
+
+    # Pushes out the two least recently used entries
+    lru["d" * 20] = 5
+    assert list(lru) == ["a" * 10, "d" * 20]
+    assert lru.stats() == {
+        "entries": 2,
+        "bytes": 30 + 2 * ENTRY_OVERHEAD_BYTES,
+        "max_bytes": 30 + 3 * ENTRY_OVERHEAD_BYTES,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 2,
+    }
+
+    lru.pop("a" * 10)
+    lru["c" * 10] = 3
+    assert lru.stats()["bytes"] == 30 + 2 * ENTRY_OVERHEAD_BYTES
+
+    lru.set_max_bytes(20 + ENTRY_OVERHEAD_BYTES)
+    assert list(lru) == ["c" * 10]
+    assert lru.stats()["evictions"] == 3
+
+    lru.clear()
+    assert len(lru) == 0
+    assert lru.stats()["bytes"] == 0
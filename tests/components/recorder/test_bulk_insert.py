@@ -0,0 +1,162 @@
+"""Test writing States and Events with multi-row INSERT statements."""
+import gc
+from unittest.mock import patch
+import weakref
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError, PendingRollbackError
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder.bulk_insert import BulkInsertQueue
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+
+def test_bulk_insert_queue() -> None:
+    """Test states are linked to the state they replaced."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queue = BulkInsertQueue()
+    assert not queue
+
+    with Session(engine) as session:
+        states_meta = StatesMeta(entity_id="sensor.one")
+        state_attributes = StateAttributes(shared_attrs="{}", hash=1)
+        event_types = EventTypes(event_type="test_event")
+        event_data = EventData(shared_data='{"any": "data"}', hash=2)
+        session.add_all((states_meta, state_attributes, event_types, event_data))
+
+        first = States(state="1", last_updated_ts=1)
+        first.states_meta_rel = states_meta
+        first.state_attributes = state_attributes
+        # Never queued, but written since a queued state links to it
+        second = States(state="2", last_updated_ts=2, old_state=first)
+        third = States(state="3", last_updated_ts=3, old_state=second)
+        third.states_meta_rel = states_meta
+        other = States(state="other", last_updated_ts=1)
+        queue.add_state(first)
+        queue.add_state(third)
+        queue.add_state(other)
+        dbevent = Events(time_fired_ts=1)
+        dbevent.event_type_rel = event_types
+        dbevent.event_data_rel = event_data
+        queue.add_event(dbevent)
+        assert queue
+
+        queue.write(session)
+        session.commit()
+        # The ids are only set once the commit has succeeded
+        assert first.state_id is None
+        queue.post_commit()
+        assert not queue
+
+        assert first.state_id is not None
+        assert second.state_id is not None
+        assert third.state_id is not None
+        assert other.state_id is not None
+
+        fourth = States(state="4", last_updated_ts=4, old_state_id=third.state_id)
+        queue.add_state(fourth)
+        queue.write(session)
+        session.commit()
+        queue.post_commit()
+
+        rows = {
+            row.state: row
+            for row in session.execute(
+                select(
+                    States.state_id,
+                    States.state,
+                    States.old_state_id,
+                    States.metadata_id,
+                    States.attributes_id,
+                )
+            )
+        }
+        assert len(rows) == 5
+        assert rows["1"].state_id == first.state_id
+        assert rows["1"].old_state_id is None
+        assert rows["1"].metadata_id == states_meta.metadata_id
+        assert rows["1"].attributes_id == state_attributes.attributes_id
+        assert rows["2"].old_state_id == first.state_id
+        assert rows["3"].old_state_id == second.state_id
+        assert rows["3"].metadata_id == states_meta.metadata_id
+        assert rows["4"].old_state_id == third.state_id
+        assert rows["other"].old_state_id is None
+
+        event_rows = list(session.execute(select(Events.event_type_id, Events.data_id)))
+        assert event_rows == [(event_types.event_type_id, event_data.data_id)]
+
+
+def test_bulk_insert_queue_write_failure() -> None:
+    """Test the queue is not written again after a failed write."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queue = BulkInsertQueue()
+
+    with Session(engine) as session:
+        first = States(state="1", last_updated_ts=1)
+        second = States(state="2", last_updated_ts=2, old_state=first)
+        queue.add_state(first)
+        queue.add_state(second)
+
+        calls = 0
+        real_execute = session.execute
+
+        def _fail_second_generation(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise OperationalError("insert", "params", "forced to fail")
+            return real_execute(*args, **kwargs)
+
+        with patch.object(session, "execute", _fail_second_generation), pytest.raises(
+            OperationalError
+        ):
+            queue.write(session)
+        # The first generation is already in the transaction, writing
+        # it again would insert it twice
+        with pytest.raises(PendingRollbackError):
+            queue.write(session)
+        assert first.state_id is None
+
+        session.rollback()
+        queue.reset()
+        assert not queue
+        queue.add_state(States(state="3", last_updated_ts=3))
+        queue.write(session)
+        session.commit()
+        queue.post_commit()
+
+        assert list(session.execute(select(States.state))) == [("3",)]
+
+
+def test_bulk_insert_queue_releases_objects() -> None:
+    """Test written objects are not kept alive by reference cycles."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queue = BulkInsertQueue()
+
+    with Session(engine) as session:
+        first = States(state="1", last_updated_ts=1)
+        second = States(state="2", last_updated_ts=2, old_state=first)
+        queue.add_state(first)
+        queue.add_state(second)
+        refs = [weakref.ref(first), weakref.ref(second)]
+        gc.disable()
+        try:
+            queue.write(session)
+            session.commit()
+            queue.post_commit()
+            del first, second
+            assert [ref() for ref in refs] == [None, None]
+        finally:
+            gc.enable()
@@ -31,6 +31,7 @@ from homeassistant.components.recorder import (
     pool,
     statistics,
 )
+from homeassistant.components.recorder.bulk_insert import _insert_objects
 from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
@@ -56,6 +57,7 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.table_managers import state_attributes
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
@@ -100,10 +102,12 @@ def _default_recorder(hass):
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        entity_keep_days={},
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        bulk_insert=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
         exclude_attributes_by_domain={},
@@ -353,13 +357,17 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize("bulk_insert", [False, True])
 def test_saving_state_with_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
+    bulk_insert: bool,
 ) -> None:
     """Test saving and restoring a state."""
-    hass = hass_recorder()
+    hass = hass_recorder({"bulk_insert": bulk_insert})
+    # The bulk insert queue is only used if it is enabled
+    assert (get_instance(hass).bulk_insert_queue is not None) == bulk_insert
 
     entity_id = "test.recorder"
     state = "restoring_from_db"
@@ -372,10 +380,18 @@ def test_saving_state_with_exception(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    def _throw_if_inserting_states(session, objects, returning):
+        if isinstance(objects[0], States):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return _insert_objects(session, objects, returning)
+
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
         side_effect=_throw_if_state_in_session,
+    ), patch(
+        "homeassistant.components.recorder.bulk_insert._insert_objects",
+        side_effect=_throw_if_inserting_states,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -395,13 +411,15 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+@pytest.mark.parametrize("bulk_insert", [False, True])
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
+    bulk_insert: bool,
 ) -> None:
     """Test saving state when there is an SQLAlchemyError."""
-    hass = hass_recorder()
+    hass = hass_recorder({"bulk_insert": bulk_insert})
 
     entity_id = "test.recorder"
     state = "restoring_from_db"
@@ -414,10 +432,18 @@ def test_saving_state_with_sqlalchemy_exception(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    def _throw_if_inserting_states(session, objects, returning):
+        if isinstance(objects[0], States):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return _insert_objects(session, objects, returning)
+
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
         side_effect=_throw_if_state_in_session,
+    ), patch(
+        "homeassistant.components.recorder.bulk_insert._insert_objects",
+        side_effect=_throw_if_inserting_states,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -437,6 +463,49 @@ def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+def test_saving_state_discards_failed_rows(
+    hass_recorder: Callable[..., HomeAssistant],
+    hass: HomeAssistant,
+) -> None:
+    """Test states that failed to insert are discarded and not linked to."""
+    hass = hass_recorder({"bulk_insert": True})
+    instance = get_instance(hass)
+    if instance.bulk_insert_queue is None:
+        pytest.skip("Database does not write states in bulk")
+
+    entity_id = "test.recorder"
+    hass.states.set(entity_id, "before")
+    wait_recording_done(hass)
+
+    failures = []
+
+    def _throw_once_after_inserting_states(session, objects, returning):
+        inserted = _insert_objects(session, objects, returning)
+        if isinstance(objects[0], States) and not failures:
+            failures.append(objects)
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return inserted
+
+    with patch("time.sleep"), patch(
+        "homeassistant.components.recorder.bulk_insert._insert_objects",
+        side_effect=_throw_once_after_inserting_states,
+    ):
+        hass.states.set(entity_id, "fail")
+        wait_recording_done(hass)
+
+    # The rows already written by the failed attempt are rolled back
+    # instead of being committed along with a retry
+    assert failures
+    assert not instance.bulk_insert_queue
+    hass.states.set(entity_id, "after")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {db_state.state: db_state for db_state in session.query(States)}
+    assert set(db_states) == {"before", "after"}
+    assert db_states["after"].old_state_id in (None, db_states["before"].state_id)
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -2022,10 +2091,11 @@ def test_deduplication_event_data_inside_commit_interval(
         assert all(event.data_id == first_data_id for event in events)
 
 
-# Patch CACHE_SIZE since otherwise
+# Patch CACHE_SIZE_BYTES to fit 5 attributes since otherwise
 # the CI can fail because the test takes too long to run
 @patch(
-    "homeassistant.components.recorder.table_managers.state_attributes.CACHE_SIZE", 5
+    "homeassistant.components.recorder.table_managers.state_attributes.CACHE_SIZE_BYTES",
+    5 * 150,
 )
 def test_deduplication_state_attributes_inside_commit_interval(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
@@ -2062,6 +2132,34 @@ def test_deduplication_state_attributes_inside_commit_interval(
         assert first_attributes_id == last_attributes_id
 
 
+def test_state_attributes_cache_prewarm(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test the attributes ids of the most recent states are loaded at startup."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+
+    for attr_id in range(5):
+        hass.states.set("test.recorder", "on", {"test_attr": attr_id})
+    wait_recording_done(hass)
+
+    manager = instance.state_attributes_manager
+    manager.reset()
+    assert manager.get_from_cache('{"test_attr":4}') is None
+
+    with patch.object(state_attributes, "PREWARM_STATES", 2), session_scope(
+        hass=hass, read_only=True
+    ) as session:
+        manager.load_recent(session)
+
+    hits = manager.cache_stats()["hits"]
+    assert manager.get_from_cache('{"test_attr":4}') is not None
+    assert manager.get_from_cache('{"test_attr":3}') is not None
+    assert manager.get_from_cache('{"test_attr":2}') is None
+    assert manager.cache_stats()["entries"] == 2
+    assert manager.cache_stats()["hits"] == hits + 2
+
+
 async def test_async_block_till_done(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -2318,8 +2416,8 @@ async def test_lru_increases_with_many_entities(
         await async_wait_recording_done(hass)
 
     assert (
-        recorder_mock.state_attributes_manager._id_map.get_size()
-        == mock_entity_count * 2
+        recorder_mock.state_attributes_manager._lru.max_bytes
+        == mock_entity_count * 2 * state_attributes.CACHE_BYTES_PER_ENTRY
     )
     assert recorder_mock.states_meta_manager._id_map.get_size() == mock_entity_count * 2
 
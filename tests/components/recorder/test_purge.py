@@ -1965,3 +1965,208 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge cycle stops when the time budget is used up."""
+    old_events_count = 5
+    with patch.object(queries, "SQLITE_MAX_BIND_VARS", old_events_count), patch.object(
+        purge, "SQLITE_MAX_BIND_VARS", old_events_count
+    ):
+        instance = await async_setup_recorder_instance(hass)
+
+        await _add_test_events(hass, old_events_count)
+
+        with session_scope(hass=hass) as session:
+            events = session.query(Events).filter(
+                Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+            )
+            assert events.count() == old_events_count * 6
+
+            purge_before = dt_util.utcnow() - timedelta(days=4)
+
+            # Only a single batch is purged when there is no time left
+            finished = purge_old_data(
+                instance, purge_before, repack=False, time_budget=0
+            )
+            assert not finished
+            assert events.count() == old_events_count * 5
+            progress = instance.purge_progress
+            assert progress.cycles == 1
+            assert progress.events_purged == old_events_count
+            assert progress.finished is None
+
+            cycles = 1
+            while not purge_old_data(
+                instance, purge_before, repack=False, time_budget=0
+            ):
+                cycles += 1
+            cycles += 1
+            assert events.count() == old_events_count * 2
+            assert progress.cycles == cycles
+            assert progress.events_purged == old_events_count * 4
+            assert progress.finished is not None
+            assert progress.eta == 0
+            assert progress.rows_per_second > 0
+
+            # A new run starts counting again
+            finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+            assert finished
+            assert events.count() == 0
+            assert progress.cycles == 1
+            # The events of the recorder startup are purged as well
+            assert progress.events_purged > old_events_count * 2
+
+
+async def test_purge_progress_eta() -> None:
+    """Test the estimated time left of a purge run."""
+    progress = purge.PurgeProgress()
+    assert progress.eta is None
+    assert progress.rows_per_second is None
+
+    purge_before = dt_util.utcnow()
+    purge_before_ts = purge_before.timestamp()
+    with patch.object(purge.time, "monotonic", return_value=100):
+        progress.start_cycle(purge_before, purge_before_ts - 3000)
+    progress.add_states(90)
+    progress.add_events(10)
+    with patch.object(purge.time, "monotonic", return_value=110):
+        progress.end_cycle(False)
+
+    assert progress.rows_per_second == 10
+    # The oldest state is only known again when the next cycle starts
+    assert progress.eta is None
+
+    # Rows are not counted outside of a purge cycle
+    progress.add_states(100)
+    assert progress.states_purged == 90
+
+    # An unfinished run is continued by the next purge
+    with patch.object(purge.time, "monotonic", return_value=200):
+        progress.start_cycle(purge_before, purge_before_ts - 2000)
+    # 1000 seconds of history were purged in 10 seconds
+    assert progress.eta == 20
+    assert progress.as_dict()["eta"] == 20
+    progress.add_states(100)
+    with patch.object(purge.time, "monotonic", return_value=210):
+        progress.end_cycle(True)
+    assert progress.cycles == 2
+    assert progress.states_purged == 190
+    assert progress.eta == 0
+
+
+async def test_purge_entity_keep_days(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test entities with a retention override are purged in the same pass."""
+    config: ConfigType = {
+        "purge_keep_days": 10,
+        "entity_keep_days": {"sensor.short": 1, "sensor.long": 30},
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    await async_wait_recording_done(hass)
+    start = dt_util.utcnow()
+    for days_ago in (20, 5, 0):
+        with freeze_time(start - timedelta(days=days_ago)):
+            for entity_id in ("sensor.short", "sensor.long", "sensor.default"):
+                hass.states.async_set(entity_id, str(days_ago))
+        await async_wait_recording_done(hass)
+
+    def _purge_and_get_states() -> dict[str, list[str]]:
+        assert purge_old_data(instance, start - timedelta(days=10), repack=False)
+        with session_scope(hass=hass) as session:
+            return {
+                entity_id: sorted(
+                    state
+                    for (state,) in session.query(States.state)
+                    .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                    .filter(StatesMeta.entity_id == entity_id)
+                )
+                for entity_id in ("sensor.short", "sensor.long", "sensor.default")
+            }
+
+    states = await instance.async_add_executor_job(_purge_and_get_states)
+    assert states == {
+        "sensor.short": ["0"],
+        "sensor.long": ["0", "20", "5"],
+        "sensor.default": ["0", "5"],
+    }
+
+
+async def test_purge_entity_keep_days_legacy_format(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test retention overrides are respected while purging legacy rows."""
+    config: ConfigType = {
+        "purge_keep_days": 10,
+        "entity_keep_days": {"sensor.short": 1, "sensor.long": 30},
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    await async_wait_recording_done(hass)
+    start = dt_util.utcnow()
+
+    def _add_db_entries() -> None:
+        with session_scope(hass=hass) as session:
+            event_id = 1000
+            for days_ago in (20, 5):
+                timestamp = dt_util.utc_to_timestamp(start - timedelta(days=days_ago))
+                for entity_id in ("sensor.short", "sensor.long", "sensor.default"):
+                    event_id += 1
+                    session.add(
+                        Events(
+                            event_id=event_id,
+                            event_type=EVENT_STATE_CHANGED,
+                            event_data="{}",
+                            origin="LOCAL",
+                            time_fired_ts=timestamp,
+                        )
+                    )
+                    session.add(
+                        States(
+                            entity_id=entity_id,
+                            state=str(days_ago),
+                            attributes="{}",
+                            last_changed_ts=timestamp,
+                            last_updated_ts=timestamp,
+                            event_id=event_id,
+                        )
+                    )
+            convert_pending_events_to_event_types(instance, session)
+            convert_pending_states_to_meta(instance, session)
+
+    await instance.async_add_executor_job(_add_db_entries)
+    instance.use_legacy_events_index = True
+
+    def _purge_and_get_states() -> dict[str, list[str]]:
+        while not purge_old_data(
+            instance, start - timedelta(days=10), repack=False, time_budget=0
+        ):
+            pass
+        with session_scope(hass=hass) as session:
+            assert not purge._purging_legacy_format(session)
+            assert (
+                session.query(Events)
+                .filter(Events.time_fired_ts < (start - timedelta(days=10)).timestamp())
+                .count()
+                == 0
+            )
+            return {
+                entity_id: sorted(
+                    state
+                    for (state,) in session.query(States.state)
+                    .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                    .filter(StatesMeta.entity_id == entity_id)
+                )
+                for entity_id in ("sensor.short", "sensor.long", "sensor.default")
+            }
+
+    states = await instance.async_add_executor_job(_purge_and_get_states)
+    assert states == {
+        "sensor.short": [],
+        "sensor.long": ["20", "5"],
+        "sensor.default": ["5"],
+    }
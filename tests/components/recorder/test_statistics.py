@@ -20,6 +20,10 @@ from homeassistant.components.recorder.statistics import (
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _reduce_statistics,
+    _reduce_statistics_per_day,
+    _reduce_statistics_per_month,
+    _reduce_statistics_per_week,
     async_add_external_statistics,
     async_import_statistics,
     get_last_short_term_statistics,
@@ -27,6 +31,9 @@ from homeassistant.components.recorder.statistics import (
     get_latest_short_term_statistics,
     get_metadata,
     list_statistic_ids,
+    reduce_day_ts_factory,
+    reduce_month_ts_factory,
+    reduce_week_ts_factory,
 )
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
@@ -1354,3 +1361,67 @@ def test_cache_key_for_generate_statistics_at_time_stmt() -> None:
     )
     cache_key_3 = stmt3._generate_cache_key()
     assert cache_key_1 != cache_key_3
+
+
+@pytest.mark.parametrize(
+    ("reduce", "factory", "period"),
+    [
+        (_reduce_statistics_per_day, reduce_day_ts_factory, timedelta(days=1)),
+        (_reduce_statistics_per_week, reduce_week_ts_factory, timedelta(days=7)),
+        (_reduce_statistics_per_month, reduce_month_ts_factory, timedelta(days=31)),
+    ],
+)
+def test_reduce_statistics_batched(reduce, factory, period) -> None:
+    """Test the batched reduction matches the row by row reduction."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    try:
+        # Covers the start and end of daylight saving time
+        start = dt_util.parse_datetime("2022-03-01T00:00:00+00:00").timestamp()
+        types = {"last_reset", "max", "mean", "min", "state", "sum"}
+        stats = {
+            "sensor.hourly": [
+                {
+                    "start": start + hour * 3600,
+                    "end": start + (hour + 1) * 3600,
+                    "mean": hour * 1.1,
+                    "min": hour - 1.0,
+                    "max": hour + 1.0,
+                    "last_reset": None,
+                    "state": hour * 2.0,
+                    "sum": hour * 3.0,
+                }
+                for hour in range(24 * 250)
+                # Leave a gap of a few days
+                if not 24 * 40 <= hour < 24 * 45
+            ],
+            "sensor.missing": [
+                {
+                    "start": start + hour * 3600,
+                    "end": start + (hour + 1) * 3600,
+                    "mean": None if hour % 3 else float(hour),
+                    "min": None if hour < 48 else float(hour),
+                    "max": None,
+                    "sum": 0.0,
+                }
+                for hour in range(24 * 100, 24 * 130)
+            ],
+            "sensor.unordered": [
+                {"start": start + 7200, "mean": 1.0, "sum": 1.0},
+                {"start": start, "mean": 2.0, "sum": 2.0},
+            ],
+        }
+        same_period, period_start_end = factory()
+        expected = _reduce_statistics(
+            stats, same_period, period_start_end, period, types
+        )
+        result = reduce(stats, types)
+        assert result.keys() == expected.keys()
+        for statistic_id, rows in expected.items():
+            assert result[statistic_id] == [
+                {**row, "mean": pytest.approx(row["mean"])}
+                if row.get("mean") is not None
+                else row
+                for row in rows
+            ]
+    finally:
+        dt_util.set_default_time_zone(ORIG_TZ)
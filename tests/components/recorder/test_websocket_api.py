@@ -2103,6 +2103,8 @@ async def test_recorder_info(
     await client.send_json({"id": 1, "type": "recorder/info"})
     response = await client.receive_json()
     assert response["success"]
+    caches = response["result"].pop("caches")
+    purge = response["result"].pop("purge")
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
@@ -2111,6 +2113,17 @@ async def test_recorder_info(
         "recording": True,
         "thread_running": True,
     }
+    assert caches.keys() == {"state_attributes", "event_data"}
+    assert caches["state_attributes"].keys() == {
+        "entries",
+        "bytes",
+        "max_bytes",
+        "hits",
+        "misses",
+        "evictions",
+    }
+    assert purge["cycles"] == 0
+    assert purge["eta"] is None
 
 
 async def test_recorder_info_no_recorder(
@@ -20,7 +20,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import MockEntity, MockEntityPlatform, MockUser, async_mock_service
@@ -512,6 +516,36 @@ async def test_get_states(hass: HomeAssistant, websocket_client) -> None:
     assert msg["result"] == states
 
 
+async def test_get_states_snapshot_updates(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test get_states follows state changes and permissions."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+
+    hass.states.async_set("greeting.hello", "you")
+    hass.states.async_remove("greeting.bye")
+    hass.states.async_set("greeting.new", "state")
+
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert [state["state"] for state in msg["result"]] == ["you", "state"]
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"greeting.new": True}}})
+
+    await websocket_client.send_json({"id": 7, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert msg["result"] == [hass.states.get("greeting.new").as_dict()]
+
+
 async def test_get_services(hass: HomeAssistant, websocket_client) -> None:
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -719,6 +753,53 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_collapses_changes_when_behind(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test changes of an entity are collapsed while the client is behind."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    with patch.object(const, "PENDING_MSG_COLLAPSE", 0):
+        hass.states.async_set("light.permitted", "on", {"color": "red"})
+        hass.states.async_set("light.permitted", "on", {"color": "blue"})
+        hass.states.async_set("light.permitted", "off", {"effect": "help"})
+        hass.states.async_remove("light.removed")
+        hass.states.async_set("light.added", "on")
+        hass.states.async_remove("light.added")
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["event"] == {
+            "c": {
+                "light.permitted": {
+                    "+": {"a": {"effect": "help"}, "c": ANY, "lc": ANY},
+                    "-": {"a": ["color"]},
+                }
+            }
+        }
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"r": ["light.removed"]}
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"r": ["light.added"]}
+
+    await websocket_client.send_json({"id": 8, "type": "get_connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"]["entity_changes_collapsed"] == 3
+    assert msg["result"]["messages_sent"] >= 5
+    assert msg["result"]["bytes_sent"] > 0
+    assert msg["result"]["peak_queue_depth"] >= 1
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
 ) -> None:
@@ -1767,6 +1848,28 @@ async def test_integration_setup_info(
         {"domain": "isy994", "seconds": 12.8},
     ]
 
+    started = datetime.datetime(2023, 1, 1, tzinfo=datetime.UTC)
+    hass.data[DATA_SETUP_TIMELINE] = {
+        "august": {
+            "setup_started": started,
+            "setup_done": started + datetime.timedelta(seconds=12.5),
+        }
+    }
+    await websocket_client.send_json({"id": 8, "type": "integration/setup_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"][0] == {
+        "domain": "august",
+        "seconds": 12.5,
+        "timeline": {
+            "setup_started": "2023-01-01T00:00:00+00:00",
+            "setup_done": "2023-01-01T00:00:12.500000+00:00",
+        },
+    }
+    assert "timeline" not in msg["result"][1]
+
 
 @pytest.mark.parametrize(
     ("key", "config"),
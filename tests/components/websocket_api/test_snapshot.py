@@ -0,0 +1,63 @@
+"""Test the websocket states snapshot."""
+from unittest.mock import patch
+
+from homeassistant.components.websocket_api.snapshot import async_get_states_snapshot
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps, json_loads
+
+
+async def test_states_snapshot_reuses_fragments(hass: HomeAssistant) -> None:
+    """Test states are only serialized again after they changed."""
+    hass.states.async_set("light.kitchen", "on", {"color": "red"})
+    hass.states.async_set("light.bowl", "off")
+    snapshot = async_get_states_snapshot(hass)
+
+    with patch(
+        "homeassistant.components.websocket_api.snapshot.JSON_DUMP",
+        wraps=json_dumps,
+    ) as mock_dump:
+        states_json, unserializable = snapshot.async_states_json(
+            hass.states.async_all(), True
+        )
+        assert unserializable == []
+        assert json_loads(states_json) == [
+            state.as_dict() for state in hass.states.async_all()
+        ]
+        assert mock_dump.call_count == 2
+
+        assert snapshot.async_states_json(hass.states.async_all(), True) == (
+            states_json,
+            [],
+        )
+        hass.states.async_set("light.bowl", "on")
+        states_json, _ = snapshot.async_states_json(hass.states.async_all(), True)
+        assert mock_dump.call_count == 3
+        assert [state["state"] for state in json_loads(states_json)] == ["on", "on"]
+
+        compressed_json, _ = snapshot.async_compressed_states_json(
+            [hass.states.get("light.kitchen")], False
+        )
+        assert json_loads(compressed_json) == {
+            "light.kitchen": {
+                "s": "on",
+                "a": {"color": "red"},
+                "c": hass.states.get("light.kitchen").context.id,
+                "lc": hass.states.get("light.kitchen").last_changed.timestamp(),
+            }
+        }
+
+
+async def test_states_snapshot_unserializable(hass: HomeAssistant) -> None:
+    """Test unserializable states are left out and not cached."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bad", "on", {"bad": object()})
+    snapshot = async_get_states_snapshot(hass)
+
+    states_json, unserializable = snapshot.async_states_json(
+        hass.states.async_all(), True
+    )
+    assert json_loads(states_json) == [hass.states.get("light.kitchen").as_dict()]
+    assert unserializable == [hass.states.get("light.bad")]
+
+    _, unserializable = snapshot.async_states_json(hass.states.async_all(), True)
+    assert unserializable == [hass.states.get("light.bad")]
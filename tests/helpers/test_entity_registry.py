@@ -302,6 +302,30 @@ async def test_loading_saving_data(
     assert new_entry2.unit_of_measurement == "initial-unit_of_measurement"
 
 
+async def test_saving_changed_entities(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test that saves after the first one only write the changed entities."""
+    entry1 = entity_registry.async_get_or_create("light", "hue", "1234")
+    entity_registry.async_get_or_create("light", "hue", "5678")
+    await flush_store(entity_registry._store)
+
+    with patch.object(
+        entity_registry._store, "_async_write_journal"
+    ) as mock_write_journal:
+        entity_registry.async_update_entity(entry1.entity_id, name="Renamed")
+        await flush_store(entity_registry._store)
+        entity_registry.async_remove(entry1.entity_id)
+        await flush_store(entity_registry._store)
+
+    assert len(mock_write_journal.mock_calls) == 2
+    changes = mock_write_journal.mock_calls[0][1][1]
+    assert len(changes) == 1
+    assert changes[0][:2] == ("entities", entry1.id)
+    assert changes[0][2]["name"] == "Renamed"
+    assert mock_write_journal.mock_calls[1][1][1] == [("entities", entry1.id, None)]
+
+
 def test_generate_entity_considers_registered_entities(
     entity_registry: er.EntityRegistry,
 ) -> None:
@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import reprlib
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -14,7 +16,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -23,7 +25,9 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _SharedTemplateRenders,
     async_call_later,
+    async_get_timer_wheel_stats,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -1103,6 +1107,150 @@ async def test_track_template_result_none(hass: HomeAssistant) -> None:
     assert wildercard_runs == [(None, 5), (5, 10)]
 
 
+async def test_track_template_result_shared_renders(hass: HomeAssistant) -> None:
+    """Test identical templates share their renders for the same event."""
+    template_1 = Template("{{ states('sensor.test') }}", hass)
+    template_2 = Template("{{ states('sensor.test') }}", hass)
+    template_var_1 = Template("{{ states('sensor.test') ~ test }}", hass)
+    template_var_2 = Template("{{ states('sensor.test') ~ test }}", hass)
+    runs: list[tuple[Template, str]] = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.extend((update.template, update.result) for update in updates)
+
+    for template, variables in (
+        (template_1, None),
+        (template_2, None),
+        (template_var_1, {"test": "a"}),
+        (template_var_2, {"test": "b"}),
+    ):
+        async_track_template_result(
+            hass, [TrackTemplate(template, variables)], run_callback
+        )
+    await hass.async_block_till_done()
+    templates = (template_1, template_2, template_var_1, template_var_2)
+    renders = [template._renders for template in templates]
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+
+    assert runs == [
+        (template_1, "on"),
+        (template_2, "on"),
+        (template_var_1, "ona"),
+        (template_var_2, "onb"),
+    ]
+    new_renders = [
+        template._renders - count for template, count in zip(templates, renders)
+    ]
+    # The identical template is only rendered once, but
+    # templates with different variables are not shared
+    assert new_renders[0] > 0
+    assert new_renders[1] == 0
+    assert new_renders[2] == new_renders[3] == new_renders[0]
+
+
+async def test_track_template_result_shared_renders_strict(
+    hass: HomeAssistant,
+) -> None:
+    """Test strict and normal templates of the same string do not share renders."""
+    template_str = (
+        "{% if is_state('sensor.test', 'on') %}{{ missing }}{% else %}ok{% endif %}"
+    )
+    runs: list[Any] = []
+    strict_runs: list[Any] = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.extend(update.result for update in updates)
+
+    @ha.callback
+    def strict_run_callback(event, updates):
+        strict_runs.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass, [TrackTemplate(Template(template_str, hass), None)], run_callback
+    )
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template(template_str, hass), None)],
+        strict_run_callback,
+        strict=True,
+    )
+    await hass.async_block_till_done()
+    runs.clear()
+    strict_runs.clear()
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+
+    assert runs == [""]
+    assert len(strict_runs) == 1
+    assert isinstance(strict_runs[0], TemplateError)
+
+
+async def test_shared_template_renders_limited(hass: HomeAssistant) -> None:
+    """Test limited and normal templates of the same string do not share renders."""
+    template = Template("{{ states('sensor.test') }}", hass)
+    template_limited = Template("{{ states('sensor.test') }}", hass)
+    template.async_render()
+    with pytest.raises(TemplateError):
+        template_limited.async_render(limited=True)
+    hass.states.async_set("sensor.test", "on")
+    event = ha.Event(EVENT_STATE_CHANGED, {"entity_id": "sensor.test"})
+
+    shared_renders = _SharedTemplateRenders()
+    assert shared_renders.async_render_to_info(template, None, event).result() == "on"
+    info = shared_renders.async_render_to_info(template_limited, None, event)
+    with pytest.raises(TemplateError):
+        info.result()
+    assert shared_renders.async_render_to_info(template_limited, None, event) is info
+
+
+async def test_track_template_result_attribute_changes(hass: HomeAssistant) -> None:
+    """Test changes of fields the template did not read do not re-render."""
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_attr = Template("{{ state_attr('sensor.test', 'battery') }}", hass)
+    hass.states.async_set("sensor.test", "on", {"battery": 5, "rssi": -60})
+    runs: list[tuple[Template, Any]] = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.extend((update.template, update.result) for update in updates)
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None), TrackTemplate(template_attr, None)],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    renders = (template_state._renders, template_attr._renders)
+
+    hass.states.async_set("sensor.test", "on", {"battery": 5, "rssi": -70})
+    await hass.async_block_till_done()
+    assert runs == []
+    assert (template_state._renders, template_attr._renders) == renders
+
+    hass.states.async_set("sensor.test", "on", {"battery": 4, "rssi": -70})
+    await hass.async_block_till_done()
+    assert runs == [(template_attr, 4)]
+    assert template_state._renders == renders[0]
+
+    hass.states.async_set("sensor.test", "off", {"battery": 4, "rssi": -80})
+    await hass.async_block_till_done()
+    assert runs == [(template_attr, 4), (template_state, "off")]
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert runs == [
+        (template_attr, 4),
+        (template_state, "off"),
+        (template_state, "unknown"),
+        (template_attr, None),
+    ]
+
+
 async def test_track_template_result_super_template(hass: HomeAssistant) -> None:
     """Test tracking template with super template listening to same entity."""
     specific_runs = []
@@ -3455,7 +3603,10 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         name=unique_string,
     )
     scheduled = getattr(hass.loop, "_scheduled")
-    assert any(handle for handle in scheduled if unique_string in str(handle))
+    # Timers are coalesced on the timer wheel, the profiler raises
+    # the reprlib limits to show all of them.
+    with patch.object(reprlib.aRepr, "maxother", 300):
+        assert any(handle for handle in scheduled if unique_string in str(handle))
     unsub()
 
     assert all(handle for handle in scheduled if unique_string not in str(handle))
@@ -4289,6 +4440,49 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_later_timer_wheel(hass: HomeAssistant) -> None:
+    """Test timers due in the same tick share an event loop timer."""
+    calls: list[str] = []
+    scheduled = getattr(hass.loop, "_scheduled")
+    stats_before = async_get_timer_wheel_stats(hass)
+    handles_before = sum(1 for handle in scheduled if not handle.cancelled())
+
+    with patch.object(hass.loop, "time", return_value=hass.loop.time()):
+        remove_first = async_call_later(
+            hass, 30, callback(lambda _: calls.append("first"))
+        )
+        async_call_later(hass, 30, callback(lambda _: calls.append("second")))
+        async_call_later(hass, 30, callback(lambda _: calls.append("third")))
+        async_call_later(
+            hass,
+            30,
+            ha.HassJob(
+                callback(lambda _: calls.append("shutdown")), cancel_on_shutdown=True
+            ),
+        )
+
+    # The timers cancelled on shutdown keep their own loop timer
+    assert sum(1 for handle in scheduled if not handle.cancelled()) == (
+        handles_before + 2
+    )
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"]["tests"] == stats_before["timers"].get("tests", 0) + 3
+
+    remove_first()
+    assert (
+        async_get_timer_wheel_stats(hass)["timers"]["tests"]
+        == stats["timers"]["tests"] - 1
+    )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert sorted(calls) == ["second", "shutdown", "third"]
+    stats_after = async_get_timer_wheel_stats(hass)
+    assert stats_after["wakeups"] == stats_before["wakeups"] + 1
+    assert stats_after["fired"] == stats_before["fired"] + 2
+    assert "tests" not in stats_after["timers"]
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
@@ -1,5 +1,5 @@
 """Test integration platform helpers."""
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -8,6 +8,7 @@ from homeassistant.helpers.integration_platform import (
     async_process_integration_platform_for_component,
     async_process_integration_platforms,
 )
+from homeassistant.loader import Integration
 from homeassistant.setup import ATTR_COMPONENT, EVENT_COMPONENT_LOADED
 
 from tests.common import mock_platform
@@ -48,6 +49,40 @@ async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     assert len(processed) == 2
 
 
+async def test_process_integration_platforms_lazy(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test platforms are only imported once an attribute is used."""
+    hass.config.components.add("sun")
+
+    processed = []
+
+    async def _process_platform(hass, domain, platform):
+        """Process platform."""
+        processed.append((domain, platform))
+
+    with patch.object(
+        Integration, "get_platform", autospec=True, side_effect=Integration.get_platform
+    ) as mock_get_platform:
+        await async_process_integration_platforms(
+            hass, "trigger", _process_platform, lazy=True
+        )
+        await async_process_integration_platforms(
+            hass, "not_a_platform", _process_platform, lazy=True
+        )
+
+        assert len(processed) == 1
+        assert processed[0][0] == "sun"
+        assert mock_get_platform.call_count == 0
+
+        assert processed[0][1].async_attach_trigger
+        assert mock_get_platform.call_count == 1
+        assert processed[0][1].TRIGGER_SCHEMA
+        assert mock_get_platform.call_count == 1
+
+    assert "not_a_platform" not in caplog.text
+
+
 async def test_process_integration_platforms_none_loaded(hass: HomeAssistant) -> None:
     """Test processing integrations with none loaded."""
     # Verify we can call async_process_integration_platform_for_component
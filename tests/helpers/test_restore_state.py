@@ -1,5 +1,6 @@
 """The tests for the Restore component."""
 from datetime import datetime, timedelta
+import json
 from typing import Any
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_S
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
@@ -41,7 +43,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -67,7 +69,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     entity.entity_id = "input_boolean.b1"
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -75,7 +77,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -91,7 +93,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -113,7 +115,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     entity.entity_id = "input_boolean.b1"
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -122,7 +124,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -131,7 +133,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -139,7 +141,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -181,7 +183,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
     # Mock that only b1 is present this run
     states = [State("input_boolean.b1", "on")]
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -195,7 +197,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -239,13 +241,11 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     }
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
-
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+        assert mock_write_data.called
+        written_states = mock_write_data.mock_calls[0][1][0]()
 
     # b0 should not be written, since it didn't extend RestoreEntity
     # b1 should be written, since it is present in the current run
@@ -265,13 +265,11 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     await entity.async_remove()
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_changes"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
-
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+        assert mock_write_data.called
+        written_states = mock_write_data.mock_calls[0][1][0]()
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -300,7 +298,7 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     data = await RestoreStateData.async_get_instance(hass)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
+        "homeassistant.helpers.restore_state.Store.async_save_changes",
         side_effect=HomeAssistantError,
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
@@ -380,3 +378,74 @@ async def test_restoring_invalid_entity_id(
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that only changed states are dumped and old states stay undecoded."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json.loads(
+            json.dumps(
+                [
+                    StoredState(State("input_boolean.b0", "on"), None, now).as_dict(),
+                    StoredState(State("input_boolean.b1", "on"), None, now).as_dict(),
+                ],
+                cls=JSONEncoder,
+            )
+        ),
+    }
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await entity.async_internal_added_to_hass()
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "on"
+    hass.states.async_set("input_boolean.b0", "on")
+    await hass.async_block_till_done()
+
+    data = await RestoreStateData.async_get_instance(hass)
+    raw_states = dict(data.last_states.raw_items())
+    assert isinstance(raw_states["input_boolean.b0"], StoredState)
+    assert isinstance(raw_states["input_boolean.b1"], dict)
+
+    await data.async_dump_states()
+    assert [
+        stored["state"]["entity_id"] for stored in hass_storage[STORAGE_KEY]["data"]
+    ] == ["input_boolean.b0", "input_boolean.b1"]
+
+    with patch.object(data.store, "_async_write_journal") as mock_write_journal:
+        await data.async_dump_states()
+    assert not mock_write_journal.called
+
+    hass.states.async_set("input_boolean.b0", "off")
+    with patch.object(data.store, "_async_write_journal") as mock_write_journal:
+        await data.async_dump_states()
+    changes = mock_write_journal.mock_calls[0][1][1]
+    assert [(key, record["state"]["state"]) for _, key, record in changes] == [
+        ("input_boolean.b0", "off")
+    ]
+
+    # Expired old states are removed
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=now + timedelta(days=8),
+    ), patch.object(data.store, "_async_write_journal") as mock_write_journal:
+        await data.async_dump_states()
+    changes = mock_write_journal.mock_calls[0][1][1]
+    assert [(key, record) for _, key, record in changes if record is None] == [
+        ("input_boolean.b1", None)
+    ]
+    assert isinstance(dict(data.last_states.raw_items())["input_boolean.b1"], dict)
+
+    hass.states.async_set("input_boolean.b0", "on")
+    await data.async_dump_states()
+    assert [
+        (stored["state"]["entity_id"], stored["state"]["state"])
+        for stored in hass_storage[STORAGE_KEY]["data"]
+    ] == [("input_boolean.b0", "on"), ("input_boolean.b1", "on")]
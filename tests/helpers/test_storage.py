@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -17,7 +18,7 @@ from homeassistant.helpers import storage
 from homeassistant.util import dt
 from homeassistant.util.color import RGBColor
 
-from tests.common import async_fire_time_changed, async_test_home_assistant
+from tests.common import async_fire_time_changed, async_test_home_assistant, flush_store
 
 MOCK_VERSION = 1
 MOCK_VERSION_2 = 2
@@ -548,3 +549,99 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
     }
 
     await hass.async_stop(force=True)
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changed records are journaled and compacted into a snapshot."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    journal_keys = {"items": "id"}
+    items = {"a": {"id": "a", "value": 1}, "b": {"id": "b", "value": 2}}
+    changes: storage.JournalChanges = []
+
+    def data_func() -> dict[str, Any]:
+        changes.clear()
+        return {"items": list(items.values())}
+
+    def changes_func() -> storage.JournalChanges:
+        result = list(changes)
+        changes.clear()
+        return result
+
+    def change(key: str, record: dict[str, Any] | None) -> None:
+        if record is None:
+            items.pop(key)
+        else:
+            items[key] = record
+        changes.append(("items", key, record))
+        store.async_delay_save(data_func, changes_func=changes_func)
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+    await store.async_save(data_func())
+    assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+    change("a", {"id": "a", "value": 3})
+    await flush_store(store)
+    change("c", {"id": "c", "value": 4})
+    await flush_store(store)
+    change("b", None)
+    await flush_store(store)
+    assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+    expected = {"items": [{"id": "a", "value": 3}, {"id": "c", "value": 4}]}
+    new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+    assert await new_store.async_load() == expected
+
+    # An interrupted write leaves an incomplete entry at the end
+    def _write_incomplete_entry() -> None:
+        with open(store.journal_path, "ab") as fdesc:
+            fdesc.write(b'["items", "d", {"id"')
+
+    await hass.async_add_executor_job(_write_incomplete_entry)
+    assert await new_store.async_load() == expected
+
+    # Journal of an older snapshot is ignored
+    await hass.async_add_executor_job(
+        storage.json_helper.save_json,
+        store.path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"items": []}},
+    )
+    assert await new_store.async_load() == {"items": []}
+
+    # A full snapshot replaces the journal once it is too long
+    await store.async_save(data_func())
+    with patch("homeassistant.helpers.storage.JOURNAL_MAX_ENTRIES", 2):
+        change("d", {"id": "d", "value": 5})
+        await flush_store(store)
+        change("e", {"id": "e", "value": 6})
+        await flush_store(store)
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        change("f", {"id": "f", "value": 7})
+        await flush_store(store)
+    assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+    assert await new_store.async_load() == {"items": list(items.values())}
+
+    await store.async_remove()
+    await hass.async_stop(force=True)
+
+
+def test_apply_journal_to_list() -> None:
+    """Test applying changed records to stored data that is a list."""
+    data = [{"state": {"entity_id": "a", "value": 1}}, {"state": {"entity_id": "b"}}]
+    storage.apply_journal(
+        data,
+        {"": "state.entity_id"},
+        [
+            ("", "a", {"state": {"entity_id": "a", "value": 2}}),
+            ("", "b", None),
+            ("", "c", {"state": {"entity_id": "c"}}),
+        ],
+    )
+    assert data == [
+        {"state": {"entity_id": "a", "value": 2}},
+        {"state": {"entity_id": "c"}},
+    ]
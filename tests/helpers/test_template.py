@@ -1,6 +1,7 @@
 """Test Home Assistant template helper methods."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
@@ -4327,6 +4328,70 @@ async def test_state_attributes(hass: HomeAssistant) -> None:
         tpl.async_render()
 
 
+async def test_render_info_collects_fields(hass: HomeAssistant) -> None:
+    """Test the fields and attributes a template reads are collected."""
+    for entity_id in ("sensor.a", "sensor.b", "sensor.c", "sensor.d", "sensor.e"):
+        hass.states.async_set(entity_id, "on", {"battery": 5, "rssi": -60})
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') }}"
+        "{{ state_attr('sensor.b', 'battery') }}"
+        "{{ states.sensor.c.last_changed }}"
+        "{{ states.sensor.d.attributes.rssi }}"
+        "{{ states.sensor.e.name }}{{ states.sensor.e.domain }}"
+        "{{ expand('sensor.missing') }}",
+    )
+    assert info.entities == {
+        "sensor.a",
+        "sensor.b",
+        "sensor.c",
+        "sensor.d",
+        "sensor.e",
+        "sensor.missing",
+    }
+    assert info.entity_fields == {
+        "sensor.a": {"state"},
+        "sensor.c": {"last_changed"},
+        "sensor.d": {"attributes"},
+        "sensor.e": set(),
+        "sensor.missing": {
+            "state",
+            "attributes",
+            "last_changed",
+            "last_updated",
+            "context",
+        },
+    }
+    assert info.entity_attributes == {
+        "sensor.b": {"battery"},
+        "sensor.e": {"friendly_name"},
+    }
+
+    def _changed(entity_id: str, state: str, attributes: dict[str, Any]) -> bool:
+        old_state = hass.states.get(entity_id)
+        hass.states.async_set(entity_id, state, attributes)
+        return info.fields_changed(entity_id, old_state, hass.states.get(entity_id))
+
+    assert not _changed("sensor.a", "on", {"battery": 4, "rssi": -60})
+    assert _changed("sensor.a", "off", {"battery": 4, "rssi": -60})
+    assert not _changed("sensor.b", "off", {"battery": 5, "rssi": -70})
+    assert _changed("sensor.b", "off", {"battery": 4, "rssi": -70})
+    assert not _changed("sensor.c", "on", {"battery": 4, "rssi": -60})
+    assert _changed("sensor.c", "off", {"battery": 4, "rssi": -60})
+    assert _changed("sensor.d", "on", {"battery": 4, "rssi": -60})
+    assert not _changed("sensor.e", "off", {"battery": 4, "rssi": -60})
+    assert _changed("sensor.e", "off", {"friendly_name": "E"})
+    # Entities without collected fields always trigger
+    assert _changed("sensor.f", "on", {})
+
+    # Entities that are iterated may have any of their fields read
+    info = render_to_info(
+        hass, "{{ states('sensor.a') }}{{ states.sensor | list | count }}"
+    )
+    assert _changed("sensor.a", "off", {"battery": 3})
+
+
 async def test_unavailable_states(hass: HomeAssistant) -> None:
     """Test watching unavailable states."""
 
@@ -4560,3 +4625,98 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are kept in the bytecode cache across restarts."""
+    await template.async_load_bytecode_cache(hass)
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    assert template.get_bytecode_cache_stats(hass) == {
+        "entries": 1,
+        "hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.0,
+    }
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(stored) == 1
+    assert next(iter(stored)).startswith("normal-")
+
+    # A new environment with a new cache loads the code from storage
+    bytecode_cache = template.TemplateBytecodeCache(hass, max_entries=1)
+    await bytecode_cache.async_load()
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    env = template.TemplateEnvironment(hass)
+    env.compile("{{ 1 + 1 }}")
+    assert bytecode_cache.stats()["hits"] == 1
+
+    # Entries written by another version are replaced
+    with patch.object(template.TemplateBytecodeCache, "checksum", "other"):
+        env = template.TemplateEnvironment(hass)
+        env.compile("{{ 1 + 1 }}")
+    assert bytecode_cache.stats()["misses"] == 1
+
+    # Environments are cached separately and the least recently used
+    # entries are evicted
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    limited_env.compile("{{ 1 + 1 }}")
+    assert bytecode_cache.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "hit_rate": 1 / 3,
+    }
+
+
+async def test_bytecode_cache_compiles_in_threads(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test templates can be compiled in threads and a save is scheduled once."""
+    bytecode_cache = template.TemplateBytecodeCache(hass, max_entries=8)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    env = template.TemplateEnvironment(hass)
+
+    def _compile_templates(start: int) -> None:
+        for number in range(start, start + 50):
+            env.compile(f"{{{{ {number} }}}}")
+
+    with patch.object(bytecode_cache, "_async_schedule_save") as schedule_save:
+        await asyncio.gather(
+            *(
+                hass.async_add_executor_job(_compile_templates, start)
+                for start in range(0, 200, 50)
+            )
+        )
+        await hass.async_block_till_done()
+    assert schedule_save.call_count == 1
+    assert bytecode_cache.stats() == {
+        "entries": 8,
+        "hits": 0,
+        "misses": 200,
+        "evictions": 192,
+        "hit_rate": 0.0,
+    }
+
+    # Saving marks the cache clean, the next compile schedules a save again
+    bytecode_cache._async_schedule_save()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    assert len(hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]) == 8
+    with patch.object(bytecode_cache, "_async_schedule_save") as schedule_save:
+        env.compile("{{ 1000 }}")
+        await hass.async_block_till_done()
+    assert schedule_save.call_count == 1
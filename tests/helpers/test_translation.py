@@ -136,7 +136,7 @@ async def test_get_translations_loads_config_flows(
 ) -> None:
     """Test the get translations helper loads config flow translations."""
     mock_config_flows["integration"].append("component1")
-    integration = Mock(file_path=pathlib.Path(__file__))
+    integration = Mock(file_path=pathlib.Path(__file__), translation_files=None)
     integration.name = "Component 1"
 
     with patch(
@@ -165,7 +165,7 @@ async def test_get_translations_loads_config_flows(
     assert "component1" not in hass.config.components
 
     mock_config_flows["integration"].append("component2")
-    integration = Mock(file_path=pathlib.Path(__file__))
+    integration = Mock(file_path=pathlib.Path(__file__), translation_files=None)
     integration.name = "Component 2"
 
     with patch(
@@ -203,7 +203,7 @@ async def test_get_translations_loads_config_flows(
 
 async def test_get_translations_while_loading_components(hass: HomeAssistant) -> None:
     """Test the get translations helper loads config flow translations."""
-    integration = Mock(file_path=pathlib.Path(__file__))
+    integration = Mock(file_path=pathlib.Path(__file__), translation_files=None)
     integration.name = "Component 1"
     hass.config.components.add("component1")
     load_count = 0
@@ -3,6 +3,7 @@ import asyncio
 from collections.abc import Generator, Iterable
 import glob
 import os
+import threading
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -17,6 +18,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.util import import_profiler
 
 from .common import (
     MockConfigEntry,
@@ -420,6 +422,39 @@ async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     assert order == ["root", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_plan_timeline(hass: HomeAssistant) -> None:
+    """Test integrations are imported ahead and set up after their dependencies."""
+    mock_integration(hass, MockModule(domain="dep"))
+    mock_integration(hass, MockModule(domain="root", dependencies=["dep"]))
+    mock_integration(
+        hass, MockModule(domain="with_reqs", requirements=["not-installed==1.0"])
+    )
+
+    imported_in_loop: dict[str, bool] = {}
+    get_component = Integration.get_component
+
+    def _get_component(integration: Integration) -> Any:
+        imported_in_loop.setdefault(
+            integration.domain, threading.current_thread() is threading.main_thread()
+        )
+        return get_component(integration)
+
+    with patch(
+        "homeassistant.setup.async_process_deps_reqs", return_value=None
+    ), patch.object(Integration, "get_component", _get_component):
+        await bootstrap._async_set_up_integrations(hass, {"root": {}, "with_reqs": {}})
+
+    assert {"dep", "root", "with_reqs"} <= hass.config.components
+    assert imported_in_loop == {"dep": False, "root": False, "with_reqs": True}
+
+    timeline = hass.data[bootstrap.DATA_SETUP_TIMELINE]
+    assert timeline["dep"]["import_done"] <= timeline["dep"]["setup_started"]
+    assert timeline["dep"]["setup_done"] <= timeline["root"]["setup_started"]
+    assert "import_started" not in timeline["with_reqs"]
+    assert "setup_done" in timeline["with_reqs"]
+
+
 @pytest.fixture
 def mock_is_virtual_env() -> Generator[Mock, None, None]:
     """Mock is_virtual_env."""
@@ -513,6 +548,36 @@ async def test_setup_hass(
     assert hass == async_get_hass()
 
 
+@pytest.mark.parametrize("hass_config", [{"browser": {}}])
+async def test_setup_hass_profile_imports(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    event_loop: asyncio.AbstractEventLoop,
+    tmp_path,
+) -> None:
+    """Test the import times are written out after startup."""
+    report_path = tmp_path / "import_profile.txt"
+
+    try:
+        with patch.object(bootstrap, "IMPORT_PROFILE_FILENAME", str(report_path)):
+            await bootstrap.async_setup_hass(
+                runner.RuntimeConfig(
+                    config_dir=get_test_config_dir(),
+                    skip_pip=True,
+                    profile_imports=True,
+                ),
+            )
+        assert import_profiler.get_import_profiler() is not None
+    finally:
+        import_profiler.stop_import_profiler()
+
+    assert report_path.read_text().startswith("Import times of")
+
+
 @pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_hass_config: None,
@@ -827,10 +892,26 @@ async def test_bootstrap_empty_integrations(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test setting up an empty integrations does not raise."""
-    await bootstrap.async_setup_multi_components(hass, set(), {})
+    await bootstrap._SetupPlan(hass, set(), {}).async_setup(set(), {})
     await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_plan_sets_up_domain_once(hass: HomeAssistant) -> None:
+    """Test a domain that is already planned is not set up again."""
+    plan = bootstrap._SetupPlan(hass, {"planned"}, {})
+    with patch.object(
+        bootstrap, "async_setup_component", return_value=True
+    ) as mock_setup:
+        await asyncio.gather(
+            plan.async_setup({"planned"}, {}), plan.async_setup({"planned"}, {})
+        )
+        await plan.async_setup({"planned"}, {})
+        await hass.async_block_till_done()
+
+    assert mock_setup.call_count == 1
+
+
 @pytest.mark.parametrize("integration", ["mqtt_eventstream", "mqtt_statestream"])
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_dependencies(
@@ -948,7 +1029,8 @@ async def test_bootstrap_dependencies(
         side_effect=mock_async_get_integrations,
     ), patch("homeassistant.config.async_process_component_config", return_value={}):
         bootstrap.async_set_domains_to_be_loaded(hass, {integration})
-        await bootstrap.async_setup_multi_components(hass, {integration}, {})
+        plan = bootstrap._SetupPlan(hass, {integration}, {})
+        await plan.async_setup({integration}, {})
         await hass.async_block_till_done()
 
     for assertion in assertions:
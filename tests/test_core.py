@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import array
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import functools
 import gc
 import logging
@@ -35,12 +35,14 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import HassJob, HomeAssistant, State
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
     ServiceNotFound,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.loop_monitor import LoopMonitor
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -170,7 +172,7 @@ def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
 
 def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(loop_monitor=None)
     calls = []
 
     def job():
@@ -584,6 +586,166 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_loop_monitor(hass: HomeAssistant) -> None:
+    """Test callbacks run in the event loop are timed by the loop monitor."""
+    hass.loop_monitor = LoopMonitor()
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def job_target(*args):
+        """Mock job."""
+        calls.append(args)
+
+    hass.bus.async_listen("immediate", listener, run_immediately=True)
+    hass.bus.async_listen("scheduled", listener)
+    hass.async_run_hass_job(HassJob(job_target, "run job"), 1)
+    hass.async_add_hass_job(HassJob(job_target, "add job"), 2)
+    hass.bus.async_fire("immediate")
+    hass.bus.async_fire("scheduled")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 4
+    histograms = hass.loop_monitor.histograms
+    assert histograms[f"{__name__}.test_loop_monitor.<locals>.listener"].count == 2
+    assert histograms[f"{__name__}.test_loop_monitor.<locals>.job_target"].count == 2
+
+    hass.loop_monitor = None
+    hass.bus.async_fire("immediate")
+    hass.async_run_hass_job(HassJob(job_target, "run job"), 3)
+    assert len(calls) == 6
+
+
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test listeners indexed by entity_id and domain."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub_entity = hass.bus.async_listen(
+        "test", listener, event_filter=filter, entity_ids=["light.kitchen"]
+    )
+    unsub_domain = hass.bus.async_listen("test", listener, domains=["switch"])
+    unsub_both = hass.bus.async_listen(
+        "test", listener, entity_ids=["switch.a"], domains=["switch"]
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": "switch.a"})
+    hass.bus.async_fire("test", {"entity_id": "switch.b"})
+    hass.bus.async_fire("test", {"other": "switch.b"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert calls == [
+        "light.kitchen",
+        "switch.a",
+        "switch.a",
+        "switch.b",
+        "switch.b",
+    ]
+
+    unsub_entity()
+    unsub_domain()
+    unsub_both()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "switch.a"})
+    await hass.async_block_till_done()
+    assert calls == []
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, listener, entity_ids=["light.kitchen"])
+
+
+async def test_eventbus_indexed_listener_order(hass: HomeAssistant) -> None:
+    """Test indexed listeners run in registration order with the others."""
+    calls = []
+
+    def make_listener(name):
+        @ha.callback
+        def listener(event):
+            """Mock listener."""
+            calls.append(name)
+
+        return listener
+
+    hass.bus.async_listen("test", make_listener("plain1"), run_immediately=True)
+    hass.bus.async_listen(
+        "test", make_listener("domain"), run_immediately=True, domains=["light"]
+    )
+    hass.bus.async_listen(
+        "test",
+        make_listener("entity"),
+        run_immediately=True,
+        entity_ids=["light.kitchen"],
+    )
+    hass.bus.async_listen("test", make_listener("plain2"), run_immediately=True)
+    hass.bus.async_listen(
+        "test",
+        make_listener("both"),
+        run_immediately=True,
+        entity_ids=["light.kitchen"],
+        domains=["light"],
+    )
+    hass.bus.async_listen(MATCH_ALL, make_listener("all"), run_immediately=True)
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert calls == ["all", "plain1", "domain", "entity", "plain2", "both"]
+
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    assert calls == ["all", "plain1", "domain", "plain2", "both"]
+
+
+async def test_eventbus_dispatch_cache_invalidated(hass: HomeAssistant) -> None:
+    """Test the merged listeners are rebuilt when listeners change."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test"]
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test", "test", "test"]
+
+    unsub_match_all()
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test", "test", "test"]
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -817,6 +979,70 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_domain_filter(hass: HomeAssistant) -> None:
+    """Test domain filtered queries follow sets and removals."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.desk", "on", {})
+    hass.states.async_set("switch.ac", "off", {})
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.desk"]
+    assert hass.states.async_entity_ids(["switch", "light"]) == [
+        "light.bowl",
+        "light.desk",
+        "switch.ac",
+    ]
+    assert hass.states.async_entity_ids("sensor") == []
+    assert hass.states.async_entity_ids_count("light") == 2
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 3
+    assert hass.states.async_entity_ids_count(["sensor"]) == 0
+
+    hass.states.async_set("light.bowl", "off", {})
+    assert [state.state for state in hass.states.async_all("light")] == [
+        "off",
+        "on",
+    ]
+    assert hass.states.async_all("light")[0] is hass.states.get("light.bowl")
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.ac")
+    assert hass.states.async_entity_ids("light") == ["light.desk"]
+    assert hass.states.async_entity_ids_count("switch") == 0
+    assert hass.states.async_all(["switch"]) == []
+
+
+async def test_statemachine_domain_filter_duplicates(hass: HomeAssistant) -> None:
+    """Test a domain filter with repeated domains returns every state once."""
+    hass.states.async_set("light.a", "on", {})
+    hass.states.async_set("switch.b", "on", {})
+    hass.states.async_set("light.c", "on", {})
+
+    domain_filter = ["light", "switch", "light"]
+    assert hass.states.async_entity_ids(domain_filter) == [
+        "light.a",
+        "switch.b",
+        "light.c",
+    ]
+    assert hass.states.async_entity_ids_count(domain_filter) == 3
+    assert [state.entity_id for state in hass.states.async_all(domain_filter)] == [
+        "light.a",
+        "switch.b",
+        "light.c",
+    ]
+    assert hass.states.async_entity_ids(["light", "light"]) == ["light.a", "light.c"]
+
+
+async def test_statemachine_domain_filter_iterable_exact(
+    hass: HomeAssistant,
+) -> None:
+    """Test the domains of an iterable domain filter are matched exactly."""
+    hass.states.async_set("switch.b", "on", {})
+
+    assert hass.states.async_entity_ids("Switch") == ["switch.b"]
+    assert hass.states.async_entity_ids(("Switch",)) == []
+    assert hass.states.async_entity_ids_count(("Switch",)) == 0
+    assert hass.states.async_all(("Switch",)) == []
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -882,6 +1108,53 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test attributes are shared between states and entities."""
+    hass.states.async_set("light.bowl", "on", {"color": "red"})
+    hass.states.async_set("light.desk", "on", {"color": "red"})
+    bowl = hass.states.get("light.bowl")
+    desk = hass.states.get("light.desk")
+    assert bowl.attributes is desk.attributes
+
+    hass.states.async_set("light.bowl", "off", {"color": "red"})
+    bowl_off = hass.states.get("light.bowl")
+    assert bowl_off.attributes is bowl.attributes
+
+    hass.states.async_set("light.bowl", "off", {"color": "blue"})
+    bowl_blue = hass.states.get("light.bowl")
+    assert bowl_blue.attributes == {"color": "blue"}
+    assert bowl.attributes == {"color": "red"}
+
+    hass.states.async_set("light.bowl", "off", {"effects": ["one"]})
+    hass.states.async_set("light.desk", "off", {"effects": ["one"]})
+    assert hass.states.get("light.bowl").attributes == {"effects": ["one"]}
+    assert (
+        hass.states.get("light.bowl").attributes
+        is not hass.states.get("light.desk").attributes
+    )
+
+    # Equal attributes that are not interned are reused as well
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    bowl = hass.states.get("light.bowl")
+    hass.states.async_set("light.bowl", "off", {"effects": ["one"]})
+    await hass.async_block_till_done()
+    assert not events
+    assert hass.states.get("light.bowl") is bowl
+
+
+async def test_statemachine_does_not_share_equal_values(hass: HomeAssistant) -> None:
+    """Test attribute values that are only equal are not shared between entities."""
+    utc = datetime(2023, 1, 1, 12, tzinfo=dt_util.UTC)
+    local = datetime(2023, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+    hass.states.async_set("sensor.utc", "on", {"since": utc})
+    hass.states.async_set("sensor.local", "on", {"since": local})
+    hass.states.async_set("sensor.positive", "on", {"value": 0.0})
+    hass.states.async_set("sensor.negative", "on", {"value": -0.0})
+
+    assert hass.states.get("sensor.local").attributes["since"].tzinfo is local.tzinfo
+    assert str(hass.states.get("sensor.negative").attributes["value"]) == "-0.0"
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,5 +1,7 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+from datetime import timedelta
+from typing import Any
+from unittest.mock import ANY, patch
 
 import pytest
 
@@ -7,8 +9,9 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
-from .common import MockModule, mock_integration
+from .common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -725,3 +728,82 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_integration_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any], enable_custom_integrations: None
+) -> None:
+    """Test integrations are resolved from the integration index."""
+    await loader.async_load_integration_index(hass)
+    index: loader.IntegrationIndex = hass.data[loader.DATA_INTEGRATION_INDEX]
+
+    integration = await loader.async_get_integration(hass, "demo")
+    custom = await loader.async_get_custom_components(hass)
+    assert "test_package" in custom
+    assert index.misses > 0
+    assert "light" in integration._platforms
+    assert integration.translation_files == set()
+    with pytest.raises(ImportError):
+        integration.get_platform("not_a_platform")
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.INTEGRATION_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY]["data"]
+    assert str(integration.file_path) in stored["integrations"]
+
+    # Emulate a restart
+    for key in (
+        loader.DATA_INTEGRATIONS,
+        loader.DATA_CUSTOM_COMPONENTS,
+        loader.DATA_INTEGRATION_INDEX,
+    ):
+        hass.data.pop(key)
+    await loader.async_load_integration_index(hass)
+    index = hass.data[loader.DATA_INTEGRATION_INDEX]
+
+    with patch("pathlib.Path.iterdir") as mock_iterdir, patch(
+        "pathlib.Path.read_text"
+    ) as mock_read_text:
+        warm = await loader.async_get_integration(hass, "demo")
+        assert await loader.async_get_custom_components(hass) == {
+            domain: ANY for domain in custom
+        }
+    assert not mock_iterdir.called
+    assert not mock_read_text.called
+    assert index.misses == 0
+    assert warm.manifest == integration.manifest
+    assert warm._platforms == integration._platforms
+
+
+async def test_get_lazy_platform(hass: HomeAssistant) -> None:
+    """Test lazy platforms are imported when an attribute is first used."""
+    integration = await loader.async_get_integration(hass, "sun")
+
+    with pytest.raises(ModuleNotFoundError, match="sun.not_a_platform"):
+        integration.get_lazy_platform("not_a_platform")
+
+    with patch.object(
+        integration, "get_platform", wraps=integration.get_platform
+    ) as mock_get_platform:
+        platform = integration.get_lazy_platform("trigger")
+        assert isinstance(platform, loader.LazyPlatform)
+        assert not mock_get_platform.called
+        assert platform.async_attach_trigger
+        assert platform.TRIGGER_SCHEMA
+        assert mock_get_platform.call_count == 1
+        assert not hasattr(platform, "not_an_attribute")
+
+    # Imported platforms are returned as is
+    assert integration.get_lazy_platform("trigger") is integration.get_platform(
+        "trigger"
+    )
+
+    # Platforms known from the index are checked without the file system
+    integration._platforms = {"sensor", "trigger"}
+    with patch("importlib.util.find_spec") as mock_find_spec:
+        assert integration.get_lazy_platform("sensor") is not None
+        with pytest.raises(ModuleNotFoundError):
+            integration.get_lazy_platform("not_a_platform")
+    assert not mock_find_spec.called
@@ -0,0 +1,66 @@
+"""Test the import profiler."""
+import sys
+
+import pytest
+
+from homeassistant.util import import_profiler
+
+
+def test_import_profiler(tmp_path, monkeypatch) -> None:
+    """Test import times are recorded per module and per integration."""
+    package = tmp_path / "custom_components" / "profiled"
+    package.mkdir(parents=True)
+    (package.parent / "__init__.py").write_text("")
+    (package / "__init__.py").write_text("import custom_components.profiled.sensor\n")
+    (package / "sensor.py").write_text("import profiled_requirement\n")
+    (tmp_path / "profiled_requirement.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("custom_components", "profiled_requirement"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    profiler = import_profiler.start_import_profiler()
+    try:
+        assert import_profiler.start_import_profiler() is profiler
+        assert import_profiler.get_import_profiler() is profiler
+        import custom_components.profiled  # noqa: F401 pylint: disable=import-error
+    finally:
+        import_profiler.stop_import_profiler()
+        for name in (
+            "custom_components.profiled",
+            "custom_components.profiled.sensor",
+            "profiled_requirement",
+        ):
+            sys.modules.pop(name, None)
+
+    assert import_profiler.get_import_profiler() is None
+    assert profiler not in sys.meta_path
+
+    package_time = profiler.modules["custom_components.profiled"]
+    sensor_time = profiler.modules["custom_components.profiled.sensor"]
+    requirement_time = profiler.modules["profiled_requirement"]
+    assert package_time.cumulative >= sensor_time.cumulative
+    assert sensor_time.cumulative >= requirement_time.cumulative
+    assert package_time.own <= package_time.cumulative
+    # The requirement is accounted to the integration importing it
+    assert profiler.integrations["profiled"] > 0
+    assert "profiled_requirement" not in profiler.integrations
+    assert profiler.integrations["profiled"] == pytest.approx(
+        sum(times.own for times in (package_time, sensor_time, requirement_time))
+    )
+
+    report = profiler.report(limit=1)
+    assert "profiled" in report
+    assert "custom_components.profiled.sensor" not in report
+
+
+def test_integration_for_module() -> None:
+    """Test mapping modules to integrations."""
+    assert import_profiler.integration_for_module("homeassistant.components.sun") == (
+        "sun"
+    )
+    assert (
+        import_profiler.integration_for_module("homeassistant.components.sun.sensor")
+        == "sun"
+    )
+    assert import_profiler.integration_for_module("custom_components.x.light") == "x"
+    assert import_profiler.integration_for_module("homeassistant.core") is None
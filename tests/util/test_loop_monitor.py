@@ -0,0 +1,80 @@
+"""Test the loop monitor."""
+import functools
+from unittest.mock import ANY, Mock, patch
+
+import pytest
+
+from homeassistant.core import HassJob, callback
+from homeassistant.util import loop_monitor
+
+
+@callback
+def _job_target(value):
+    """Do nothing."""
+
+
+@callback
+def _slow_job_target(value):
+    """Do nothing slowly."""
+
+
+def test_job_name() -> None:
+    """Test naming jobs."""
+    assert (
+        loop_monitor.job_name(HassJob(_job_target, "listen state_changed"))
+        == f"{__name__}._job_target"
+    )
+    assert (
+        loop_monitor.job_name(HassJob(functools.partial(_job_target, 1)))
+        == f"{__name__}._job_target"
+    )
+    # Callable objects without a qualified name use the name of the job
+    target = callback(Mock(spec=[]))
+    assert loop_monitor.job_name(HassJob(target, "named")) == "named"
+
+
+def test_latency_histogram() -> None:
+    """Test the latency histogram."""
+    histogram = loop_monitor.LatencyHistogram()
+    for duration in (0.00005, 0.0001, 0.002, 5.0):
+        histogram.add(duration)
+
+    stats = histogram.as_dict()
+    assert stats["count"] == 4
+    assert stats["max"] == 5.0
+    assert stats["mean"] == pytest.approx(5.00215 / 4)
+    assert stats["buckets"] == [2, 0, 0, 1, 0, 0, 0, 0, 0, 1]
+
+
+def test_loop_monitor_stalls(caplog: pytest.LogCaptureFixture) -> None:
+    """Test runs above the stall threshold are logged."""
+    monitor = loop_monitor.LoopMonitor(stall_threshold=0.5)
+    fast = HassJob(_job_target)
+    slow = HassJob(_slow_job_target)
+
+    with patch("time.perf_counter", side_effect=[0.0, 0.001, 1.0, 2.0]):
+        monitor.run_job(fast, 1)
+        monitor.run_job(slow, 1)
+
+    slow_name = f"{__name__}._slow_job_target"
+    assert f"Event loop was blocked for 1.000 seconds by {slow_name}" in caplog.text
+    assert caplog.text.count("Event loop was blocked") == 1
+
+    stats = monitor.as_dict(limit=1)
+    assert list(stats["jobs"]) == [slow_name]
+    assert stats["stalls"] == [{"job": slow_name, "duration": 1.0, "timestamp": ANY}]
+    assert len(stats["bucket_bounds"]) + 1 == len(stats["jobs"][slow_name]["buckets"])
+
+
+def test_loop_monitor_records_failing_jobs() -> None:
+    """Test runs that raise are recorded."""
+
+    @callback
+    def _fail():
+        raise ValueError
+
+    monitor = loop_monitor.LoopMonitor()
+    with pytest.raises(ValueError):
+        monitor.run_job(HassJob(_fail))
+
+    assert monitor.histograms[loop_monitor.job_name(HassJob(_fail))].count == 1
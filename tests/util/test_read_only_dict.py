@@ -1,9 +1,11 @@
 """Test read only dictionary."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 import json
 
 import pytest
 
-from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.util.read_only_dict import ReadOnlyDict, intern_read_only_dict
 
 
 def test_read_only_dict() -> None:
@@ -34,3 +36,60 @@ def test_read_only_dict() -> None:
     assert isinstance(data, dict)
     assert dict(data) == {"hello": "world"}
     assert json.dumps(data) == json.dumps({"hello": "world"})
+
+
+def test_intern_read_only_dict() -> None:
+    """Test interning read only dictionaries."""
+    data = intern_read_only_dict({"hello": "world", "count": 1})
+
+    assert isinstance(data, ReadOnlyDict)
+    assert data == {"hello": "world", "count": 1}
+    assert intern_read_only_dict({"hello": "world", "count": 1}) is data
+    assert intern_read_only_dict(data) is data
+
+    # Equal values of different types are not shared
+    assert intern_read_only_dict({"hello": "world", "count": True}) is not data
+    assert intern_read_only_dict({"hello": "world", "count": 1.0}) is not data
+
+    # Mutable containers are never shared
+    with_list = {"hello": ["world"]}
+    assert intern_read_only_dict(with_list) is not intern_read_only_dict(with_list)
+    with_dict = {"hello": {"world": 1}}
+    assert intern_read_only_dict(with_dict) is not intern_read_only_dict(with_dict)
+    shared = intern_read_only_dict({"hello": ("world",)})
+    assert intern_read_only_dict({"hello": ("world",)}) is shared
+
+    # Unhashable values are never shared
+    unhashable = {"hello": bytearray(b"world")}
+    assert intern_read_only_dict(unhashable) == unhashable
+
+
+@pytest.mark.parametrize(
+    ("value", "equal_value"),
+    [
+        (
+            datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+            datetime(2023, 1, 1, 13, tzinfo=timezone(timedelta(hours=1))),
+        ),
+        (Decimal("1.0"), Decimal("1.00")),
+        (0.0, -0.0),
+    ],
+)
+def test_intern_read_only_dict_equal_values(value, equal_value) -> None:
+    """Test values that are equal but not the same are never shared."""
+    assert value == equal_value
+    data = intern_read_only_dict({"value": value})
+    other = intern_read_only_dict({"value": equal_value})
+    assert other is not data
+    assert str(other["value"]) == str(equal_value)
+
+
+def test_intern_read_only_dict_content_hash() -> None:
+    """Test only interned read only dicts have a content hash."""
+    data = intern_read_only_dict({"hello": "world", "float": 1.5, "none": None})
+    assert data.content_hash is not None
+    assert intern_read_only_dict(data) is data
+
+    private = intern_read_only_dict({"when": datetime(2023, 1, 1)})
+    assert private.content_hash is None
+    assert ReadOnlyDict({"hello": "world"}).content_hash is None